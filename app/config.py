@@ -1,6 +1,7 @@
 # app/config.py
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 import os
 
 from dotenv import load_dotenv
@@ -12,6 +13,10 @@ if ENV_PATH.exists():
     load_dotenv(ENV_PATH)
 
 
+def _env_bool(name: str, default: str = "0") -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass
 class Settings:
     # DB 설정
@@ -20,13 +25,127 @@ class Settings:
     DB_NAME: str = os.getenv("DB_NAME", "FinancialNews")
     DB_USER: str = os.getenv("DB_USER", "postgres")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
+    # 커넥션 풀 크기와, 이 시간(초) 이상 놀고 있던 커넥션은 꺼낼 때 SELECT 1 로 확인
+    DB_POOL_MIN: int = int(os.getenv("DB_POOL_MIN", "1"))
+    DB_POOL_MAX: int = int(os.getenv("DB_POOL_MAX", "5"))
+    DB_POOL_HEALTHCHECK_SECONDS: float = float(os.getenv("DB_POOL_HEALTHCHECK_SECONDS", "30"))
+    # run_all / daemon 시작 시 미적용 마이그레이션을 자동으로 적용할지 여부.
+    # 끄면(기본) 스키마가 맞지 않을 때 scripts.run_migrations 를 안내하고 종료한다.
+    DB_AUTO_MIGRATE: bool = _env_bool("DB_AUTO_MIGRATE", "0")
 
     # Telegram
     TG_BOT_TOKEN: str = os.getenv("TG_BOT_TOKEN", "")
     TG_CHAT_ID: str = os.getenv("TG_CHAT_ID", "")
+    # Bot API 주소 (로컬 fake 서버로 테스트할 때 변경)
+    TG_API_BASE: str = os.getenv("TG_API_BASE", "https://api.telegram.org")
+    # 동시에 전송할 chat 수, 전체/채팅별 초당 전송 한도 (429 flood 방지)
+    TG_SEND_CONCURRENCY: int = int(os.getenv("TG_SEND_CONCURRENCY", "4"))
+    TG_RATE_PER_SECOND: float = float(os.getenv("TG_RATE_PER_SECOND", "25"))
+    TG_CHAT_RATE_PER_SECOND: float = float(os.getenv("TG_CHAT_RATE_PER_SECOND", "1"))
+    TG_MAX_RETRIES: int = int(os.getenv("TG_MAX_RETRIES", "3"))
+
+    # RSS 수집: 동시에 요청할 티커 수(1이면 순차 처리)와 요청 타임아웃(초)
+    RSS_FETCH_CONCURRENCY: int = int(os.getenv("RSS_FETCH_CONCURRENCY", "8"))
+    RSS_FETCH_TIMEOUT: float = float(os.getenv("RSS_FETCH_TIMEOUT", "10"))
+    # Yahoo RSS 주소 템플릿 ({ticker} 자리에 티커). 로컬 fake 서버로 벤치마크할 때 변경
+    YAHOO_RSS_URL_TEMPLATE: str = os.getenv(
+        "YAHOO_RSS_URL_TEMPLATE",
+        "https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US",
+    )
+    # ETag / Last-Modified 조건부 요청 캐시 사용 여부
+    RSS_HTTP_CACHE: bool = _env_bool("RSS_HTTP_CACHE", "1")
+    # 연결 실패 / 429 / 5xx 재시도 횟수와 첫 대기 시간(초, 매번 두 배 + 지터). timeout 은 재시도하지 않음
+    RSS_FETCH_RETRIES: int = int(os.getenv("RSS_FETCH_RETRIES", "2"))
+    RSS_RETRY_BACKOFF: float = float(os.getenv("RSS_RETRY_BACKOFF", "0.5"))
+
+    # 작업(티커)별 건강 상태와 circuit breaker (source/health.py, scripts/health_report.py):
+    # 연속 실패 / 연속 빈 feed 가 이 횟수가 되면 cooldown(초) 동안 건너뛴다.
+    # cooldown 은 다시 열릴 때마다 두 배, 최대 HEALTH_MAX_COOLDOWN_SECONDS.
+    HEALTH_ENABLED: bool = _env_bool("HEALTH_ENABLED", "1")
+    HEALTH_FAILURE_THRESHOLD: int = int(os.getenv("HEALTH_FAILURE_THRESHOLD", "3"))
+    HEALTH_EMPTY_THRESHOLD: int = int(os.getenv("HEALTH_EMPTY_THRESHOLD", "5"))
+    HEALTH_COOLDOWN_SECONDS: float = float(os.getenv("HEALTH_COOLDOWN_SECONDS", "3600"))
+    HEALTH_MAX_COOLDOWN_SECONDS: float = float(os.getenv("HEALTH_MAX_COOLDOWN_SECONDS", "86400"))
+
+    # Yahoo feed 앞의 item 만 읽는 가벼운 파서를 먼저 쓸지 (처리 못 하는 feed 는 feedparser)
+    RSS_FAST_PARSER: bool = _env_bool("RSS_FAST_PARSER", "1")
+
+    # feed parse 를 process pool 에서 할 때의 프로세스 수 (0: 쓸 수 있는 코어 수)와
+    # pool 을 쓰기 시작할 최소 작업(티커) 수. 코어가 1개이거나 작업이 적으면 이 프로세스에서 parse.
+    PARSE_PROCESSES: int = int(os.getenv("PARSE_PROCESSES", "0"))
+    PARSE_POOL_MIN_JOBS: int = int(os.getenv("PARSE_POOL_MIN_JOBS", "200"))
+
+    # 사용할 뉴스 소스 (쉼표 구분: yahoo, prnewswire). 소스끼리는 동시에 수집한다.
+    ENABLED_SOURCES: str = os.getenv("ENABLED_SOURCES", "yahoo")
+    # PR Newswire: 받을 RSS 주소들(쉼표 구분)과 동시 요청 수
+    PRNEWSWIRE_FEEDS: str = os.getenv(
+        "PRNEWSWIRE_FEEDS", "https://www.prnewswire.com/rss/news-releases-list.rss"
+    )
+    PRNEWSWIRE_FETCH_CONCURRENCY: int = int(os.getenv("PRNEWSWIRE_FETCH_CONCURRENCY", "2"))
+
+    # ingest 스트리밍: 이 건수가 모이거나 첫 기사 후 이 시간(초)이 지나면 DB 에 한 번 커밋
+    INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "200"))
+    INGEST_BATCH_SECONDS: float = float(os.getenv("INGEST_BATCH_SECONDS", "2"))
+
+    # DB 에 보내기 전 중복 기사 필터: 사용 여부, 기억할 키 개수, 처음 채울 때 조회 기간(일)
+    DEDUP_ENABLED: bool = _env_bool("DEDUP_ENABLED", "1")
+    DEDUP_CAPACITY: int = int(os.getenv("DEDUP_CAPACITY", "100000"))
+    DEDUP_WARM_DAYS: int = int(os.getenv("DEDUP_WARM_DAYS", "7"))
+
+    # 유사 기사 묶음(cluster): ingest 때 묶음 번호 부여 여부, 같은 묶음으로 볼 최대 시간 차(시간)와
+    # 제목 단어 Jaccard 유사도 하한, export / 텔레그램 요약에서 묶음당 1건만 남길지 여부
+    CLUSTER_ENABLED: bool = _env_bool("CLUSTER_ENABLED", "1")
+    CLUSTER_WINDOW_HOURS: float = float(os.getenv("CLUSTER_WINDOW_HOURS", "48"))
+    CLUSTER_MIN_SIMILARITY: float = float(os.getenv("CLUSTER_MIN_SIMILARITY", "0.8"))
+    EXPORT_COLLAPSE_CLUSTERS: bool = _env_bool("EXPORT_COLLAPSE_CLUSTERS", "0")
+    SUMMARY_COLLAPSE_CLUSTERS: bool = _env_bool("SUMMARY_COLLAPSE_CLUSTERS", "0")
+    # ticker_latest 요약 테이블(0005)에 티커별로 남길 최신 기사 수.
+    # 텔레그램 요약은 티커당 3건을 보여주고, 나머지는 묶음(cluster) 중복을 건너뛸 여유분이다.
+    # SUMMARY_COLLAPSE_CLUSTERS 로 건너뛴 행이 (이 값 - 3)개를 넘는 티커는 3건보다 적게 보인다.
+    # 바꾸면 `python -m scripts.run_maintenance --rebuild-ticker-latest` 로 다시 채운다.
+    TICKER_LATEST_SIZE: int = int(os.getenv("TICKER_LATEST_SIZE", "10"))
+
+    # daemon 모드: 티커별 폴링 주기 범위(초), 폴링당 목표 신규 기사 수, 지터 비율,
+    # 하루 한 번 export/send 를 실행할 시각(HH:MM, 로컬 시간)
+    POLL_MIN_INTERVAL: float = float(os.getenv("POLL_MIN_INTERVAL", "120"))
+    POLL_MAX_INTERVAL: float = float(os.getenv("POLL_MAX_INTERVAL", "3600"))
+    POLL_TARGET_ARTICLES: float = float(os.getenv("POLL_TARGET_ARTICLES", "1"))
+    POLL_JITTER: float = float(os.getenv("POLL_JITTER", "0.1"))
+    DAEMON_EXPORT_TIME: str = os.getenv("DAEMON_EXPORT_TIME", "08:00")
+
+    # 티커 목록 파일(.xlsx/.csv/.yaml). 비어 있으면 rss_config/rss_list.xlsx
+    _rss_list_path_env: str = os.getenv("RSS_LIST_PATH", "")
+
+    # 엑셀/CSV/Parquet 내보내기 형식과 DB 에서 한 번에 읽어올 행 수
+    EXPORT_FORMAT: str = os.getenv("EXPORT_FORMAT", "xlsx")
+    EXPORT_CHUNK_SIZE: int = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+    # 증분 export: STATE_DIR 의 id high-water mark 이후 행만 조회해서 날짜별 파일을 갱신한다.
+    # 새 행을 파일 끝에 덧붙이는 것은 csv 뿐이다. xlsx / parquet 은 새 행이 없을 때만 건너뛰고,
+    # 새 행이 있으면 그날 파일 전체를 다시 쓴다.
+    # EXPORT_SEND_DELTA=1 이면 텔레그램에는 하루 전체 파일 대신 마지막 전송 이후 새 행만 담은 파일을 보낸다.
+    EXPORT_INCREMENTAL: bool = _env_bool("EXPORT_INCREMENTAL", "1")
+    EXPORT_SEND_DELTA: bool = _env_bool("EXPORT_SEND_DELTA", "0")
+
+    # news_history 월별 파티션 (db/partitions.py): 미리 만들어 둘 달 수,
+    # 보존 기간(개월, 0 이면 지우지 않음), 지우기 전에 gzip CSV 로 남길지
+    PARTITION_MONTHS_AHEAD: int = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+    PARTITION_RETENTION_MONTHS: int = int(os.getenv("PARTITION_RETENTION_MONTHS", "0"))
+    PARTITION_ARCHIVE: bool = _env_bool("PARTITION_ARCHIVE", "1")
+    _archive_dir_env: str = os.getenv("ARCHIVE_DIR", "output/archive")
+
+    # 단계별 metrics (app/metrics.py). run_all 이 끝나면 METRICS_DIR 에 JSON 리포트와
+    # Prometheus textfile 을 쓴다. METRICS_PER_JOB=0 이면 티커(작업)별 label 없이 소스 단위로만 센다.
+    METRICS_ENABLED: bool = _env_bool("METRICS_ENABLED", "1")
+    METRICS_PER_JOB: bool = _env_bool("METRICS_PER_JOB", "1")
+    _metrics_dir_env: str = os.getenv("METRICS_DIR", "output/metrics")
+    # 프로파일링 훅: cProfile(.prof 파일) / tracemalloc(리포트에 상위 할당 위치)
+    PROFILE_CPU: bool = _env_bool("PROFILE_CPU", "0")
+    PROFILE_MEMORY: bool = _env_bool("PROFILE_MEMORY", "0")
 
     # EXPORT_DIR: .env에 절대경로면 그대로, 상대경로면 BASE_DIR 기준
     _export_dir_env: str = os.getenv("EXPORT_DIR", "output")
+    # STATE_DIR: 실행 간에 유지해야 하는 로컬 상태(캐시 등) 저장 위치
+    _state_dir_env: str = os.getenv("STATE_DIR", "state")
 
     @property
     def EXPORT_DIR(self) -> Path:
@@ -35,5 +154,35 @@ class Settings:
             return path
         return (BASE_DIR / path).resolve()
 
+    @property
+    def RSS_LIST_PATH(self) -> Optional[Path]:
+        if not self._rss_list_path_env:
+            return None
+        path = Path(self._rss_list_path_env)
+        if path.is_absolute():
+            return path
+        return (BASE_DIR / path).resolve()
+
+    @property
+    def STATE_DIR(self) -> Path:
+        path = Path(self._state_dir_env)
+        if path.is_absolute():
+            return path
+        return (BASE_DIR / path).resolve()
+
+    @property
+    def ARCHIVE_DIR(self) -> Path:
+        path = Path(self._archive_dir_env)
+        if path.is_absolute():
+            return path
+        return (BASE_DIR / path).resolve()
+
+    @property
+    def METRICS_DIR(self) -> Path:
+        path = Path(self._metrics_dir_env)
+        if path.is_absolute():
+            return path
+        return (BASE_DIR / path).resolve()
+
 
 settings = Settings()
\ No newline at end of file
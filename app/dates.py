@@ -0,0 +1,143 @@
+# app/dates.py
+"""
+RSS 날짜 문자열 -> DB 저장용 datetime 변환.
+
+news_history.published_dt 는 timestamp without time zone 이므로
+모든 값은 "UTC 기준 naive datetime" 으로 통일한다.
+
+1) Yahoo pubDate 형식(RFC-822)은 정규식으로 바로 파싱 (fast path)
+2) ISO-8601 은 datetime.fromisoformat 으로 파싱
+3) 그 외 이상한 문자열만 dateparser 로 넘기고, 절대 날짜의 결과만 LRU 캐시에 보관
+   ("2 hours ago" 처럼 지금 시각에 따라 값이 달라지는 문자열은 매번 파싱)
+"""
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+from app.metrics import metrics
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# 예: "Tue, 18 Nov 2025 14:30:00 +0000", "18 Nov 2025 14:30 GMT"
+_RFC822_RE = re.compile(
+    r"^(?:[A-Za-z]{3},\s*)?"
+    r"(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+"
+    r"(\d{2}):(\d{2})(?::(\d{2}))?\s*"
+    r"([+-]\d{4}|GMT|UTC|UT|Z)$"
+)
+
+# 약어 타임존(EST 등)이나 2자리 연도 같은 RFC-822 변형. email.utils 로 넘긴다.
+_RFC822_LOOSE_RE = re.compile(
+    r"^(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d{1,2}:\d{2}"
+)
+
+
+def _parse_rfc822(s: str) -> Optional[datetime]:
+    m = _RFC822_RE.match(s)
+    if m is None:
+        return None
+    day, mon, year, hh, mm, ss, tz = m.groups()
+    month = _MONTHS.get(mon.lower())
+    if month is None:
+        return None
+    try:
+        dt = datetime(int(year), month, int(day), int(hh), int(mm), int(ss or 0))
+    except ValueError:
+        return None
+    if tz[0] in "+-":
+        offset = int(tz[1:3]) * 60 + int(tz[3:5])
+        if tz[0] == "+":
+            dt -= timedelta(minutes=offset)
+        else:
+            dt += timedelta(minutes=offset)
+    return dt
+
+
+def _parse_email(s: str) -> Optional[datetime]:
+    # parsedate_to_datetime 은 관대해서 "November 18, 2025 2:30 PM" 도
+    # 잘못 읽어버리므로 RFC-822 모양일 때만 사용한다.
+    if _RFC822_LOOSE_RE.match(s) is None:
+        return None
+    try:
+        return parsedate_to_datetime(s)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _parse_iso(s: str) -> Optional[datetime]:
+    if len(s) < 10 or not s[:4].isdigit() or s[4] != "-":
+        return None
+    if s.endswith(("Z", "z")):
+        # python 3.10 의 fromisoformat 은 'Z' 를 받지 못한다.
+        s = s[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return None
+
+
+# 연도가 있고 상대 표현이 없을 때만 절대 날짜로 보고 캐시한다.
+# 연도가 없으면 dateparser 가 올해를 채우므로 그것도 캐시하지 않는다.
+_YEAR_RE = re.compile(r"(?<!\d)\d{4}(?!\d)")
+_RELATIVE_RE = re.compile(
+    r"\b(?:ago|now|today|yesterday|tomorrow|last|next|this|in)\b", re.IGNORECASE
+)
+
+
+def _is_absolute(s: str) -> bool:
+    return _YEAR_RE.search(s) is not None and _RELATIVE_RE.search(s) is None
+
+
+def _dateparser_parse(s: str) -> Optional[datetime]:
+    import dateparser
+
+    return dateparser.parse(s)
+
+
+_parse_absolute_cached = lru_cache(maxsize=4096)(_dateparser_parse)
+
+
+def _parse_fallback(s: str) -> Optional[datetime]:
+    if _is_absolute(s):
+        return _parse_absolute_cached(s)
+    return _dateparser_parse(s)
+
+
+def to_naive_utc(dt: datetime) -> datetime:
+    """tz 정보가 있으면 UTC 로 변환한 뒤 tz 를 제거. naive 는 그대로 둔다."""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def parse_published(raw: str) -> Optional[datetime]:
+    """
+    RSS 날짜 문자열을 UTC 기준 naive datetime 으로 변환.
+    파싱할 수 없으면 None.
+    """
+    s = (raw or "").strip()
+    if not s:
+        return None
+
+    start = time.perf_counter()
+    # fast path 는 이미 UTC 로 보정된 naive 값을 돌려준다.
+    dt = _parse_rfc822(s)
+    if dt is not None:
+        metrics.observe("date_parse_seconds", time.perf_counter() - start, path="rfc822")
+        return dt
+
+    dt = _parse_iso(s) or _parse_email(s) or _parse_fallback(s)
+    metrics.observe(
+        "date_parse_seconds",
+        time.perf_counter() - start,
+        path="slow" if dt is not None else "failed",
+    )
+    if dt is None:
+        return None
+    return to_naive_utc(dt)
@@ -0,0 +1,231 @@
+# app/metrics.py
+"""
+가벼운 프로세스 내 metrics 수집기.
+
+    from app.metrics import metrics
+
+    metrics.inc("rss_http_bytes_total", len(body), source="yahoo", ticker="AAPL")
+    with metrics.timer("db_seconds", op="insert_values"):
+        ...
+
+- counter: 이름 + label 조합별 누적 값
+- timer / observe: 이름 + label 조합별 count / sum / min / max (초 단위)
+run 이 끝나면 write_report() 가 JSON 리포트와 Prometheus text 형식 파일을 남긴다.
+METRICS_ENABLED=0 이면 모든 기록이 아무 일도 하지 않는다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class _Summary:
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+
+def _label_key(labels: Dict[str, Any]) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _prom_labels(key: _LabelKey) -> str:
+    if not key:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in key
+    )
+    return "{" + body + "}"
+
+
+class Metrics:
+    def __init__(self, enabled: bool = True, namespace: str = "fnc"):
+        self.enabled = enabled
+        self.namespace = namespace
+        self._counters: Dict[str, Dict[_LabelKey, float]] = {}
+        self._summaries: Dict[str, Dict[_LabelKey, _Summary]] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._summaries.setdefault(name, {})
+            summary = series.get(key)
+            if summary is None:
+                summary = series[key] = _Summary()
+            summary.add(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+            self.started_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON 으로 바로 쓸 수 있는 형태의 현재 값."""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(k), "value": v} for k, v in series.items()]
+                for name, series in sorted(self._counters.items())
+            }
+            summaries = {
+                name: [
+                    {
+                        "labels": dict(k),
+                        "count": s.count,
+                        "sum": round(s.total, 6),
+                        "min": round(s.min, 6) if s.count else 0.0,
+                        "max": round(s.max, 6),
+                        "avg": round(s.total / s.count, 6) if s.count else 0.0,
+                    }
+                    for k, s in series.items()
+                ]
+                for name, series in sorted(self._summaries.items())
+            }
+        return {"counters": counters, "timers": summaries}
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (counter, summary 의 _count / _sum, 최대값 gauge)."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {full} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full}{_prom_labels(key)} {value:g}")
+            for name, series in sorted(self._summaries.items()):
+                full = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {full} summary")
+                for key, s in sorted(series.items()):
+                    labels = _prom_labels(key)
+                    lines.append(f"{full}_count{labels} {s.count}")
+                    lines.append(f"{full}_sum{labels} {s.total:.6f}")
+                # summary 에는 max 를 넣을 수 없어서 gauge 로 따로 낸다.
+                lines.append(f"# TYPE {full}_max gauge")
+                for key, s in sorted(series.items()):
+                    lines.append(f"{full}_max{_prom_labels(key)} {s.max:.6f}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics(enabled=settings.METRICS_ENABLED)
+
+
+def write_report(name: str = "run_all", extra: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+    """
+    METRICS_DIR 에 JSON 리포트(<name>_YYYYmmdd_HHMMSS.json)와
+    Prometheus textfile(<name>.prom, 매번 덮어씀)을 쓴다. JSON 경로를 반환.
+    """
+    if not metrics.enabled:
+        return None
+
+    out_dir: Path = settings.METRICS_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    finished = time.time()
+    report = {
+        "name": name,
+        "started_at": datetime.fromtimestamp(metrics.started_at).isoformat(timespec="seconds"),
+        "finished_at": datetime.fromtimestamp(finished).isoformat(timespec="seconds"),
+        "duration_seconds": round(finished - metrics.started_at, 3),
+        **(extra or {}),
+        **metrics.snapshot(),
+    }
+
+    stamp = datetime.fromtimestamp(finished).strftime("%Y%m%d_%H%M%S")
+    json_path = out_dir / f"{name}_{stamp}.json"
+    json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    # node_exporter textfile collector 가 반쯤 쓴 파일을 읽지 않도록 교체 방식으로 쓴다.
+    prom_path = out_dir / f"{name}.prom"
+    tmp_path = prom_path.with_name(prom_path.name + ".tmp")
+    tmp_path.write_text(metrics.to_prometheus(), encoding="utf-8")
+    os.replace(tmp_path, prom_path)
+
+    logger.info("metrics report -> %s, %s", json_path, prom_path)
+    return json_path
+
+
+@contextmanager
+def profiling(name: str = "run_all") -> Iterator[Dict[str, Any]]:
+    """
+    PROFILE_CPU / PROFILE_MEMORY 설정에 따라 cProfile / tracemalloc 을 켜고 감싼다.
+    yield 한 dict 에 리포트에 넣을 요약(메모리 최대치, 상위 할당 위치, .prof 경로)이 채워진다.
+    """
+    summary: Dict[str, Any] = {}
+    profiler = None
+    if settings.PROFILE_CPU:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    if settings.PROFILE_MEMORY:
+        import tracemalloc
+
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield summary
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            out_dir: Path = settings.METRICS_DIR
+            out_dir.mkdir(parents=True, exist_ok=True)
+            prof_path = out_dir / f"{name}_{datetime.now():%Y%m%d_%H%M%S}.prof"
+            profiler.dump_stats(str(prof_path))
+            summary["cpu_profile"] = str(prof_path)
+            logger.info("cProfile -> %s (python -m pstats %s)", prof_path, prof_path)
+        if settings.PROFILE_MEMORY:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:20]
+            tracemalloc.stop()
+            summary["memory"] = {
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top_allocations": [
+                    {"where": str(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+                    for stat in top
+                ],
+            }
@@ -1,6 +1,7 @@
 # app/models.py
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 
 @dataclass
@@ -16,3 +17,4 @@ class NewsArticle:
     source_name: str            # source_name
     title: str                  # title
     link: str                   # link
+    cluster_id: Optional[int] = None  # cluster_id (유사 기사 묶음, pipeline/cluster.py)
@@ -0,0 +1,67 @@
+# app/state.py
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def state_path(name: str) -> Path:
+    """STATE_DIR 아래의 상태 파일 경로."""
+    return settings.STATE_DIR / name
+
+
+def load_json(name: str, default: Any) -> Any:
+    """
+    STATE_DIR/name 의 JSON 을 읽어서 반환.
+    파일이 없거나 깨져 있으면 default 를 돌려준다 (캐시는 언제든 버려도 되는 데이터).
+    """
+    path = state_path(name)
+    if not path.exists():
+        return default
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning("state file %s is unreadable, ignoring: %s", path, e)
+        return default
+
+
+def save_json(name: str, data: Any) -> Path:
+    """
+    STATE_DIR/name 에 JSON 을 원자적으로 저장.
+    임시 파일에 쓴 뒤 os.replace 하므로 중간에 죽어도 기존 파일은 깨지지 않는다.
+    """
+    path = state_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_bytes(name: str) -> Optional[bytes]:
+    """STATE_DIR/name 의 바이너리 내용. 파일이 없거나 읽을 수 없으면 None."""
+    path = state_path(name)
+    if not path.exists():
+        return None
+    try:
+        return path.read_bytes()
+    except OSError as e:
+        logger.warning("state file %s is unreadable, ignoring: %s", path, e)
+        return None
+
+
+def save_bytes(name: str, data: bytes) -> Path:
+    """STATE_DIR/name 에 바이너리를 원자적으로 저장 (save_json 과 같은 방식)."""
+    path = state_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return path
@@ -1,16 +1,24 @@
 # db/connection.py
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
 
 from app.config import settings
 
+# psycopg2 는 실제로 DB 에 붙을 때 불러온다 (엔트리 포인트 기동 시간 단축).
+if TYPE_CHECKING:
+    from psycopg2 import extensions
 
-def get_connection():
-    """
-    PostgreSQL 커넥션을 하나 생성해서 반환.
-    사용 후에는 conn.close() 되도록 with 문으로 감싸서 쓰는 걸 권장.
-    """
-    conn = psycopg2.connect(
+logger = logging.getLogger(__name__)
+
+
+def _connect_kwargs() -> Dict:
+    from psycopg2.extras import RealDictCursor
+
+    return dict(
         host=settings.DB_HOST,
         port=settings.DB_PORT,
         dbname=settings.DB_NAME,
@@ -18,4 +26,148 @@ def get_connection():
         password=settings.DB_PASSWORD,
         cursor_factory=RealDictCursor,
     )
+
+
+def get_connection():
+    """
+    PostgreSQL 커넥션을 하나 생성해서 반환.
+    사용 후에는 conn.close() 되도록 with 문으로 감싸서 쓰는 걸 권장.
+    풀과 무관한 단발성 연결이 필요할 때만 사용하고,
+    repository 함수들은 connection() 을 사용한다.
+    """
+    import psycopg2
+
+    conn = psycopg2.connect(**_connect_kwargs())
     return conn
+
+
+class _Pool:
+    """
+    ThreadedConnectionPool 래퍼.
+    - 풀이 비면 PoolError 대신 세마포어로 대기
+    - 오래 놀던 커넥션은 꺼낼 때 SELECT 1 로 살아있는지 확인
+    """
+
+    def __init__(self, minconn: int, maxconn: int, healthcheck_seconds: float):
+        from psycopg2.pool import ThreadedConnectionPool
+
+        self._pool = ThreadedConnectionPool(minconn, maxconn, **_connect_kwargs())
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._healthcheck_seconds = healthcheck_seconds
+        self._last_used: Dict[int, float] = {}
+
+    def _is_healthy(self, conn) -> bool:
+        import psycopg2
+        from psycopg2 import extensions
+
+        if conn.closed:
+            return False
+        if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            return False
+        last_used = self._last_used.get(id(conn))
+        if last_used is None or time.monotonic() - last_used < self._healthcheck_seconds:
+            # 방금 만든 커넥션이거나 최근에 쓴 커넥션
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def acquire(self):
+        import psycopg2
+
+        self._slots.acquire()
+        try:
+            # 죽은 커넥션은 버리고 최대 maxconn 번까지 새로 꺼내본다.
+            for _ in range(self._pool.maxconn + 1):
+                conn = self._pool.getconn()
+                if self._is_healthy(conn):
+                    return conn
+                logger.warning("db pool: discarding broken connection")
+                self._last_used.pop(id(conn), None)
+                self._pool.putconn(conn, close=True)
+            raise psycopg2.OperationalError("db pool: no healthy connection available")
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn) -> None:
+        try:
+            broken = bool(conn.closed)
+            if broken:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            self._pool.putconn(conn, close=broken)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        self._pool.closeall()
+
+
+_pool: Optional[_Pool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> _Pool:
+    """프로세스 전체에서 공유하는 커넥션 풀 (처음 호출할 때 생성)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _Pool(
+                    minconn=settings.DB_POOL_MIN,
+                    maxconn=max(settings.DB_POOL_MIN, settings.DB_POOL_MAX),
+                    healthcheck_seconds=settings.DB_POOL_HEALTHCHECK_SECONDS,
+                )
+                logger.info(
+                    "db pool created (min=%d, max=%d)",
+                    settings.DB_POOL_MIN,
+                    settings.DB_POOL_MAX,
+                )
+    return _pool
+
+
+def close_pool() -> None:
+    """풀의 모든 커넥션을 닫는다. (프로세스 종료 시 자동 호출)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+atexit.register(close_pool)
+
+
+@contextmanager
+def connection() -> Iterator["extensions.connection"]:
+    """
+    풀에서 커넥션을 빌려 쓰고 돌려주는 context manager.
+    블록이 정상 종료되면 commit, 예외가 나면 rollback 후 예외를 다시 던진다.
+
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(...)
+    """
+    import psycopg2
+
+    pool = get_pool()
+    conn = pool.acquire()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        if not conn.closed:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                # 끊어진 커넥션이면 release/acquire 에서 걸러진다.
+                pass
+        raise
+    finally:
+        pool.release(conn)
@@ -0,0 +1,256 @@
+# db/migrate.py
+"""
+버전 번호가 붙은 SQL 마이그레이션 실행기.
+
+db/migrations/NNNN_설명.sql 파일을 번호 순서대로 적용하고,
+적용한 버전은 public.schema_migrations 테이블에 기록한다.
+파일 하나가 트랜잭션 하나이므로 중간에 실패하면 그 파일만 롤백된다.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import List, Optional, Set
+
+from app.config import settings
+from db.connection import connection
+from db.partitions import list_partitions, month_start, partition_name
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+_FILE_RE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+# 여러 프로세스가 동시에 마이그레이션을 돌리지 않도록 잡는 advisory lock 키
+_LOCK_KEY = 7_300_0001
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS public.schema_migrations (
+        version    INTEGER PRIMARY KEY,
+        name       TEXT NOT NULL,
+        applied_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()
+    );
+"""
+
+# verify_schema 가 확인하는 인덱스 -> 만드는 마이그레이션 버전 (마이그레이션과 일치해야 함)
+REQUIRED_INDEXES = {
+    "news_history_published_dt_idx": 2,
+    "news_history_ticker_published_dt_idx": 2,
+}
+
+# verify_schema 가 확인하는 news_history 컬럼 (0001 이후 마이그레이션으로 추가된 것) -> 버전
+REQUIRED_COLUMNS = {"cluster_id": 3}
+
+# news_history 를 월별 파티션으로 바꾸고 news_keys 를 만드는 버전
+PARTITION_VERSION = 4
+# ticker_latest 를 만드는 버전
+TICKER_LATEST_VERSION = 5
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+
+def discover_migrations() -> List[Migration]:
+    migrations: List[Migration] = []
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        m = _FILE_RE.match(path.name)
+        if m is None:
+            logger.warning("migrate: ignoring unexpected file %s", path.name)
+            continue
+        migrations.append(Migration(int(m.group(1)), m.group(2), path))
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"중복된 마이그레이션 번호가 있습니다: {versions}")
+    return migrations
+
+
+def _applied_versions(cur) -> Set[int]:
+    cur.execute("SELECT version FROM public.schema_migrations;")
+    return {row["version"] for row in cur.fetchall()}
+
+
+def _table_exists(cur, name: str) -> bool:
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL AS found;", (name,))
+    return cur.fetchone()["found"]
+
+
+def pending_migrations(target: Optional[int] = None) -> List[Migration]:
+    """아직 적용되지 않은 마이그레이션 (target 을 주면 그 버전까지만). DB 에는 아무것도 쓰지 않는다."""
+    with connection() as conn:
+        with conn.cursor() as cur:
+            if _table_exists(cur, "public.schema_migrations"):
+                applied = _applied_versions(cur)
+            else:
+                applied = set()
+    return [
+        m
+        for m in discover_migrations()
+        if m.version not in applied and (target is None or m.version <= target)
+    ]
+
+
+def apply_migrations(target: Optional[int] = None) -> List[Migration]:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 적용.
+    target 을 주면 그 버전까지만 적용한다. 적용한 목록을 반환.
+    """
+    applied_now: List[Migration] = []
+
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_CREATE_TABLE_SQL)
+            conn.commit()
+
+            cur.execute("SELECT pg_advisory_lock(%s);", (_LOCK_KEY,))
+            try:
+                applied = _applied_versions(cur)
+                for m in discover_migrations():
+                    if m.version in applied:
+                        continue
+                    if target is not None and m.version > target:
+                        break
+
+                    logger.info("migrate: applying %04d_%s", m.version, m.name)
+                    try:
+                        cur.execute(m.sql)
+                        cur.execute(
+                            "INSERT INTO public.schema_migrations (version, name) "
+                            "VALUES (%s, %s);",
+                            (m.version, m.name),
+                        )
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        logger.exception("migrate: %04d_%s failed", m.version, m.name)
+                        raise
+                    applied_now.append(m)
+            finally:
+                cur.execute("SELECT pg_advisory_unlock(%s);", (_LOCK_KEY,))
+
+    logger.info("migrate: %d migration(s) applied", len(applied_now))
+    return applied_now
+
+
+def verify_schema(target: Optional[int] = None, check_partitions: bool = True) -> List[str]:
+    """
+    현재 DB 스키마가 마이그레이션 기대값과 맞는지 확인.
+    문제 목록을 반환하고, 비어 있으면 정상.
+    target 을 주면 그 버전까지 적용된 스키마를 기대값으로 삼는다 (run_migrations --target).
+    check_partitions 가 False 면 이번 달 파티션이 있는지는 보지 않는다.
+    """
+    problems: List[str] = []
+
+    def expected(version: int) -> bool:
+        return target is None or version <= target
+
+    for m in pending_migrations(target):
+        problems.append(f"pending migration: {m.version:04d}_{m.name}")
+
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT indexname, indexdef
+                FROM pg_indexes
+                WHERE schemaname = 'public' AND tablename = 'news_history';
+                """
+            )
+            indexes = {row["indexname"]: row["indexdef"] for row in cur.fetchall()}
+            cur.execute(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = 'news_history';
+                """
+            )
+            columns = {row["column_name"] for row in cur.fetchall()}
+            cur.execute(
+                """
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM pg_partitioned_table pt
+                    JOIN pg_class c ON c.oid = pt.partrelid
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public' AND c.relname = 'news_history'
+                ) AS partitioned;
+                """
+            )
+            partitioned = cur.fetchone()["partitioned"]
+            # insert_articles 의 (link, ticker) 중복 무시가 이 PK 에 의존한다.
+            cur.execute(
+                """
+                SELECT indexdef
+                FROM pg_indexes
+                WHERE schemaname = 'public' AND tablename = 'news_keys';
+                """
+            )
+            has_keys_pk = any(
+                "UNIQUE" in row["indexdef"] and re.search(r"\(link, ticker\)", row["indexdef"])
+                for row in cur.fetchall()
+            )
+            has_ticker_latest = _table_exists(cur, "public.ticker_latest")
+
+    for name, version in sorted(REQUIRED_COLUMNS.items()):
+        if expected(version) and name not in columns:
+            problems.append(f"missing column: news_history.{name}")
+
+    for name, version in sorted(REQUIRED_INDEXES.items()):
+        if expected(version) and name not in indexes:
+            problems.append(f"missing index: {name}")
+
+    if expected(PARTITION_VERSION):
+        if not partitioned:
+            problems.append(f"news_history is not partitioned ({PARTITION_VERSION:04d})")
+        if not has_keys_pk:
+            problems.append("missing PRIMARY KEY on news_keys (link, ticker)")
+    if expected(TICKER_LATEST_VERSION) and not has_ticker_latest:
+        problems.append(f"missing table: ticker_latest ({TICKER_LATEST_VERSION:04d})")
+
+    if partitioned and check_partitions:
+        current = partition_name(month_start(date.today()))
+        if current not in {p.name for p in list_partitions() if p.attached}:
+            problems.append(
+                f"missing partition {current} (python -m scripts.run_maintenance)"
+            )
+
+    return problems
+
+
+def ensure_schema() -> bool:
+    """
+    run_all / daemon 시작 시 호출. 스키마가 코드가 기대하는 것과 맞으면 True.
+    맞지 않으면 DB_AUTO_MIGRATE 가 켜져 있을 때만 미적용 마이그레이션을 적용하고 다시 확인한다.
+    그래도 맞지 않으면 문제와 해결 방법을 로그로 남기고 False.
+    DB 에 접속할 수 없는 등 확인 자체가 실패해도 한 번 로그를 남기고 False.
+    """
+    try:
+        # 이번 달 파티션은 ingest / daemon 이 스스로 만든다.
+        problems = verify_schema(check_partitions=False)
+        if problems and settings.DB_AUTO_MIGRATE:
+            logger.info("migrate: DB_AUTO_MIGRATE is on, applying pending migrations")
+            apply_migrations()
+            problems = verify_schema(check_partitions=False)
+    except Exception as e:
+        logger.error("schema check failed: %s", str(e).strip())
+        return False
+    if not problems:
+        return True
+
+    for p in problems:
+        logger.error("schema check: %s", p)
+    logger.error(
+        "DB 스키마가 최신이 아닙니다. `python -m scripts.run_migrations` 를 먼저 실행하세요 "
+        "(또는 DB_AUTO_MIGRATE=1 로 시작할 때 적용)."
+    )
+    return False
@@ -0,0 +1,37 @@
+-- 0001: news_history 기본 테이블과 (link, ticker) UNIQUE 인덱스
+-- insert_articles 의 ON CONFLICT (link, ticker) DO NOTHING 이 이 인덱스에 의존한다.
+-- 이미 운영 중인 DB 에 테이블/인덱스가 있으면 그대로 사용한다.
+
+CREATE TABLE IF NOT EXISTS public.news_history (
+    id           BIGSERIAL PRIMARY KEY,
+    published    TEXT,
+    published_dt TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    category     TEXT,
+    ticker       TEXT NOT NULL,
+    source_name  TEXT,
+    title        TEXT,
+    link         TEXT NOT NULL
+);
+
+-- 이름이 달라도 (link, ticker) UNIQUE 인덱스가 이미 있으면 새로 만들지 않는다.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        JOIN pg_class t ON t.oid = i.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = 'public'
+          AND t.relname = 'news_history'
+          AND i.indisunique
+          AND (
+              SELECT array_agg(a.attname::text ORDER BY k.ord)
+              FROM unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+              JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+          ) = ARRAY['link', 'ticker']
+    ) THEN
+        CREATE UNIQUE INDEX news_history_link_ticker_uidx
+            ON public.news_history (link, ticker);
+    END IF;
+END
+$$;
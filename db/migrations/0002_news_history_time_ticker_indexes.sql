@@ -0,0 +1,9 @@
+-- 0002: 날짜 범위 조회와 티커별 최신 기사 조회용 인덱스
+-- fetch_articles_for_date : published_dt >= 시작 AND published_dt < 끝
+-- fetch_latest_articles_for_ticker : WHERE ticker = ? ORDER BY published_dt DESC, id DESC
+
+CREATE INDEX IF NOT EXISTS news_history_published_dt_idx
+    ON public.news_history (published_dt);
+
+CREATE INDEX IF NOT EXISTS news_history_ticker_published_dt_idx
+    ON public.news_history (ticker, published_dt DESC, id DESC);
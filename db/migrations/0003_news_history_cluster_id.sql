@@ -0,0 +1,7 @@
+-- 0003: 유사 기사 묶음(cluster) 번호
+-- 같은 통신사 기사가 여러 티커 / 제휴 매체에 제목이나 URL 쿼리만 조금 바뀌어 올라오는 것을
+-- ingest 단계에서 pipeline/cluster.py 가 같은 cluster_id 로 묶는다.
+-- 기존 행은 NULL (묶음 정보 없음) 로 남는다.
+
+ALTER TABLE public.news_history
+    ADD COLUMN IF NOT EXISTS cluster_id BIGINT;
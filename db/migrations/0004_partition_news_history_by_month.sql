@@ -0,0 +1,109 @@
+-- 0004: news_history 를 published_dt 기준 월별 RANGE 파티션 테이블로 전환
+--
+-- 파티션 테이블의 UNIQUE 인덱스는 파티션 키(published_dt)를 포함해야 해서
+-- (link, ticker) 유일성을 news_history 에 직접 걸 수 없다.
+-- 대신 public.news_keys (link, ticker) PRIMARY KEY 를 두고, insert_articles 가
+-- 같은 문장 안에서 news_keys 에 먼저 넣어 새로 들어간 키만 news_history 에 넣는다
+-- (기존 ON CONFLICT (link, ticker) DO NOTHING 과 같은 동작).
+-- news_keys 는 보존 기간이 지나 파티션을 지워도 남겨서, 오래된 기사가 feed 에
+-- 다시 나와도 다시 저장되지 않게 한다.
+--
+-- 파티션 이름: news_history_pYYYY_MM, 범위 밖의 행은 news_history_default 로 간다.
+-- 첫 파티션은 가장 오래된 0.1% 를 뺀 행의 달부터 (최대 10년 전까지) 만든다.
+-- 잘못된 날짜(1970년 등) 한두 건 때문에 빈 파티션이 수백 개 생기지 않도록
+-- 그보다 오래된 행은 default 파티션에 둔다 (보존 기간 정리 때 같이 지워진다).
+-- 앞으로 올 달의 파티션은 db/partitions.py 의 ensure_partitions() 가 만든다.
+-- 기존 행은 한 트랜잭션 안에서 새 테이블로 옮긴다.
+-- 옮기는 동안 crawler 가 넣은 행이 옛 테이블과 함께 지워지지 않도록 먼저 news_history 를
+-- 잠근다 (이 트랜잭션이 끝날 때까지 INSERT / 조회 모두 기다린다).
+
+LOCK TABLE public.news_history IN ACCESS EXCLUSIVE MODE;
+
+CREATE TABLE public.news_history_partitioned (
+    id           BIGINT NOT NULL,
+    published    TEXT,
+    published_dt TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    category     TEXT,
+    ticker       TEXT NOT NULL,
+    source_name  TEXT,
+    title        TEXT,
+    link         TEXT NOT NULL,
+    cluster_id   BIGINT
+) PARTITION BY RANGE (published_dt);
+
+-- 기존 데이터의 첫 달부터 이번 달 + 3개월까지 월별 파티션
+DO $$
+DECLARE
+    first_month date;
+    last_month  date := date_trunc('month', now())::date + interval '3 months';
+    m           date;
+BEGIN
+    SELECT COALESCE(
+               date_trunc(
+                   'month', percentile_disc(0.001) WITHIN GROUP (ORDER BY published_dt)
+               )::date,
+               date_trunc('month', now())::date
+           )
+    INTO first_month
+    FROM public.news_history;
+    first_month := GREATEST(first_month, (date_trunc('month', now()) - interval '10 years')::date);
+
+    m := first_month;
+    WHILE m <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE public.%I PARTITION OF public.news_history_partitioned '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'news_history_p' || to_char(m, 'YYYY_MM'),
+            m::timestamp,
+            (m + interval '1 month')::timestamp
+        );
+        m := m + interval '1 month';
+    END LOOP;
+END
+$$;
+
+CREATE TABLE public.news_history_default
+    PARTITION OF public.news_history_partitioned DEFAULT;
+
+CREATE TABLE public.news_keys (
+    link   TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    PRIMARY KEY (link, ticker)
+);
+
+INSERT INTO public.news_history_partitioned
+    (id, published, published_dt, category, ticker, source_name, title, link, cluster_id)
+SELECT id, published, published_dt, category, ticker, source_name, title, link, cluster_id
+FROM public.news_history;
+
+INSERT INTO public.news_keys (link, ticker)
+SELECT link, ticker
+FROM public.news_history
+ON CONFLICT DO NOTHING;
+
+-- id 시퀀스는 그대로 이어서 쓴다 (이름은 0001 의 BIGSERIAL 이 만든 것을 찾아서 쓴다).
+DO $$
+DECLARE
+    seq text := pg_get_serial_sequence('public.news_history', 'id');
+BEGIN
+    IF seq IS NULL THEN
+        RAISE EXCEPTION 'news_history.id 에 연결된 시퀀스가 없습니다';
+    END IF;
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY NONE', seq);
+    DROP TABLE public.news_history;
+    ALTER TABLE public.news_history_partitioned RENAME TO news_history;
+    EXECUTE format(
+        'ALTER TABLE public.news_history ALTER COLUMN id SET DEFAULT nextval(%L::regclass)', seq
+    );
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY public.news_history.id', seq);
+END
+$$;
+
+ALTER TABLE public.news_history
+    ADD CONSTRAINT news_history_pkey PRIMARY KEY (id, published_dt);
+
+-- 0002 와 같은 이름의 인덱스 (각 파티션에 자동으로 만들어진다)
+CREATE INDEX news_history_published_dt_idx
+    ON public.news_history (published_dt);
+CREATE INDEX news_history_ticker_published_dt_idx
+    ON public.news_history (ticker, published_dt DESC, id DESC);
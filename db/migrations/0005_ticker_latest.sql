@@ -0,0 +1,36 @@
+-- 0005: 티커별 최신 기사 N개만 들고 있는 요약 테이블
+--
+-- 텔레그램 요약은 티커마다 최근 기사 몇 개만 필요하다. news_history 가 커져도
+-- 요약 단계가 인덱스 조회 한 번으로 끝나도록 insert_articles 가 새 행을 여기에도 넣고
+-- 티커별로 최신 TICKER_LATEST_SIZE 개만 남긴다 (db/repository.py).
+-- 아래 채우기는 TICKER_LATEST_SIZE 기본값(10)을 쓴다. 값을 바꾸면
+-- `python -m scripts.run_maintenance --rebuild-ticker-latest` 로 다시 채운다.
+-- 보존 기간이 지나 파티션이 지워져도 이 테이블의 행은 남는다 (news_keys 와 같음).
+
+CREATE TABLE public.ticker_latest (
+    id           BIGINT NOT NULL,
+    published    TEXT,
+    published_dt TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    category     TEXT,
+    ticker       TEXT NOT NULL,
+    source_name  TEXT,
+    title        TEXT,
+    link         TEXT NOT NULL,
+    cluster_id   BIGINT,
+    PRIMARY KEY (ticker, id)
+);
+
+CREATE INDEX ticker_latest_ticker_published_dt_idx
+    ON public.ticker_latest (ticker, published_dt DESC, id DESC);
+
+INSERT INTO public.ticker_latest
+    (id, published, published_dt, category, ticker, source_name, title, link, cluster_id)
+SELECT id, published, published_dt, category, ticker, source_name, title, link, cluster_id
+FROM (
+    SELECT h.*,
+           row_number() OVER (
+               PARTITION BY ticker ORDER BY published_dt DESC, id DESC
+           ) AS rn
+    FROM public.news_history h
+) ranked
+WHERE rn <= 10;
@@ -0,0 +1,324 @@
+# db/partitions.py
+"""
+news_history 월별 파티션 관리 (0004 마이그레이션 이후).
+
+- ensure_partitions : 이번 달부터 PARTITION_MONTHS_AHEAD 개월 뒤까지 파티션을 만든다.
+  그 범위의 행이 이미 default 파티션에 들어가 있으면 새 파티션으로 옮긴 뒤 붙인다.
+- apply_retention   : 보존 기간(PARTITION_RETENTION_MONTHS)이 지난 파티션을
+  DETACH -> (PARTITION_ARCHIVE 이면) ARCHIVE_DIR 에 gzip CSV 로 저장 -> DROP 한다.
+  DETACH 와 DROP 사이에 실패해서 떨어져 나온 채로 남은 파티션은 다음 실행에서 마저 처리한다.
+  월별 파티션이 없던 기간에 default 파티션으로 들어간 행도 같은 기준으로
+  (PARTITION_ARCHIVE 이면 gzip CSV 로 저장한 뒤) 지운다.
+
+news_keys 는 건드리지 않으므로 지운 기간의 기사가 feed 에 다시 나와도 다시 저장되지 않는다.
+"""
+import gzip
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.config import settings
+from db.connection import connection
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "news_history"
+DEFAULT_PARTITION = "news_history_default"
+
+_NAME_RE = re.compile(r"^news_history_p(\d{4})_(\d{2})$")
+_BOUND_RE = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+@dataclass
+class PartitionInfo:
+    name: str
+    start: datetime
+    end: datetime
+    # False 면 DETACH 만 되고 아직 DROP 되지 않은 테이블
+    attached: bool = True
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, months: int) -> date:
+    """d 가 속한 달의 1일에서 months 개월 뒤(음수면 앞) 달의 1일."""
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def list_partitions() -> List[PartitionInfo]:
+    """붙어 있는 월별 파티션 + 떨어져 나온 채로 남은 월별 파티션 (시작 시각 순)."""
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT c.relname AS name,
+                       pg_get_expr(c.relpartbound, c.oid) AS bound
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                JOIN pg_class p ON p.oid = i.inhparent
+                JOIN pg_namespace n ON n.oid = p.relnamespace
+                WHERE n.nspname = 'public' AND p.relname = %s;
+                """,
+                (PARENT_TABLE,),
+            )
+            attached_rows = cur.fetchall()
+            cur.execute(
+                """
+                SELECT c.relname AS name
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public'
+                  AND c.relkind = 'r'
+                  AND NOT c.relispartition
+                  AND c.relname LIKE %s;
+                """,
+                (PARENT_TABLE.replace("_", "\\_") + "\\_p%",),
+            )
+            detached_rows = cur.fetchall()
+
+    partitions: List[PartitionInfo] = []
+    for row in attached_rows:
+        m = _BOUND_RE.search(row["bound"] or "")
+        if m is None:
+            # DEFAULT 파티션
+            continue
+        partitions.append(
+            PartitionInfo(
+                name=row["name"],
+                start=datetime.fromisoformat(m.group(1)),
+                end=datetime.fromisoformat(m.group(2)),
+            )
+        )
+    for row in detached_rows:
+        m = _NAME_RE.match(row["name"])
+        if m is None:
+            continue
+        start = date(int(m.group(1)), int(m.group(2)), 1)
+        partitions.append(
+            PartitionInfo(
+                name=row["name"],
+                start=datetime.combine(start, datetime.min.time()),
+                end=datetime.combine(add_months(start, 1), datetime.min.time()),
+                attached=False,
+            )
+        )
+    partitions.sort(key=lambda p: p.start)
+    return partitions
+
+
+def _create_partition(cur, month: date) -> None:
+    """
+    month 파티션을 만들어 붙인다. default 파티션에 그 달 행이 있으면
+    ATTACH 가 실패하므로 먼저 새 테이블로 옮긴다 (호출한 쪽 트랜잭션 안에서).
+    """
+    name = partition_name(month)
+    start = datetime.combine(month, datetime.min.time())
+    end = datetime.combine(add_months(month, 1), datetime.min.time())
+
+    # 옮긴 뒤 ATTACH 하기 전에 그 달의 행이 default 파티션에 새로 들어오면 ATTACH 가 실패하므로
+    # 0004 마이그레이션처럼 news_history 를 잠근다 (트랜잭션이 끝날 때까지 INSERT / 조회가 기다린다).
+    cur.execute(f"LOCK TABLE public.{PARENT_TABLE} IN ACCESS EXCLUSIVE MODE;")
+    cur.execute(
+        f"CREATE TABLE public.{name} "
+        f"(LIKE public.{PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS);"
+    )
+    cur.execute(
+        f"""
+        WITH moved AS (
+            DELETE FROM public.{DEFAULT_PARTITION}
+            WHERE published_dt >= %s AND published_dt < %s
+            RETURNING *
+        )
+        INSERT INTO public.{name} SELECT * FROM moved;
+        """,
+        (start, end),
+    )
+    if cur.rowcount:
+        logger.info("partitions: moved %d row(s) from default into %s", cur.rowcount, name)
+    cur.execute(
+        f"ALTER TABLE public.{PARENT_TABLE} ATTACH PARTITION public.{name} "
+        "FOR VALUES FROM (%s) TO (%s);",
+        (start, end),
+    )
+
+
+def ensure_partitions(
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None,
+) -> List[str]:
+    """이번 달 ~ months_ahead 개월 뒤 파티션 중 없는 것을 만든다. 만든 이름 목록을 반환."""
+    if months_ahead is None:
+        months_ahead = settings.PARTITION_MONTHS_AHEAD
+    current = month_start(today or date.today())
+
+    existing = {p.name for p in list_partitions()}
+    created: List[str] = []
+    for offset in range(max(0, months_ahead) + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        # 파티션 하나가 트랜잭션 하나
+        with connection() as conn:
+            with conn.cursor() as cur:
+                _create_partition(cur, month)
+        created.append(name)
+        logger.info("partitions: created %s", name)
+    return created
+
+
+def archive_partition(name: str, archive_dir: Optional[Path] = None) -> Path:
+    """파티션(또는 떨어져 나온 테이블) 전체를 gzip CSV(헤더 포함)로 저장하고 경로를 반환."""
+    archive_dir = archive_dir or settings.ARCHIVE_DIR
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    with connection() as conn:
+        with conn.cursor() as cur:
+            with gzip.open(tmp_path, "wb") as f:
+                cur.copy_expert(
+                    f"COPY (SELECT * FROM public.{name} ORDER BY published_dt, id) "
+                    "TO STDOUT WITH (FORMAT csv, HEADER)",
+                    f,
+                )
+    tmp_path.replace(path)
+    return path
+
+
+def purge_default_partition(
+    cutoff: datetime,
+    archive: bool,
+    dry_run: bool = False,
+    archive_dir: Optional[Path] = None,
+) -> int:
+    """
+    default 파티션에서 published_dt < cutoff 인 행을 지운다 (archive 면 지운 행을
+    ARCHIVE_DIR/news_history_default_<시각>.csv.gz 로 저장). 지운(dry_run 이면 지울) 행 수를 반환.
+    """
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT to_regclass(%s) IS NOT NULL AS found;", (f"public.{DEFAULT_PARTITION}",)
+            )
+            if not cur.fetchone()["found"]:
+                return 0
+            cur.execute(
+                f"SELECT count(*) AS n FROM public.{DEFAULT_PARTITION} WHERE published_dt < %s;",
+                (cutoff,),
+            )
+            count = cur.fetchone()["n"]
+            if count and dry_run:
+                logger.info(
+                    "partitions: would delete %d row(s) from %s (< %s)",
+                    count,
+                    DEFAULT_PARTITION,
+                    cutoff.date(),
+                )
+            if not count or dry_run:
+                return count
+
+            path = None
+            if archive:
+                # 저장한 뒤 지울 때까지 default 파티션에 새 행이 들어오지 않게 쓰기만 막는다
+                # (조회는 그대로 된다). 파일 쓰기가 실패하면 아무것도 지우지 않는다.
+                cur.execute(f"LOCK TABLE public.{DEFAULT_PARTITION} IN EXCLUSIVE MODE;")
+                archive_dir = archive_dir or settings.ARCHIVE_DIR
+                archive_dir.mkdir(parents=True, exist_ok=True)
+                path = archive_dir / f"{DEFAULT_PARTITION}_{datetime.now():%Y%m%d_%H%M%S}.csv.gz"
+                tmp_path = path.with_name(f".{path.name}.tmp")
+                select_sql = cur.mogrify(
+                    f"SELECT * FROM public.{DEFAULT_PARTITION} WHERE published_dt < %s "
+                    "ORDER BY published_dt, id",
+                    (cutoff,),
+                ).decode()
+                try:
+                    with gzip.open(tmp_path, "wb") as f:
+                        cur.copy_expert(
+                            f"COPY ({select_sql}) TO STDOUT WITH (FORMAT csv, HEADER)", f
+                        )
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+            cur.execute(
+                f"DELETE FROM public.{DEFAULT_PARTITION} WHERE published_dt < %s;", (cutoff,)
+            )
+            count = cur.rowcount
+    if path is not None:
+        tmp_path.replace(path)
+        logger.info("partitions: archived %d row(s) from %s -> %s", count, DEFAULT_PARTITION, path)
+    logger.info(
+        "partitions: deleted %d row(s) from %s (< %s)", count, DEFAULT_PARTITION, cutoff.date()
+    )
+    return count
+
+
+def apply_retention(
+    retention_months: Optional[int] = None,
+    archive: Optional[bool] = None,
+    today: Optional[date] = None,
+    dry_run: bool = False,
+) -> List[str]:
+    """
+    끝 시각이 (이번 달 - retention_months) 1일 이전인 월별 파티션을 정리하고,
+    default 파티션에서도 그 이전 행을 지운다 (purge_default_partition).
+    retention_months <= 0 이면 아무것도 하지 않는다.
+    정리한(dry_run 이면 정리할) 월별 파티션 이름 목록을 반환.
+    """
+    if retention_months is None:
+        retention_months = settings.PARTITION_RETENTION_MONTHS
+    if archive is None:
+        archive = settings.PARTITION_ARCHIVE
+    if retention_months <= 0:
+        logger.info("partitions: retention disabled")
+        return []
+
+    cutoff = datetime.combine(
+        add_months(month_start(today or date.today()), -retention_months),
+        datetime.min.time(),
+    )
+    expired = [p for p in list_partitions() if p.end <= cutoff]
+    if dry_run:
+        for p in expired:
+            logger.info("partitions: would drop %s (< %s)", p.name, cutoff.date())
+        purge_default_partition(cutoff, archive, dry_run=True)
+        return [p.name for p in expired]
+
+    dropped: List[str] = []
+    for p in expired:
+        if p.attached:
+            # DETACH 를 먼저 커밋해서 archive 하는 동안 조회/INSERT 가 이 파티션을 보지 않게 한다.
+            with connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"ALTER TABLE public.{PARENT_TABLE} DETACH PARTITION public.{p.name};"
+                    )
+            logger.info("partitions: detached %s", p.name)
+
+        if archive:
+            path = archive_partition(p.name)
+            logger.info("partitions: archived %s -> %s", p.name, path)
+
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE public.{p.name};")
+        logger.info("partitions: dropped %s", p.name)
+        dropped.append(p.name)
+
+    purge_default_partition(cutoff, archive)
+    return dropped
+
+
+def run_maintenance() -> Tuple[List[str], List[str]]:
+    """ensure_partitions + apply_retention (설정값 그대로). (만든 이름, 지운 이름) 을 반환."""
+    return ensure_partitions(), apply_retention()
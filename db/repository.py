@@ -1,105 +1,457 @@
 # db/repository.py
-from datetime import date
-from typing import Iterable, List, Dict, Any
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Sequence, Tuple
+import csv
+import io
 import logging
 
+from app.config import settings
+from app.metrics import metrics
 from app.models import NewsArticle
-from db.connection import get_connection
+from db.connection import connection
 
 logger = logging.getLogger(__name__)
 
 
-def insert_articles(articles: Iterable[NewsArticle]) -> int:
+@dataclass
+class InsertResult:
+    """insert_articles 결과. duplicates 는 ON CONFLICT 로 무시된 건수."""
+    attempted: int
+    inserted: int
+    # 티커별 실제 INSERT 건수 (적응형 폴링 주기 계산 등에 사용)
+    inserted_by_ticker: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def duplicates(self) -> int:
+        return self.attempted - self.inserted
+
+
+# 이 건수 이상이면 COPY + staging 테이블, 미만이면 execute_values 사용
+COPY_THRESHOLD = 500
+
+_INSERT_COLUMNS = (
+    "published, published_dt, category, ticker, source_name, title, link, cluster_id"
+)
+
+_STAGE_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS news_history_stage (
+        published    text,
+        published_dt timestamp,
+        category     text,
+        ticker       text,
+        source_name  text,
+        title        text,
+        link         text,
+        cluster_id   bigint
+    ) ON COMMIT DELETE ROWS;
+"""
+
+
+def _article_row(a: NewsArticle) -> Tuple:
+    return (
+        a.published_raw,
+        a.published_dt,
+        a.category,
+        a.ticker,
+        a.source_name,
+        a.title,
+        a.link,
+        a.cluster_id,
+    )
+
+
+# news_history 는 published_dt 월별 파티션 테이블이라 (link, ticker) UNIQUE 인덱스를 걸 수 없다.
+# 같은 문장 안에서 news_keys 에 먼저 넣고, 새로 들어간 키의 행만 news_history 에 넣는다.
+# (기존 ON CONFLICT (link, ticker) DO NOTHING 과 같은 결과, 동시에 넣어도 PK 가 막아준다)
+_INSERT_NEW_KEYS_SQL = f"""
+    WITH data AS (
+        SELECT {_INSERT_COLUMNS} FROM {{source}}
+    ),
+    new_keys AS (
+        INSERT INTO public.news_keys (link, ticker)
+        SELECT link, ticker FROM data
+        ON CONFLICT (link, ticker) DO NOTHING
+        RETURNING link, ticker
+    ),
+    inserted AS (
+        INSERT INTO public.news_history ({_INSERT_COLUMNS})
+        SELECT d.published, d.published_dt, d.category, d.ticker,
+               d.source_name, d.title, d.link, d.cluster_id
+        FROM data d
+        JOIN new_keys k ON k.link = d.link AND k.ticker = d.ticker
+        RETURNING id, {_INSERT_COLUMNS}
+    ),
+    latest AS (
+        INSERT INTO public.ticker_latest (id, {_INSERT_COLUMNS})
+        SELECT id, {_INSERT_COLUMNS} FROM inserted
+    )
+    SELECT id, ticker FROM inserted;
+"""
+
+# ticker_latest (0005) 에는 새 행을 모두 넣은 뒤, 같은 트랜잭션에서
+# 새 행이 들어간 티커만 최신 TICKER_LATEST_SIZE 개를 남기고 지운다.
+_TRIM_TICKER_LATEST_SQL = """
+    DELETE FROM public.ticker_latest t
+    USING (
+        SELECT ticker, id,
+               row_number() OVER (
+                   PARTITION BY ticker ORDER BY published_dt DESC, id DESC
+               ) AS rn
+        FROM public.ticker_latest
+        WHERE ticker = ANY(%s)
+    ) ranked
+    WHERE t.ticker = ranked.ticker AND t.id = ranked.id AND ranked.rn > %s;
+"""
+
+
+def _unique_rows(data: List[Tuple]) -> List[Tuple]:
+    """같은 (link, ticker) 가 한 배치에 여러 번 있으면 처음 것만 남긴다 (link: 6, ticker: 3)."""
+    seen: Dict[Tuple[str, str], Tuple] = {}
+    for row in data:
+        seen.setdefault((row[6], row[3]), row)
+    return list(seen.values())
+
+
+def _insert_values(cur, data: List[Tuple]) -> List[Dict[str, Any]]:
+    """소량 배치: 여러 행을 VALUES 하나로 묶어 INSERT (페이지당 1 round trip)."""
+    from psycopg2.extras import execute_values
+
+    source = f"(VALUES %s) AS v ({_INSERT_COLUMNS})"
+    return execute_values(
+        cur,
+        _INSERT_NEW_KEYS_SQL.format(source=source),
+        data,
+        # 값이 전부 NULL 인 열도 타입이 맞도록 캐스트
+        template="(%s, %s::timestamp, %s, %s, %s, %s, %s, %s::bigint)",
+        page_size=COPY_THRESHOLD,
+        fetch=True,
+    )
+
+
+def _insert_copy(cur, data: List[Tuple]) -> List[Dict[str, Any]]:
+    """대량 배치: 임시 staging 테이블에 COPY 한 뒤 INSERT ... SELECT 한 번."""
+    buf = io.StringIO()
+    # QUOTE_ALL: 빈 문자열이 COPY csv 에서 NULL 로 읽히지 않도록
+    # (cluster_id 는 None 이 "" 로 쓰이므로 FORCE_NULL 로 다시 NULL 로 읽는다)
+    writer = csv.writer(buf, quoting=csv.QUOTE_ALL)
+    for row in data:
+        writer.writerow(
+            [v.isoformat(sep=" ") if isinstance(v, datetime) else v for v in row]
+        )
+    buf.seek(0)
+
+    cur.execute(_STAGE_DDL)
+    cur.copy_expert(
+        f"COPY news_history_stage ({_INSERT_COLUMNS}) "
+        "FROM STDIN WITH (FORMAT csv, FORCE_NULL (cluster_id))",
+        buf,
+    )
+    cur.execute(_INSERT_NEW_KEYS_SQL.format(source="news_history_stage"))
+    return cur.fetchall()
+
+
+def insert_articles(articles: Iterable[NewsArticle]) -> InsertResult:
     """
     news_history 테이블에 기사 여러 건을 한 번에 INSERT.
-    link + ticker 에 UNIQUE 인덱스를 걸어두고
-    ON CONFLICT (link, ticker) DO NOTHING 으로 중복을 무시.
+    news_keys (link, ticker) PRIMARY KEY 로 이미 저장된 기사는 무시한다.
+    RETURNING 으로 실제 INSERT 된 건수를 세서 중복 건수와 함께 반환한다.
     """
-    articles = list(articles)
-    if not articles:
+    data = [_article_row(a) for a in articles]
+    if not data:
         logger.info("insert_articles: nothing to insert")
-        return 0
+        return InsertResult(attempted=0, inserted=0)
+    attempted = len(data)
+    data = _unique_rows(data)
 
-    sql = """
-        INSERT INTO public.news_history
-            (published, published_dt, category, ticker, source_name, title, link)
-        VALUES
-            (%s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (link, ticker) DO NOTHING;
-    """
-
-    data = [
-        (
-            a.published_raw,
-            a.published_dt,
-            a.category,
-            a.ticker,
-            a.source_name,
-            a.title,
-            a.link,
-        )
-        for a in articles
-    ]
+    # staging 경로는 CREATE TEMP + COPY + INSERT ... SELECT, VALUES 경로는 페이지당 1번
+    if len(data) >= COPY_THRESHOLD:
+        op, insert, round_trips = "insert_copy", _insert_copy, 3
+    else:
+        op, insert, round_trips = "insert_values", _insert_values, 1
+    with metrics.timer("db_seconds", op=op):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                returned = insert(cur, data)
+                if returned:
+                    cur.execute(
+                        _TRIM_TICKER_LATEST_SQL,
+                        (list({r["ticker"] for r in returned}), settings.TICKER_LATEST_SIZE),
+                    )
+                    round_trips += 1
+    metrics.inc("db_round_trips_total", round_trips, op=op)
+
+    result = InsertResult(
+        attempted=attempted,
+        inserted=len(returned),
+        inserted_by_ticker=dict(Counter(r["ticker"] for r in returned)),
+    )
+    metrics.inc("db_rows_attempted_total", result.attempted)
+    # METRICS_PER_JOB=0 이면 source 의 job label 처럼 티커 label 없이 합계만 센다.
+    if settings.METRICS_PER_JOB:
+        for ticker, count in result.inserted_by_ticker.items():
+            metrics.inc("db_rows_inserted_total", count, ticker=ticker)
+    elif result.inserted:
+        metrics.inc("db_rows_inserted_total", result.inserted)
+    logger.info(
+        "insert_articles: attempted=%d inserted=%d duplicates=%d",
+        result.attempted,
+        result.inserted,
+        result.duplicates,
+    )
+    return result
 
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.executemany(sql, data)
-        conn.commit()
 
-    logger.info("insert_articles: attempted=%d", len(data))
-    return len(data)
-    # 실제로 몇 건이 INSERT 되었는지 알고 싶으면
-    # cur.rowcount 를 별도로 모아야 하지만, 여기서는 attempted 개수만 반환.
+def day_range(target_date: date) -> Tuple[datetime, datetime]:
+    """target_date 하루를 [00:00, 다음날 00:00) 반열린 구간으로 변환."""
+    start = datetime.combine(target_date, time.min)
+    return start, start + timedelta(days=1)
 
 
-def fetch_articles_for_date(target_date: date) -> List[Dict[str, Any]]:
+def iter_article_chunks_between(
+    start: datetime,
+    end: datetime,
+    chunk_size: int = 2000,
+    after_id: Optional[int] = None,
+    extra_ids: Sequence[int] = (),
+) -> Iterator[List[Dict[str, Any]]]:
     """
-    published_dt 기준으로 특정 날짜의 기사를 모두 가져온다.
-    반환값: dict 리스트 (pandas DataFrame 으로 만들기 좋음)
+    published_dt 가 [start, end) 구간인 기사를 (ticker, published_dt, id) 순으로 스트리밍한다.
+    DATE(published_dt) 대신 범위 조건을 써야 published_dt 인덱스를 탈 수 있다.
+    server-side(named) cursor 로 chunk_size 행씩 받아오므로
+    조회 범위가 커져도 메모리 사용량이 일정하다.
+    after_id 를 넘기면 id 가 그보다 큰 행(그 뒤에 저장된 행)과 extra_ids 의 행만 가져온다.
     """
     sql = """
         SELECT id, published, published_dt, category, ticker,
-               source_name, title, link
+               source_name, title, link, cluster_id
         FROM public.news_history
-        WHERE DATE(published_dt) = %s
+        WHERE published_dt >= %s AND published_dt < %s
+          AND (id > %s OR id = ANY(%s))
         ORDER BY ticker, published_dt, id;
     """
 
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (target_date,))
-            rows = cur.fetchall()
-
-    logger.info("fetch_articles_for_date(%s): %d rows", target_date, len(rows))
-    return rows
+    with connection() as conn:
+        with conn.cursor(name="iter_articles_between") as cur:
+            cur.itersize = chunk_size
+            cur.execute(
+                sql, (start, end, after_id if after_id is not None else 0, list(extra_ids))
+            )
+            while True:
+                # DECLARE 는 execute 에서 보내지 않고 첫 FETCH 와 함께 간다.
+                with metrics.timer("db_seconds", op="iter_article_chunks"):
+                    rows = cur.fetchmany(chunk_size)
+                metrics.inc("db_round_trips_total", op="iter_article_chunks")
+                if not rows:
+                    break
+                yield rows
 
 
-def fetch_latest_articles_for_ticker(
-    ticker: str,
-    limit: int = 3,
-) -> List[Dict[str, Any]]:
+def fetch_ticker_latest(
+    tickers: Sequence[str],
+    limit: Optional[int] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
     """
-    특정 ticker 에 대해, 날짜 제한 없이 가장 최근 기사 몇 개를 가져온다.
-    오늘 뉴스가 하나도 없을 때 fallback 용도로 사용.
+    ticker_latest 요약 테이블에서 티커별 최신 기사(published_dt, id 내림차순)를 가져온다.
+    news_history 크기와 무관하게 (ticker, published_dt DESC, id DESC) 인덱스 조회 한 번.
+    티커당 최대 TICKER_LATEST_SIZE 개까지만 있으므로 limit 도 그 이하로만 의미가 있다.
+    묶음(cluster) 중복을 건너뛰는 쪽은 남은 행이 그보다 적을 수 있다 (TICKER_LATEST_SIZE 설명 참고).
+    반환값: {ticker: [row, ...]} (기사가 없는 ticker 는 키가 없음)
     """
+    unique_tickers = list(dict.fromkeys(tickers))
+    if not unique_tickers:
+        return {}
+
     sql = """
         SELECT id, published, published_dt, category, ticker,
-               source_name, title, link
-        FROM public.news_history
-        WHERE ticker = %s
-        ORDER BY published_dt DESC, id DESC
-        LIMIT %s;
+               source_name, title, link, cluster_id
+        FROM public.ticker_latest
+        WHERE ticker = ANY(%s)
+        ORDER BY ticker, published_dt DESC, id DESC;
     """
 
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (ticker, limit))
-            rows = cur.fetchall()
+    with metrics.timer("db_seconds", op="fetch_ticker_latest"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (unique_tickers,))
+                rows = cur.fetchall()
+    metrics.inc("db_round_trips_total", op="fetch_ticker_latest")
+
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for r in rows:
+        group = grouped.setdefault(r["ticker"], [])
+        if limit is None or len(group) < limit:
+            group.append(r)
 
     logger.info(
-        "fetch_latest_articles_for_ticker(%s, limit=%d): %d rows",
-        ticker,
+        "fetch_ticker_latest(%d tickers, limit=%s): %d rows",
+        len(unique_tickers),
         limit,
-        len(rows),
+        sum(len(v) for v in grouped.values()),
     )
-    return rows
\ No newline at end of file
+    return grouped
+
+
+def rebuild_ticker_latest(size: Optional[int] = None) -> int:
+    """
+    ticker_latest 를 news_history 에서 티커별 최신 size(기본 TICKER_LATEST_SIZE)개로 다시 채운다.
+    TICKER_LATEST_SIZE 를 바꿨을 때 쓴다. 채운 행 수를 반환.
+    """
+    if size is None:
+        size = settings.TICKER_LATEST_SIZE
+    with metrics.timer("db_seconds", op="rebuild_ticker_latest"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("TRUNCATE public.ticker_latest;")
+                cur.execute(
+                    f"""
+                    INSERT INTO public.ticker_latest (id, {_INSERT_COLUMNS})
+                    SELECT id, {_INSERT_COLUMNS}
+                    FROM (
+                        SELECT h.*,
+                               row_number() OVER (
+                                   PARTITION BY ticker ORDER BY published_dt DESC, id DESC
+                               ) AS rn
+                        FROM public.news_history h
+                    ) ranked
+                    WHERE rn <= %s;
+                    """,
+                    (size,),
+                )
+                count = cur.rowcount
+    metrics.inc("db_round_trips_total", 2, op="rebuild_ticker_latest")
+
+    logger.info("rebuild_ticker_latest(size=%d): %d rows", size, count)
+    return count
+
+
+def fetch_db_identity() -> Dict[str, Any]:
+    """
+    로컬 상태 파일이 어느 DB 를 기준으로 만든 것인지 확인하는 값.
+    db: 접속 대상(host:port/dbname) + 클러스터 system identifier (권한이 없으면 생략),
+    max_id: 지금 news_history 의 최대 id (없으면 0).
+    """
+    with metrics.timer("db_seconds", op="fetch_db_identity"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COALESCE(max(id), 0) AS max_id FROM public.news_history;")
+                max_id = cur.fetchone()["max_id"]
+                cur.execute("SAVEPOINT db_identity;")
+                try:
+                    cur.execute("SELECT system_identifier FROM pg_control_system();")
+                    system_id = str(cur.fetchone()["system_identifier"])
+                except Exception:
+                    # pg_control_system 은 기본적으로 superuser / pg_monitor 만 부를 수 있다.
+                    cur.execute("ROLLBACK TO SAVEPOINT db_identity;")
+                    system_id = "?"
+    metrics.inc("db_round_trips_total", 3, op="fetch_db_identity")
+
+    db = f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}#{system_id}"
+    return {"db": db, "max_id": max_id}
+
+
+def fetch_recent_article_keys(since: datetime) -> List[Tuple[str, str]]:
+    """published_dt >= since 인 기사들의 (link, ticker) 키 (오래된 순). 중복 필터 warm-up 용."""
+    sql = """
+        SELECT link, ticker
+        FROM public.news_history
+        WHERE published_dt >= %s
+        ORDER BY published_dt, id;
+    """
+
+    with metrics.timer("db_seconds", op="fetch_recent_article_keys"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (since,))
+                keys = [(r["link"], r["ticker"]) for r in cur.fetchall()]
+    metrics.inc("db_round_trips_total", op="fetch_recent_article_keys")
+
+    logger.info("fetch_recent_article_keys(since=%s): %d keys", since, len(keys))
+    return keys
+
+
+def fetch_recent_cluster_seeds(since: datetime) -> List[Dict[str, Any]]:
+    """
+    published_dt >= since 이고 cluster_id 가 있는 기사들의 (title, link, published_dt, cluster_id).
+    오래된 순. 유사 기사 묶음 인덱스 warm-up 용.
+    """
+    sql = """
+        SELECT title, link, published_dt, cluster_id
+        FROM public.news_history
+        WHERE published_dt >= %s AND cluster_id IS NOT NULL
+        ORDER BY published_dt, id;
+    """
+
+    with metrics.timer("db_seconds", op="fetch_recent_cluster_seeds"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (since,))
+                rows = cur.fetchall()
+    metrics.inc("db_round_trips_total", op="fetch_recent_cluster_seeds")
+
+    logger.info("fetch_recent_cluster_seeds(since=%s): %d rows", since, len(rows))
+    return rows
+
+
+def fetch_cluster_ids_between(
+    start: datetime,
+    end: datetime,
+    max_id: int,
+    exclude_ids: Sequence[int] = (),
+) -> List[int]:
+    """
+    published_dt 가 [start, end) 이고 id <= max_id 인 기사들(exclude_ids 제외)의 cluster_id (중복 없이).
+    증분 export 에서 이미 내보낸 유사 기사 묶음을 알아낼 때 쓴다.
+    """
+    sql = """
+        SELECT DISTINCT cluster_id
+        FROM public.news_history
+        WHERE published_dt >= %s AND published_dt < %s
+          AND id <= %s AND cluster_id IS NOT NULL
+          AND NOT (id = ANY(%s));
+    """
+
+    with metrics.timer("db_seconds", op="fetch_cluster_ids_between"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (start, end, max_id, list(exclude_ids)))
+                rows = cur.fetchall()
+    metrics.inc("db_round_trips_total", op="fetch_cluster_ids_between")
+
+    return [r["cluster_id"] for r in rows]
+
+
+def fetch_id_stats_between(
+    start: datetime,
+    end: datetime,
+    last_id: int,
+    window: int,
+) -> Dict[str, Any]:
+    """
+    published_dt 가 [start, end) 인 기사들의 id 요약. 증분 export 의 mark 를 DB 와 맞춰 볼 때 쓴다.
+    seen: id <= last_id 인 행 수, max_id: 최대 id (없으면 0),
+    window_ids: last_id - window < id <= last_id 인 id 들.
+    """
+    sql = """
+        SELECT count(*) FILTER (WHERE id <= %(last_id)s) AS seen,
+               COALESCE(max(id), 0) AS max_id,
+               COALESCE(
+                   array_agg(id ORDER BY id)
+                       FILTER (WHERE id > %(last_id)s - %(window)s AND id <= %(last_id)s),
+                   '{}'
+               ) AS window_ids
+        FROM public.news_history
+        WHERE published_dt >= %(start)s AND published_dt < %(end)s;
+    """
+
+    with metrics.timer("db_seconds", op="fetch_id_stats_between"):
+        with connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql, {"start": start, "end": end, "last_id": last_id, "window": window}
+                )
+                row = cur.fetchone()
+    metrics.inc("db_round_trips_total", op="fetch_id_stats_between")
+
+    return dict(row)
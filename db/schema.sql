@@ -0,0 +1,58 @@
+-- db/schema.sql
+-- news_history 스키마 참고용 스냅샷.
+-- 실제 적용은 db/migrations/*.sql 을 `python -m scripts.run_migrations` 로 한다.
+-- 마이그레이션을 추가하면 이 파일도 같이 갱신할 것.
+
+CREATE TABLE public.schema_migrations (
+    version    INTEGER PRIMARY KEY,
+    name       TEXT NOT NULL,
+    applied_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- 0004: published_dt 월별 RANGE 파티션 (news_history_pYYYY_MM + news_history_default)
+-- 파티션 생성 / 보존 기간 정리는 db/partitions.py (scripts/run_maintenance.py)
+CREATE TABLE public.news_history (
+    id           BIGINT NOT NULL DEFAULT nextval('public.news_history_id_seq'),
+    published    TEXT,
+    published_dt TIMESTAMP WITHOUT TIME ZONE NOT NULL,  -- UTC 기준
+    category     TEXT,
+    ticker       TEXT NOT NULL,
+    source_name  TEXT,
+    title        TEXT,
+    link         TEXT NOT NULL,
+    cluster_id   BIGINT,                                -- 0003: 유사 기사 묶음 번호
+    CONSTRAINT news_history_pkey PRIMARY KEY (id, published_dt)
+) PARTITION BY RANGE (published_dt);
+
+CREATE TABLE public.news_history_p2026_10 PARTITION OF public.news_history
+    FOR VALUES FROM ('2026-10-01') TO ('2026-11-01');  -- 예시
+CREATE TABLE public.news_history_default PARTITION OF public.news_history DEFAULT;
+
+-- 0004: insert_articles 의 (link, ticker) 중복 무시 대상 (0001 의 UNIQUE 인덱스 대신)
+CREATE TABLE public.news_keys (
+    link   TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    PRIMARY KEY (link, ticker)
+);
+
+-- 0002: 날짜 범위 조회 / 티커별 최신 기사 조회 (0004 에서 파티션 테이블에 다시 생성)
+CREATE INDEX news_history_published_dt_idx
+    ON public.news_history (published_dt);
+CREATE INDEX news_history_ticker_published_dt_idx
+    ON public.news_history (ticker, published_dt DESC, id DESC);
+
+-- 0005: 티커별 최신 기사 TICKER_LATEST_SIZE 개 (insert_articles 가 같이 갱신, 텔레그램 요약용)
+CREATE TABLE public.ticker_latest (
+    id           BIGINT NOT NULL,
+    published    TEXT,
+    published_dt TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    category     TEXT,
+    ticker       TEXT NOT NULL,
+    source_name  TEXT,
+    title        TEXT,
+    link         TEXT NOT NULL,
+    cluster_id   BIGINT,
+    PRIMARY KEY (ticker, id)
+);
+CREATE INDEX ticker_latest_ticker_published_dt_idx
+    ON public.ticker_latest (ticker, published_dt DESC, id DESC);
@@ -0,0 +1,326 @@
+# pipeline/cluster.py
+"""
+여러 티커 / 제휴 매체에 중복으로 올라오는 같은 기사를 하나의 묶음(cluster)으로 묶는다.
+
+- link 는 canonical_url() 로 정규화한다 (scheme, www., 추적용 쿼리, fragment, 끝 / 제거).
+  정규화한 URL 이 같으면 무조건 같은 묶음.
+- title 은 단어 집합의 Jaccard 유사도가 min_similarity 이상이면 같은 묶음으로 본다.
+  모든 기존 기사와 비교하지 않도록 MinHash 서명(NUM_BANDS x ROWS_PER_BAND 개)을
+  밴드로 나눈 LSH 인덱스로 후보만 찾고, 후보는 실제 Jaccard 로 확인한다.
+  (제목처럼 짧은 글은 SimHash 가 단어 하나만 바뀌어도 크게 흔들려서 MinHash 를 쓴다.)
+- 밴드 버킷마다 최근 BUCKET_SIZE 개만 두고 인덱스 전체도 ENTRY_CAPACITY 개로 제한하므로
+  기사 1건당 비용이 상수이고 전체 비용은 기사 수에 선형이다.
+- published_dt 가 window 이상 떨어진 기사는 묶지 않는다 ("Stock market today" 같은 매일 반복 제목).
+
+cluster_id 는 묶음의 첫 기사 정규화 URL 의 해시(양수 BIGINT)라서
+warm-up 을 어디서 하든 같은 값이 나온다.
+"""
+import hashlib
+import logging
+import random
+import re
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.config import settings
+from app.models import NewsArticle
+from db.repository import fetch_recent_cluster_seeds
+
+logger = logging.getLogger(__name__)
+
+# MinHash LSH: 밴드 10개 x 밴드당 4개 = 서명 40개.
+# Jaccard 0.8 인 쌍이 후보가 될 확률 약 99%, 0.3 인 쌍은 약 8%.
+NUM_BANDS = 10
+ROWS_PER_BAND = 4
+NUM_PERM = NUM_BANDS * ROWS_PER_BAND
+
+# 밴드 버킷 하나에 남겨둘 최근 항목 수 (기사 1건당 후보 수 상한 = NUM_BANDS x BUCKET_SIZE)
+BUCKET_SIZE = 32
+# 인덱스에 남겨둘 제목 수와 정규화 URL -> cluster_id 맵 크기 (오래된 것부터 버림)
+ENTRY_CAPACITY = 50_000
+URL_MAP_CAPACITY = 100_000
+# 제목 단어가 이보다 적으면 제목으로는 묶지 않는다 (짧은 제목은 우연히 겹치기 쉽다)
+MIN_TITLE_TOKENS = 4
+
+# 기사 내용과 무관한 추적/유입 경로용 쿼리 파라미터
+_TRACKING_PARAMS = {
+    ".tsrc",
+    "tsrc",
+    "guccounter",
+    "guce_referrer",
+    "guce_referrer_sig",
+    "ncid",
+    "yptr",
+    "soc_src",
+    "soc_trk",
+    "cmpid",
+    "fbclid",
+    "gclid",
+    "mc_cid",
+    "mc_eid",
+    "ref",
+    "src",
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# MinHash 용 해시 함수 (a * x + b) mod p. 실행마다 같은 값이 나오도록 seed 고정.
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+
+def canonical_url(link: str) -> str:
+    """비교용 정규화 URL. scheme 은 버리고 host/path?query 형태로 만든다."""
+    link = (link or "").strip()
+    if not link:
+        return ""
+    try:
+        parts = urlsplit(link)
+    except ValueError:
+        return link
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ]
+    query.sort()
+    return urlunsplit(("", host, path, urlencode(query), "")).lstrip("/")
+
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    return frozenset(_TOKEN_RE.findall((title or "").lower()))
+
+
+@lru_cache(maxsize=65536)
+def _token_signature(token: str) -> Tuple[int, ...]:
+    """단어 하나의 NUM_PERM 개 해시값. 단어는 제목 사이에서 많이 겹치므로 캐시한다."""
+    x = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+    return tuple((a * x + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+
+def minhash(tokens: Iterable[str]) -> Tuple[int, ...]:
+    """단어 집합의 MinHash 서명 (NUM_PERM 개)."""
+    return tuple(map(min, zip(*(_token_signature(t) for t in tokens))))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _new_cluster_id(canonical: str) -> int:
+    """묶음의 첫 기사 정규화 URL 로 만든 63비트 양수 (Postgres BIGINT 범위)."""
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+class _Entry:
+    __slots__ = ("tokens", "published_dt", "cluster_id", "band_keys")
+
+    def __init__(self, tokens, published_dt, cluster_id, band_keys):
+        self.tokens: FrozenSet[str] = tokens
+        self.published_dt: datetime = published_dt
+        self.cluster_id: int = cluster_id
+        self.band_keys: List[Tuple[int, int]] = band_keys
+
+
+class ClusterIndex:
+    def __init__(
+        self,
+        min_similarity: float = 0.8,
+        window: timedelta = timedelta(hours=48),
+    ):
+        self.min_similarity = min_similarity
+        self.window = window
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._next_entry_id = 0
+        # (밴드 번호, 밴드 해시) -> 최근 entry id 들
+        self._buckets: Dict[Tuple[int, int], Deque[int]] = {}
+        self._urls: "OrderedDict[str, Tuple[int, datetime]]" = OrderedDict()
+        self.assigned = 0
+        self.joined = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _in_window(self, a: datetime, b: datetime) -> bool:
+        return abs(a - b) <= self.window
+
+    @staticmethod
+    def _band_keys(tokens: FrozenSet[str]) -> List[Tuple[int, int]]:
+        sig = minhash(tokens)
+        return [
+            (i, hash(sig[i * ROWS_PER_BAND:(i + 1) * ROWS_PER_BAND]))
+            for i in range(NUM_BANDS)
+        ]
+
+    def _evict_oldest(self) -> None:
+        entry_id, entry = self._entries.popitem(last=False)
+        for key in entry.band_keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(entry_id)
+            except ValueError:
+                pass  # 이미 maxlen 때문에 밀려남
+            if not bucket:
+                del self._buckets[key]
+
+    def _remember(
+        self,
+        canonical: str,
+        tokens: Optional[FrozenSet[str]],
+        band_keys: Optional[List[Tuple[int, int]]],
+        published_dt: datetime,
+        cluster_id: int,
+    ) -> None:
+        if canonical:
+            self._urls[canonical] = (cluster_id, published_dt)
+            self._urls.move_to_end(canonical)
+            if len(self._urls) > URL_MAP_CAPACITY:
+                self._urls.popitem(last=False)
+        if tokens is None or band_keys is None:
+            return
+
+        entry_id = self._next_entry_id
+        self._next_entry_id += 1
+        self._entries[entry_id] = _Entry(tokens, published_dt, cluster_id, band_keys)
+        for key in band_keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = deque(maxlen=BUCKET_SIZE)
+                self._buckets[key] = bucket
+            bucket.append(entry_id)
+        if len(self._entries) > ENTRY_CAPACITY:
+            self._evict_oldest()
+
+    def _find(
+        self,
+        canonical: str,
+        tokens: Optional[FrozenSet[str]],
+        band_keys: Optional[List[Tuple[int, int]]],
+        published_dt: datetime,
+    ) -> Optional[int]:
+        hit = self._urls.get(canonical) if canonical else None
+        if hit is not None and self._in_window(hit[1], published_dt):
+            return hit[0]
+        if tokens is None or band_keys is None:
+            return None
+
+        best_id: Optional[int] = None
+        best_sim = self.min_similarity
+        checked: Set[int] = set()
+        for key in band_keys:
+            for entry_id in self._buckets.get(key, ()):
+                if entry_id in checked:
+                    continue
+                checked.add(entry_id)
+                entry = self._entries.get(entry_id)
+                if entry is None or not self._in_window(entry.published_dt, published_dt):
+                    continue
+                sim = jaccard(tokens, entry.tokens)
+                if sim >= best_sim:
+                    best_id, best_sim = entry.cluster_id, sim
+        return best_id
+
+    def _title_features(self, title: str):
+        tokens = title_tokens(title)
+        if len(tokens) < MIN_TITLE_TOKENS:
+            return None, None
+        return tokens, self._band_keys(tokens)
+
+    def add_seed(self, title: str, link: str, published_dt: datetime, cluster_id: int) -> None:
+        """DB 에 이미 저장된 기사(묶음 번호 확정)를 인덱스에 넣는다."""
+        tokens, band_keys = self._title_features(title)
+        self._remember(canonical_url(link), tokens, band_keys, published_dt, cluster_id)
+
+    def assign(self, article: NewsArticle) -> int:
+        """article 의 묶음 번호를 정해서 article.cluster_id 에 넣고 반환."""
+        canonical = canonical_url(article.link)
+        tokens, band_keys = self._title_features(article.title)
+        cluster_id = self._find(canonical, tokens, band_keys, article.published_dt)
+        if cluster_id is None:
+            cluster_id = _new_cluster_id(canonical or article.link)
+        else:
+            self.joined += 1
+        self.assigned += 1
+        self._remember(canonical, tokens, band_keys, article.published_dt, cluster_id)
+        article.cluster_id = cluster_id
+        return cluster_id
+
+    def assign_all(self, articles: Iterable[NewsArticle]) -> None:
+        # 오래된 기사부터 넣어야 묶음 번호가 첫 기사 기준으로 정해진다.
+        for a in sorted(articles, key=lambda a: a.published_dt):
+            self.assign(a)
+        logger.info(
+            "Cluster: assigned=%d joined_existing=%d entries=%d urls=%d",
+            self.assigned,
+            self.joined,
+            len(self._entries),
+            len(self._urls),
+        )
+        self.assigned = 0
+        self.joined = 0
+
+
+def load_cluster_index() -> Optional[ClusterIndex]:
+    """
+    설정에 맞는 묶음 인덱스를 만들고 최근 CLUSTER_WINDOW_HOURS 시간치 DB 기사로 채운다.
+    CLUSTER_ENABLED=0 이면 None.
+    """
+    if not settings.CLUSTER_ENABLED:
+        return None
+
+    window = timedelta(hours=settings.CLUSTER_WINDOW_HOURS)
+    index = ClusterIndex(min_similarity=settings.CLUSTER_MIN_SIMILARITY, window=window)
+    try:
+        seeds = fetch_recent_cluster_seeds(datetime.utcnow() - window)
+    except Exception as e:
+        # warm-up 에 실패해도 새 기사끼리는 묶을 수 있다.
+        logger.warning("Cluster: warm-up from DB failed, starting empty: %s", e)
+        return index
+
+    for r in seeds:
+        index.add_seed(r["title"], r["link"], r["published_dt"], r["cluster_id"])
+    logger.info("Cluster: warmed %d articles from DB", len(seeds))
+    return index
+
+
+def collapse_rows(
+    rows: Iterable[Dict[str, Any]],
+    seen: Optional[Set[int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    묶음당 처음 나온 행만 남긴다 (cluster_id 가 없는 행은 그대로 둔다).
+    seen 을 넘기면 여러 번 호출해도(청크 / 티커 단위) 앞에서 나온 묶음을 기억한다.
+    """
+    seen = set() if seen is None else seen
+    kept: List[Dict[str, Any]] = []
+    for r in rows:
+        cluster_id = r.get("cluster_id")
+        if cluster_id is not None:
+            if cluster_id in seen:
+                continue
+            seen.add(cluster_id)
+        kept.append(r)
+    return kept
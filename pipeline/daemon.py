@@ -0,0 +1,198 @@
+# pipeline/daemon.py
+"""
+상주(daemon) 모드.
+
+run_all 처럼 한 번 돌고 끝나는 대신, 프로세스를 띄워두고
+- 티커별로 AdaptivePoller 가 정한 주기마다 RSS 를 폴링해서 DB 에 저장하고
+  (PR Newswire 처럼 티커별 feed 가 없는 소스는 POLL_MIN_INTERVAL 마다 폴링)
+- 하루 한 번 DAEMON_EXPORT_TIME 에 export/send 와 파티션 관리(db/partitions.py)를
+  같은 프로세스에서 실행한다.
+SIGTERM / SIGINT 를 받으면 진행 중인 폴링을 마치고 종료한다.
+"""
+import logging
+import signal
+import sys
+import threading
+import time
+from datetime import date, datetime
+from typing import Optional
+
+from app.config import settings
+from app.logging_config import setup_logging
+from app.state import load_json, save_json
+from db.migrate import ensure_schema
+from db.partitions import ensure_partitions, run_maintenance
+from pipeline.cluster import load_cluster_index
+from pipeline.deduplicate import load_deduplicator
+from pipeline.ingest import store_batch
+from pipeline.scheduler import AdaptivePoller
+from rss_config.loader import load_rss_list
+from source.registry import load_sources
+
+logger = logging.getLogger(__name__)
+
+DAEMON_STATE_FILE_NAME = "daemon_state.json"
+
+# 할 일이 없어도 이 간격(초)마다 깨어나서 rss_list 변경 / export 시각을 확인
+MAX_SLEEP_SECONDS = 30.0
+
+
+def _parse_export_time(value: str):
+    return datetime.strptime(value.strip(), "%H:%M").time()
+
+
+class NewsDaemon:
+    def __init__(self):
+        self.poller = AdaptivePoller(
+            min_interval=settings.POLL_MIN_INTERVAL,
+            max_interval=settings.POLL_MAX_INTERVAL,
+            target_per_poll=settings.POLL_TARGET_ARTICLES,
+            jitter=settings.POLL_JITTER,
+        )
+        sources = load_sources()
+        # 티커별 소스(Yahoo)는 AdaptivePoller 로, 나머지(PR Newswire 등 전체 feed)는
+        # POLL_MIN_INTERVAL 마다 한 번씩 폴링한다.
+        per_ticker = [s for s in sources if s.per_ticker]
+        self.source = per_ticker[0] if per_ticker else None
+        self.feed_sources = [s for s in sources if not s.per_ticker]
+        self._next_feed_poll = 0.0
+        # run() 에서 DB warm-up 과 함께 만든다.
+        self.dedup = None
+        self.clusters = None
+        self.export_time = _parse_export_time(settings.DAEMON_EXPORT_TIME)
+        state = load_json(DAEMON_STATE_FILE_NAME, {})
+        self.last_export: Optional[str] = state.get("last_export")
+        self._stop = threading.Event()
+
+    def stop(self, *_args) -> None:
+        logger.info("daemon: stop requested")
+        self._stop.set()
+
+    def poll_due(self) -> int:
+        """지금 차례인 티커들을 폴링해서 저장. 폴링한 티커 수를 반환."""
+        if self.source is None:
+            return 0
+        due = self.poller.pop_due()
+        if not due:
+            return 0
+
+        # log_stats 가 이번 폴링 것만 보여 주도록 누적값을 비운다.
+        self.source.reset_stats()
+        try:
+            articles = self.source.fetch_articles(due)
+            result = store_batch(articles, self.dedup, self.clusters)
+            self.source.save_cache()
+            if self.dedup is not None:
+                self.dedup.save()
+        except Exception:
+            self.poller.retry_later(due)
+            raise
+
+        now = time.monotonic()
+        for feed in due:
+            self.poller.record(feed.ticker, result.inserted_by_ticker.get(feed.ticker, 0), now)
+
+        logger.info(
+            "daemon: polled %d tickers, inserted=%d duplicates=%d",
+            len(due),
+            result.inserted,
+            result.duplicates,
+        )
+        return len(due)
+
+    def poll_feed_sources(self) -> None:
+        """티커 단위가 아닌 소스들을 POLL_MIN_INTERVAL 마다 폴링해서 저장."""
+        now = time.monotonic()
+        if not self.feed_sources or now < self._next_feed_poll:
+            return
+        self._next_feed_poll = now + settings.POLL_MIN_INTERVAL
+
+        for source in self.feed_sources:
+            source.reset_stats()
+            try:
+                result = store_batch(source.fetch_articles(), self.dedup, self.clusters)
+                source.save_cache()
+            except Exception as e:
+                logger.exception("daemon: %s 폴링 중 예외 발생: %s", source.name, e)
+                continue
+            logger.info(
+                "daemon: polled %s, inserted=%d duplicates=%d",
+                source.name,
+                result.inserted,
+                result.duplicates,
+            )
+        if self.dedup is not None:
+            self.dedup.save()
+
+    def maybe_export(self) -> None:
+        """오늘 DAEMON_EXPORT_TIME 이 지났고 아직 안 보냈으면 export/send 실행."""
+        now = datetime.now()
+        today = date.today().isoformat()
+        if self.last_export == today or now.time() < self.export_time:
+            return
+
+        # 순환 import 를 피하려고 여기서 불러온다.
+        from scripts import run_export_and_send as export_and_send
+
+        logger.info("daemon: running scheduled export_and_send")
+        try:
+            export_and_send.main()
+        except Exception as e:
+            logger.exception("daemon: export_and_send 실행 중 예외 발생: %s", e)
+        # 하루 한 번: 다음 달 파티션 생성 + 보존 기간 지난 파티션 정리
+        try:
+            run_maintenance()
+        except Exception as e:
+            logger.exception("daemon: partition maintenance 실행 중 예외 발생: %s", e)
+        # 실패해도 오늘은 다시 시도하지 않는다 (매 루프마다 재시도 폭주 방지)
+        self.last_export = today
+        save_json(DAEMON_STATE_FILE_NAME, {"last_export": today})
+
+    def run(self) -> None:
+        logger.info("===== FinancialNewsCrawler: daemon start =====")
+        self.poller.sync_feeds(load_rss_list())
+        self.poller.load_state()
+        try:
+            ensure_partitions()
+        except Exception as e:
+            logger.warning("daemon: ensure_partitions failed: %s", e)
+        self.dedup = load_deduplicator()
+        self.clusters = load_cluster_index()
+
+        try:
+            while not self._stop.is_set():
+                # rss_list 가 바뀌었으면 반영 (mtime 캐시라 바뀌지 않았으면 거의 공짜)
+                self.poller.sync_feeds(load_rss_list())
+
+                try:
+                    if self.poll_due():
+                        self.poller.save_state()
+                except Exception as e:
+                    # DB 장애 등으로 한 번 실패해도 daemon 은 계속 돈다.
+                    logger.exception("daemon: poll 실행 중 예외 발생: %s", e)
+
+                self.poll_feed_sources()
+                self.maybe_export()
+
+                wait = self.poller.seconds_until_next()
+                wait = MAX_SLEEP_SECONDS if wait is None else min(wait, MAX_SLEEP_SECONDS)
+                if self.feed_sources:
+                    wait = min(wait, max(0.0, self._next_feed_poll - time.monotonic()))
+                self._stop.wait(wait)
+        finally:
+            self.poller.save_state()
+            for source in filter(None, [self.source, *self.feed_sources]):
+                source.close()
+            if self.dedup is not None:
+                self.dedup.log_stats()
+            logger.info("===== FinancialNewsCrawler: daemon stopped =====")
+
+
+def run_daemon() -> None:
+    setup_logging()
+    if not ensure_schema():
+        sys.exit(1)
+    daemon = NewsDaemon()
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    daemon.run()
@@ -0,0 +1,237 @@
+# pipeline/deduplicate.py
+"""
+DB 에 보내기 전 이미 저장한 기사를 걸러내는 중복 필터.
+
+매 폴링마다 가져오는 기사 대부분은 이미 news_history 에 있는 것들이라
+ON CONFLICT (link, ticker) DO NOTHING 에 맡기면 DB 왕복만 낭비된다.
+(link, ticker) 를 8바이트 blake2b 다이제스트로 줄여서 최근 capacity 개만
+LRU 로 기억하고, 여기 없는 기사만 insert 로 넘긴다.
+
+- Bloom filter 대신 LRU 를 쓴 이유: Bloom filter 는 거짓 양성이 나면 새 기사를
+  조용히 버리고, 오래된 키를 지울 수도 없다. 다이제스트 LRU 는 충돌 확률이
+  키 수 / 2^64 수준이라 사실상 0 이고, 용량을 넘으면 오래된 키부터 잊는다.
+- 잊어버린 기사는 DB 의 ON CONFLICT 가 그대로 막아주므로 정확성에는 영향이 없다.
+- 상태는 STATE_DIR/dedup_keys.bin 에 저장하고, 파일이 없으면
+  최근 DEDUP_WARM_DAYS 일치 키를 DB 에서 읽어 채운다.
+- 파일 머리에 저장할 때의 DB 정보(db_identity: 접속 대상 / system identifier,
+  news_history 최대 id)를 같이 넣는다. 다른 DB 를 보거나 DB 의 최대 id 가 저장 때보다
+  작으면(복원 / 초기화) 파일을 버리고 DB 에서 다시 채운다. 그러지 않으면 DB 에 없는
+  기사를 필터가 계속 걸러서 영영 저장되지 않는다.
+"""
+import hashlib
+import json
+import logging
+import struct
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.config import settings
+from app.models import NewsArticle
+from app.state import load_bytes, save_bytes
+from db.repository import InsertResult, fetch_db_identity, fetch_recent_article_keys
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE_NAME = "dedup_keys.bin"
+
+# DDP2: _MAGIC + 머리 길이(4바이트) + 머리(JSON: db_identity) + 8바이트 키들
+_MAGIC = b"DDP2"
+_HEADER_LEN = struct.Struct(">I")
+KEY_SIZE = 8
+
+
+def article_key(link: str, ticker: str) -> bytes:
+    """(link, ticker) 의 8바이트 다이제스트."""
+    return hashlib.blake2b(
+        f"{ticker}\x1f{link}".encode("utf-8"), digest_size=KEY_SIZE
+    ).digest()
+
+
+class ArticleDeduplicator:
+    def __init__(self, capacity: int, db_identity: Optional[Dict[str, Any]] = None):
+        self.capacity = max(1, capacity)
+        # 이 키들이 가리키는 DB ({"db": ..., "max_id": ...}, fetch_db_identity)
+        self.db_identity = db_identity
+        self._keys: "OrderedDict[bytes, None]" = OrderedDict()
+        self._dirty = False
+        # 통계
+        self.checked = 0
+        self.hits = 0                # 필터가 걸러낸 기사
+        self.passed = 0              # DB 로 넘긴 기사
+        self.missed_duplicates = 0   # 넘겼는데 DB 에 이미 있던 기사 (필터가 잊었거나 몰랐던 것)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._keys
+
+    def _add_key(self, key: bytes) -> None:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return
+        self._keys[key] = None
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+
+    def filter(self, articles: Iterable[NewsArticle]) -> List[NewsArticle]:
+        """이미 알고 있는 기사와 같은 배치 안의 중복을 빼고, 새 것으로 보이는 기사만 반환."""
+        fresh: List[NewsArticle] = []
+        batch_keys = set()
+        for a in articles:
+            self.checked += 1
+            key = article_key(a.link, a.ticker)
+            if key in self._keys:
+                # 자주 보이는 키는 LRU 에서 밀려나지 않도록 갱신
+                self._keys.move_to_end(key)
+                self.hits += 1
+                continue
+            if key in batch_keys:
+                self.hits += 1
+                continue
+            batch_keys.add(key)
+            fresh.append(a)
+        self.passed += len(fresh)
+        return fresh
+
+    def remember(self, articles: Iterable[NewsArticle], result: Optional[InsertResult] = None) -> None:
+        """
+        insert 가 끝난 기사들을 기억한다 (새로 들어갔든 ON CONFLICT 였든 이제 DB 에 있다).
+        result 를 주면 필터를 통과했지만 DB 에 이미 있던 건수를 집계한다.
+        """
+        for a in articles:
+            self._add_key(article_key(a.link, a.ticker))
+            self._dirty = True
+        if result is not None:
+            self.missed_duplicates += result.duplicates
+
+    def warm(self, keys: Iterable) -> int:
+        """(link, ticker) 목록으로 채운다. 오래된 것부터 주면 최신 키가 LRU 뒤쪽에 남는다."""
+        n = 0
+        for link, ticker in keys:
+            self._add_key(article_key(link, ticker))
+            n += 1
+        if n:
+            self._dirty = True
+        return n
+
+    def stats(self) -> Dict[str, float]:
+        checked = self.checked or 1
+        passed = self.passed or 1
+        return {
+            "checked": self.checked,
+            "hits": self.hits,
+            "passed": self.passed,
+            "missed_duplicates": self.missed_duplicates,
+            "hit_rate": round(self.hits / checked, 4),
+            # 필터를 통과했지만 DB 에서 중복으로 판정된 비율 (필터가 놓친 중복)
+            "miss_rate": round(self.missed_duplicates / passed, 4),
+            # 다이제스트 충돌로 새 기사를 잘못 거를 확률의 이론값 (키 수 / 2^64, 측정값 아님)
+            "est_collision_rate": len(self._keys) / float(2 ** (8 * KEY_SIZE)),
+            "size": len(self._keys),
+            "capacity": self.capacity,
+        }
+
+    def log_stats(self) -> None:
+        s = self.stats()
+        logger.info(
+            "Dedup: checked=%d hits=%d passed=%d missed_duplicates=%d "
+            "hit_rate=%.1f%% miss_rate=%.1f%% est_collision=%.1e size=%d/%d",
+            s["checked"],
+            s["hits"],
+            s["passed"],
+            s["missed_duplicates"],
+            s["hit_rate"] * 100,
+            s["miss_rate"] * 100,
+            s["est_collision_rate"],
+            s["size"],
+            s["capacity"],
+        )
+
+    def load(self) -> bool:
+        """
+        상태 파일에서 복원. 파일이 없거나 형식이 다르거나,
+        self.db_identity 가 있는데 파일의 DB 와 맞지 않으면 False.
+        """
+        data = load_bytes(STATE_FILE_NAME)
+        if not data or not data.startswith(_MAGIC):
+            return False
+        try:
+            offset = len(_MAGIC)
+            (header_len,) = _HEADER_LEN.unpack_from(data, offset)
+            offset += _HEADER_LEN.size
+            header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+            body = data[offset + header_len:]
+        except (struct.error, UnicodeDecodeError, ValueError):
+            logger.warning("dedup state file header is broken, ignoring")
+            return False
+        if len(body) % KEY_SIZE:
+            logger.warning("dedup state file is truncated, ignoring")
+            return False
+
+        stored = header.get("db_identity")
+        if self.db_identity is not None and not _same_db(stored, self.db_identity):
+            logger.warning(
+                "dedup state file belongs to another DB state (file=%s, db=%s), ignoring",
+                stored,
+                self.db_identity,
+            )
+            return False
+
+        for i in range(0, len(body), KEY_SIZE):
+            self._add_key(body[i:i + KEY_SIZE])
+        if self.db_identity is None:
+            self.db_identity = stored
+        self._dirty = False
+        return True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        header = json.dumps({"db_identity": self.db_identity}).encode("utf-8")
+        save_bytes(
+            STATE_FILE_NAME,
+            _MAGIC + _HEADER_LEN.pack(len(header)) + header + b"".join(self._keys),
+        )
+        self._dirty = False
+
+
+def _same_db(stored: Optional[Dict[str, Any]], current: Dict[str, Any]) -> bool:
+    """
+    같은 DB 이고 저장한 뒤로 행이 지워지지 않았는지.
+    id 는 계속 커지기만 하므로 지금 최대 id 가 저장 때보다 작으면 복원 / 초기화된 것이다.
+    """
+    if not stored:
+        return False
+    return stored.get("db") == current["db"] and (stored.get("max_id") or 0) <= current["max_id"]
+
+
+def load_deduplicator() -> Optional[ArticleDeduplicator]:
+    """
+    설정에 맞는 중복 필터를 만든다. DEDUP_ENABLED=0 이면 None.
+    저장된 상태가 없거나 지금 DB 와 맞지 않으면 최근 DEDUP_WARM_DAYS 일치 키를 DB 에서 읽어 채운다.
+    """
+    if not settings.DEDUP_ENABLED:
+        return None
+
+    try:
+        db_identity = fetch_db_identity()
+    except Exception as e:
+        # DB 를 확인할 수 없으면 (어차피 warm-up 도 안 된다) 파일을 그대로 믿는다.
+        logger.warning("Dedup: cannot read DB identity, trusting state file: %s", e)
+        db_identity = None
+
+    dedup = ArticleDeduplicator(settings.DEDUP_CAPACITY, db_identity)
+    if dedup.load():
+        logger.info("Dedup: loaded %d keys from state", len(dedup))
+        return dedup
+
+    since = datetime.utcnow() - timedelta(days=settings.DEDUP_WARM_DAYS)
+    try:
+        n = dedup.warm(fetch_recent_article_keys(since))
+        logger.info("Dedup: warmed %d keys from DB (since %s)", n, since)
+    except Exception as e:
+        # warm-up 실패는 치명적이지 않다: 빈 필터로 시작하고 DB 의 ON CONFLICT 에 맡긴다.
+        logger.warning("Dedup: warm-up from DB failed, starting empty: %s", e)
+    return dedup
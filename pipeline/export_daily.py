@@ -1,50 +1,605 @@
 # pipeline/export_daily.py
+import csv
+import itertools
 import logging
-from datetime import date
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Tuple, Optional
-
-import pandas as pd
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from app.config import settings
-from db.repository import fetch_articles_for_date
+from app.metrics import metrics
+from app.state import load_json, save_json
+from db.repository import (
+    fetch_cluster_ids_between,
+    fetch_id_stats_between,
+    iter_article_chunks_between,
+)
+from pipeline.cluster import collapse_rows
 
 logger = logging.getLogger(__name__)
 
+EXPORT_COLUMNS = [
+    "id",
+    "published",
+    "published_dt",
+    "category",
+    "ticker",
+    "source_name",
+    "title",
+    "link",
+    "cluster_id",
+]
+
+SUPPORTED_FORMATS = ("xlsx", "csv", "parquet")
+
+
+class _XlsxWriter:
+    """openpyxl write-only 모드: 행을 바로 디스크로 흘려보내서 메모리가 일정."""
+
+    def __init__(self, path: Path):
+        from openpyxl import Workbook
+
+        self.path = path
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet()
+        self._ws.append(EXPORT_COLUMNS)
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        for r in rows:
+            self._ws.append([r.get(c) for c in EXPORT_COLUMNS])
+
+    def close(self) -> None:
+        self._wb.save(self.path)
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, append: bool = False):
+        self.path = path
+        if append:
+            # 이미 BOM 과 헤더가 있는 파일 끝에 행만 덧붙인다.
+            self._f = path.open("a", encoding="utf-8", newline="")
+            self._writer = csv.writer(self._f)
+        else:
+            # utf-8-sig: 엑셀에서 열어도 한글이 깨지지 않도록 BOM 포함
+            self._f = path.open("w", encoding="utf-8-sig", newline="")
+            self._writer = csv.writer(self._f)
+            self._writer.writerow(EXPORT_COLUMNS)
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows([r.get(c) for c in EXPORT_COLUMNS] for r in rows)
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class _ParquetWriter:
+    """분석용 Parquet. pyarrow 가 필요하다 (requirements.txt 의 선택 의존성)."""
+
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "parquet 내보내기에는 pyarrow 가 필요합니다: pip install pyarrow"
+            ) from e
+
+        self.path = path
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.int64()),
+                ("published", pa.string()),
+                ("published_dt", pa.timestamp("us")),
+                ("category", pa.string()),
+                ("ticker", pa.string()),
+                ("source_name", pa.string()),
+                ("title", pa.string()),
+                ("link", pa.string()),
+                ("cluster_id", pa.int64()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        columns = {c: [r.get(c) for r in rows] for c in EXPORT_COLUMNS}
+        table = self._pa.Table.from_pydict(columns, schema=self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {
+    "xlsx": _XlsxWriter,
+    "csv": _CsvWriter,
+    "parquet": _ParquetWriter,
+}
+
+
+def _resolve_format(fmt: Optional[str]) -> str:
+    fmt = (fmt or settings.EXPORT_FORMAT or "xlsx").strip().lower()
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"지원하지 않는 export 형식입니다: {fmt} (가능: {', '.join(SUPPORTED_FORMATS)})"
+        )
+    return fmt
+
+
+def _export_path(start_date: date, end_date: date, fmt: str, suffix: str = "") -> Path:
+    export_dir: Path = settings.EXPORT_DIR
+    export_dir.mkdir(parents=True, exist_ok=True)
+
+    if start_date == end_date:
+        filename = f"news_{start_date.strftime('%Y%m%d')}{suffix}.{fmt}"
+    else:
+        filename = (
+            f"news_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}{suffix}.{fmt}"
+        )
+    return export_dir / filename
+
 
-def export_for_date(target_date: date) -> Tuple[Optional[Path], int]:
+def _date_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date, time.min) + timedelta(days=1)
+    return start, end
+
+
+def _iter_chunks(
+    start_date: date,
+    end_date: date,
+    after_id: Optional[int] = None,
+    extra_ids: Sequence[int] = (),
+) -> Iterator[List[Dict[str, Any]]]:
+    start, end = _date_bounds(start_date, end_date)
+    return iter_article_chunks_between(
+        start,
+        end,
+        chunk_size=settings.EXPORT_CHUNK_SIZE,
+        after_id=after_id,
+        extra_ids=extra_ids,
+    )
+
+
+def _write_chunks(
+    chunks: Iterator[List[Dict[str, Any]]],
+    open_writer: Callable[[], Any],
+    seen_clusters: Optional[Set[int]],
+) -> Tuple[Any, int, List[int]]:
     """
-    news_history 에서 target_date 기준 기사들을 조회해서
-    엑셀 파일로 저장하고, (파일경로, 행 개수)를 반환.
+    chunks 를 writer 에 쓰고 (writer, 쓴 행 수, 읽은 행의 id 들) 를 반환.
+    writer 는 처음 쓸 행이 생길 때 open_writer() 로 만든다 (쓸 행이 없으면 None).
+    seen_clusters 가 None 이 아니면 유사 기사 묶음마다 처음 나온 행만 쓴다.
+    """
+    writer = None
+    row_count = 0
+    ids: List[int] = []
+    for rows in chunks:
+        # collapse 로 버리는 행도 읽은 것이므로 high-water mark 에 포함한다.
+        ids.extend(r["id"] for r in rows)
+        # SQL 에서 이미 ticker, published_dt, id 순으로 정렬되어 있다.
+        if seen_clusters is not None:
+            rows = collapse_rows(rows, seen_clusters)
+            if not rows:
+                continue
+        if writer is None:
+            writer = open_writer()
+        writer.write_rows(rows)
+        row_count += len(rows)
+    return writer, row_count, ids
+
+
+def _write_file(
+    chunks: Iterator[List[Dict[str, Any]]],
+    file_path: Path,
+    fmt: str,
+    seen_clusters: Optional[Set[int]],
+) -> Tuple[int, List[int]]:
+    """
+    chunks 를 file_path 에 새로 쓰고 (쓴 행 수, 읽은 행의 id 들) 를 반환.
+    쓸 행이 없으면 파일을 만들지 않는다.
+    """
+    # 중간에 실패해도 이전 파일이 반쯤 쓰인 파일로 바뀌지 않도록 임시 파일에 먼저 쓴다.
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    try:
+        writer, row_count, ids = _write_chunks(
+            chunks, lambda: _WRITERS[fmt](tmp_path), seen_clusters
+        )
+        if writer is not None:
+            writer.close()
+            os.replace(tmp_path, file_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return row_count, ids
+
+
+def _append_csv(
+    chunks: Iterator[List[Dict[str, Any]]],
+    file_path: Path,
+    seen_clusters: Optional[Set[int]],
+) -> Tuple[int, List[int]]:
+    """
+    기존 csv 파일 끝에 chunks 를 덧붙이고 (덧붙인 행 수, 읽은 행의 id 들) 를 반환.
+    중간에 실패하면 파일을 원래 길이로 되돌린다.
+    """
+    size = file_path.stat().st_size
+    writers: List[_CsvWriter] = []
+
+    def open_writer() -> _CsvWriter:
+        writers.append(_CsvWriter(file_path, append=True))
+        return writers[0]
+
+    try:
+        _, row_count, ids = _write_chunks(chunks, open_writer, seen_clusters)
+        if writers:
+            writers[0].close()
+    except BaseException:
+        if writers:
+            writers[0].close()
+            with file_path.open("r+b") as f:
+                f.truncate(size)
+        raise
+    return row_count, ids
+
+
+def export_range(
+    start_date: date,
+    end_date: date,
+    fmt: Optional[str] = None,
+    collapse_clusters: Optional[bool] = None,
+) -> Tuple[Optional[Path], int]:
+    """
+    news_history 에서 start_date ~ end_date(포함) 기사들을 스트리밍으로 조회해서
+    fmt 형식(xlsx/csv/parquet) 파일로 저장하고, (파일경로, 행 개수)를 반환.
     데이터가 없으면 (None, 0) 반환.
+
+    DB 는 server-side cursor 로 EXPORT_CHUNK_SIZE 행씩 읽고,
+    파일도 chunk 단위로 바로 쓰기 때문에 행 수와 무관하게 메모리가 일정하다.
+
+    collapse_clusters(기본 EXPORT_COLLAPSE_CLUSTERS)가 켜져 있으면 유사 기사 묶음마다
+    처음 나온 행(ticker, published_dt 순)만 남긴다.
     """
-    rows = fetch_articles_for_date(target_date)
+    file_path, row_count, _ = _export_full(start_date, end_date, fmt, collapse_clusters)
+    return file_path, row_count
 
-    if not rows:
-        logger.info("export_for_date(%s): no rows to export", target_date)
-        return None, 0
 
-    df = pd.DataFrame(rows)
+def _export_full(
+    start_date: date,
+    end_date: date,
+    fmt: Optional[str],
+    collapse_clusters: Optional[bool],
+) -> Tuple[Optional[Path], int, List[int]]:
+    """export_range 본체. (파일경로, 행 개수, 읽은 행의 id 들) 를 반환."""
+    fmt = _resolve_format(fmt)
+    if collapse_clusters is None:
+        collapse_clusters = settings.EXPORT_COLLAPSE_CLUSTERS
+    if end_date < start_date:
+        raise ValueError(f"end_date({end_date}) 가 start_date({start_date}) 보다 앞섭니다.")
 
-    # 정렬
-    sort_cols = [c for c in ["ticker", "published_dt", "id"] if c in df.columns]
-    if sort_cols:
-        df = df.sort_values(sort_cols)
+    file_path = _export_path(start_date, end_date, fmt)
+    row_count, ids = _write_file(
+        _iter_chunks(start_date, end_date),
+        file_path,
+        fmt,
+        set() if collapse_clusters else None,
+    )
+    if not row_count:
+        logger.info(
+            "export_range(%s ~ %s): no rows to export", start_date, end_date
+        )
+        return None, 0, []
+
+    metrics.inc("export_rows_total", row_count, format=fmt, mode="full")
+    metrics.inc("export_bytes_total", file_path.stat().st_size, format=fmt, mode="full")
+    logger.info(
+        "export_range(%s ~ %s): %d rows -> %s (exists=%s)",
+        start_date,
+        end_date,
+        row_count,
+        file_path,
+        file_path.exists(),
+    )
+
+    return file_path, row_count, ids
+
+
+# 증분 export 상태 (STATE_DIR/export_marks.json):
+#   "<대상>:<날짜별 파일 이름>" -> {
+#       "last_id": 읽은 최대 id, "rows": 누적으로 내보낸 행 수,
+#       "read": 읽은 행 수 (collapse 로 버린 행 포함),
+#       "recent_ids": 읽은 id 중 last_id - MARK_REREAD_IDS 보다 큰 것, ...}
+# 대상은 날짜별 파일 자체(FILE_MARK_TARGET)와 export_delta 를 쓰는 쪽(예: "telegram")이
+# 각자 따로 가진다.
+#
+# news_history.id 는 시퀀스라서 나중에 저장된 행일수록 대체로 크지만, 동시에 도는 트랜잭션은
+# mark 보다 작은 id 를 나중에 커밋할 수 있다. 그래서 매번 mark 아래 MARK_REREAD_IDS 개 id 를
+# 다시 보고 recent_ids 에 없는 행을 함께 내보낸다. 그래도 DB 의 행 수(id <= last_id)가
+# read 와 맞지 않으면 (DB 복원 / 행 삭제 / 그보다 늦은 커밋) mark 를 버리고 처음부터 다시 만든다.
+EXPORT_MARKS_FILE_NAME = "export_marks.json"
+# 날짜마다 쌓이므로 최근 항목만 남긴다.
+EXPORT_MARKS_SIZE = 100
+FILE_MARK_TARGET = "file"
+# mark 아래로 다시 확인하는 id 범위
+MARK_REREAD_IDS = 1000
+
+
+def get_mark(target: str, file_name: str) -> Optional[Dict[str, Any]]:
+    return load_json(EXPORT_MARKS_FILE_NAME, {}).get(f"{target}:{file_name}")
+
+
+def set_mark(target: str, file_name: str, **mark: Any) -> None:
+    marks = load_json(EXPORT_MARKS_FILE_NAME, {})
+    key = f"{target}:{file_name}"
+    marks.pop(key, None)
+    marks[key] = mark
+    while len(marks) > EXPORT_MARKS_SIZE:
+        marks.pop(next(iter(marks)))
+    save_json(EXPORT_MARKS_FILE_NAME, marks)
+
+
+def _late_ids(target_date: date, mark: Dict[str, Any]) -> Optional[List[int]]:
+    """
+    mark 를 DB 와 맞춰 보고, mark 보다 작은 id 로 나중에 커밋되어 아직 읽지 않은 행의 id 들을 반환.
+    mark 가 DB 와 맞지 않으면 None.
+    """
+    last_id = mark["last_id"]
+    if not last_id:
+        return []
+    if "read" not in mark:
+        return None
+    stats = fetch_id_stats_between(
+        *_date_bounds(target_date, target_date), last_id, MARK_REREAD_IDS
+    )
+    recent = set(mark.get("recent_ids", ()))
+    late = [i for i in stats["window_ids"] if i not in recent]
+    if stats["max_id"] < last_id or stats["seen"] != mark["read"] + len(late):
+        metrics.inc("export_mark_mismatch_total")
+        logger.warning(
+            "export mark for %s does not match the DB "
+            "(last_id=%d, read=%d, db max_id=%d, db rows <= last_id=%d), starting over",
+            target_date,
+            last_id,
+            mark["read"],
+            stats["max_id"],
+            stats["seen"],
+        )
+        return None
+    if late:
+        logger.info(
+            "export mark for %s: %d late row(s) below id=%d", target_date, len(late), last_id
+        )
+    return late
+
+
+def _advance(mark: Dict[str, Any], ids: List[int]) -> Dict[str, Any]:
+    """mark 에 이번에 읽은 ids 를 반영한 last_id / read / recent_ids."""
+    last_id = max([mark.get("last_id", 0), *ids])
+    recent = set(mark.get("recent_ids", ())).union(ids)
+    return {
+        "last_id": last_id,
+        "read": mark.get("read", 0) + len(ids),
+        "recent_ids": sorted(i for i in recent if i > last_id - MARK_REREAD_IDS),
+    }
+
+
+def _seen_before(
+    target_date: date,
+    last_id: int,
+    collapse_clusters: bool,
+    late_ids: Sequence[int] = (),
+) -> Optional[Set[int]]:
+    """collapse 할 때 id <= last_id 행(이미 내보낸 행, late_ids 제외)에 나온 묶음들."""
+    if not collapse_clusters:
+        return None
+    if not last_id:
+        return set()
+    return set(
+        fetch_cluster_ids_between(
+            *_date_bounds(target_date, target_date), last_id, exclude_ids=late_ids
+        )
+    )
 
-    export_dir: Path = settings.EXPORT_DIR
-    export_dir.mkdir(parents=True, exist_ok=True)
 
-    filename = f"news_{target_date.strftime('%Y%m%d')}.xlsx"
-    file_path = export_dir / filename
+def export_incremental(
+    target_date: date,
+    fmt: Optional[str] = None,
+    collapse_clusters: Optional[bool] = None,
+) -> Tuple[Optional[Path], int]:
+    """
+    export_for_date 의 증분 버전. (파일경로, 파일의 전체 행 개수) 를 반환.
+
+    날짜별 파일의 high-water mark 보다 id 가 큰 행만 조회해서
+    - 새 행이 없으면 파일을 다시 쓰지 않는다 (모든 형식).
+    - 새 행이 있으면 csv 만 기존 파일 끝에 새 행을 덧붙인다.
+    - xlsx / parquet 에는 덧붙이는 경로가 없어서, 새 행이 하나라도 있으면 그날 전체를 다시 쓴다
+      (openpyxl 로 기존 파일을 열어 덧붙이는 것이 write-only 로 새로 쓰는 것보다 느리고,
+      parquet 은 닫힌 파일에 row group 을 더할 수 없다).
+      자주 돌리면서 덧붙이기의 이득을 보려면 EXPORT_FORMAT=csv 를 쓴다.
+    mark 가 없거나, 파일이 없거나, collapse 설정이 바뀌었거나, mark 가 DB 와 맞지 않으면
+    전체를 새로 쓴다.
+    덧붙인 행은 파일 끝에 오므로 파일 전체가 ticker 순으로 정렬되어 있지는 않다.
+    """
+    fmt = _resolve_format(fmt)
+    if collapse_clusters is None:
+        collapse_clusters = settings.EXPORT_COLLAPSE_CLUSTERS
+    file_path = _export_path(target_date, target_date, fmt)
+    mark = get_mark(FILE_MARK_TARGET, file_path.name)
+
+    if mark is None or mark.get("collapse") != collapse_clusters or not file_path.exists():
+        return _rebuild_daily(target_date, fmt, collapse_clusters)
+    late = _late_ids(target_date, mark)
+    if late is None:
+        return _rebuild_daily(target_date, fmt, collapse_clusters)
 
-    df.to_excel(file_path, index=False)
+    last_id = mark["last_id"]
+    chunks = _iter_chunks(target_date, target_date, after_id=last_id, extra_ids=late)
+    first = next(chunks, None)
+    if first is None:
+        metrics.inc("export_skipped_total", format=fmt)
+        logger.info(
+            "export_incremental(%s): no rows after id=%d, %s unchanged",
+            target_date,
+            last_id,
+            file_path.name,
+        )
+        return file_path, mark["rows"]
 
+    if fmt != "csv":
+        chunks.close()
+        logger.info(
+            "export_incremental(%s): new rows after id=%d, rewriting %s (append is csv only)",
+            target_date,
+            last_id,
+            file_path.name,
+        )
+        return _rebuild_daily(target_date, fmt, collapse_clusters)
+
+    size_before = file_path.stat().st_size
+    added, ids = _append_csv(
+        itertools.chain([first], chunks),
+        file_path,
+        _seen_before(target_date, last_id, collapse_clusters, late),
+    )
+    row_count = mark["rows"] + added
+    set_mark(
+        FILE_MARK_TARGET,
+        file_path.name,
+        rows=row_count,
+        collapse=collapse_clusters,
+        **_advance(mark, ids),
+    )
+
+    metrics.inc("export_rows_total", added, format=fmt, mode="append")
+    metrics.inc(
+        "export_bytes_total", file_path.stat().st_size - size_before, format=fmt, mode="append"
+    )
     logger.info(
-        "export_for_date(%s): %d rows -> %s (exists=%s)",
+        "export_incremental(%s): appended %d rows (id > %d) -> %s (%d rows)",
         target_date,
-        len(df),
+        added,
+        last_id,
         file_path,
-        file_path.exists(),
+        row_count,
     )
+    return file_path, row_count
+
+
+def _rebuild_daily(
+    target_date: date,
+    fmt: str,
+    collapse_clusters: bool,
+) -> Tuple[Optional[Path], int]:
+    file_path, row_count, ids = _export_full(target_date, target_date, fmt, collapse_clusters)
+    if file_path is not None:
+        set_mark(
+            FILE_MARK_TARGET,
+            file_path.name,
+            rows=row_count,
+            collapse=collapse_clusters,
+            **_advance({}, ids),
+        )
+    return file_path, row_count
+
 
-    return file_path, len(df)
\ No newline at end of file
+@dataclass
+class DeltaExport:
+    """export_delta 결과. advance_mark() 를 부르기 전까지 target 의 mark 는 그대로다."""
+    target: str
+    # mark 이름으로 쓰는 날짜별 파일 이름 (news_YYYYMMDD.<fmt>)
+    file_name: str
+    # 새 행이 없으면 None
+    path: Optional[Path]
+    row_count: int
+    # 이번에 읽은 행까지 포함한 high-water mark
+    last_id: int
+    # advance_mark 후 target 이 받은 누적 행 수
+    total_rows: int
+    # advance_mark 로 저장할 read / recent_ids (export_marks.json 설명 참고)
+    read: int = 0
+    recent_ids: List[int] = field(default_factory=list)
+
+
+def export_delta(
+    target_date: date,
+    target: str,
+    fmt: Optional[str] = None,
+    collapse_clusters: Optional[bool] = None,
+) -> DeltaExport:
+    """
+    target(예: "telegram") 이 마지막으로 받은 뒤에 저장된 target_date 기사만
+    news_YYYYMMDD_delta.<fmt> 로 저장한다. target 이 처음이면 그날 기사 전체.
+    전송 등이 성공한 뒤에 advance_mark(delta) 를 불러야 다음 delta 가 그 뒤부터 시작한다.
+    mark 가 DB 와 맞지 않으면 (DB 복원 등) 처음인 것처럼 그날 기사 전체를 다시 만든다.
+    """
+    fmt = _resolve_format(fmt)
+    if collapse_clusters is None:
+        collapse_clusters = settings.EXPORT_COLLAPSE_CLUSTERS
+    file_name = _export_path(target_date, target_date, fmt).name
+    mark = get_mark(target, file_name) or {"last_id": 0, "rows": 0}
+    late = _late_ids(target_date, mark)
+    if late is None:
+        mark, late = {"last_id": 0, "rows": 0}, []
+    last_id = mark["last_id"]
+
+    delta_path = _export_path(target_date, target_date, fmt, suffix="_delta")
+    row_count, ids = _write_file(
+        _iter_chunks(target_date, target_date, after_id=last_id, extra_ids=late),
+        delta_path,
+        fmt,
+        _seen_before(target_date, last_id, collapse_clusters, late),
+    )
+    if row_count:
+        metrics.inc("export_rows_total", row_count, format=fmt, mode="delta")
+        metrics.inc("export_bytes_total", delta_path.stat().st_size, format=fmt, mode="delta")
+    logger.info(
+        "export_delta(%s, target=%s): %d rows after id=%d -> %s",
+        target_date,
+        target,
+        row_count,
+        last_id,
+        delta_path if row_count else None,
+    )
+    return DeltaExport(
+        target=target,
+        file_name=file_name,
+        path=delta_path if row_count else None,
+        row_count=row_count,
+        total_rows=mark["rows"] + row_count,
+        **_advance(mark, ids),
+    )
+
+
+def advance_mark(delta: DeltaExport) -> None:
+    """delta 까지 받은 것으로 target 의 high-water mark 를 옮긴다."""
+    set_mark(
+        delta.target,
+        delta.file_name,
+        last_id=delta.last_id,
+        rows=delta.total_rows,
+        read=delta.read,
+        recent_ids=delta.recent_ids,
+    )
+
+
+def export_for_date(
+    target_date: date,
+    fmt: Optional[str] = None,
+    collapse_clusters: Optional[bool] = None,
+    incremental: Optional[bool] = None,
+) -> Tuple[Optional[Path], int]:
+    """
+    news_history 에서 target_date 기준 기사들을 조회해서
+    파일로 저장하고, (파일경로, 행 개수)를 반환.
+    데이터가 없으면 (None, 0) 반환.
+    incremental(기본 EXPORT_INCREMENTAL)이면 export_incremental 로 지난번 이후 행만 반영한다.
+    """
+    if incremental is None:
+        incremental = settings.EXPORT_INCREMENTAL
+    if incremental:
+        return export_incremental(target_date, fmt=fmt, collapse_clusters=collapse_clusters)
+    return export_range(
+        target_date, target_date, fmt=fmt, collapse_clusters=collapse_clusters
+    )
@@ -1,31 +1,241 @@
 # pipeline/ingest.py
 import logging
-from typing import List
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional
 
+from app.config import settings
 from app.logging_config import setup_logging
+from app.metrics import metrics
 from app.models import NewsArticle
-from db.repository import insert_articles
-from source.yahoo_rss import YahooRssSource
+from db.partitions import ensure_partitions
+from db.repository import InsertResult, insert_articles
+from pipeline.cluster import ClusterIndex, load_cluster_index
+from pipeline.deduplicate import ArticleDeduplicator, load_deduplicator
+from source.base import BaseSource
+from source.registry import load_sources
 
 
 logger = logging.getLogger(__name__)
 
 
+def normalise(articles: Iterable[NewsArticle]) -> Iterator[NewsArticle]:
+    """제목/링크 공백 정리. link 가 없는 기사는 (link, ticker) 로 구분할 수 없어서 버린다."""
+    for a in articles:
+        a.title = (a.title or "").strip()
+        a.link = (a.link or "").strip()
+        if not a.link:
+            logger.warning("skip article without link: %s (%s)", a.title, a.ticker)
+            continue
+        yield a
+
+
+def store_batch(
+    articles: Iterable[NewsArticle],
+    dedup: Optional[ArticleDeduplicator] = None,
+    clusters: Optional[ClusterIndex] = None,
+) -> InsertResult:
+    """
+    기사 한 묶음을 정리 -> 중복 필터 -> 묶음 번호 부여 -> INSERT(한 트랜잭션) 한다.
+    INSERT 가 커밋된 뒤에만 중복 필터에 기억시킨다.
+    """
+    batch: List[NewsArticle] = list(normalise(articles))
+    received = len(batch)
+    if dedup is not None:
+        with metrics.timer("ingest_stage_seconds", stage="dedup"):
+            batch = dedup.filter(batch)
+        metrics.inc("dedup_skipped_total", received - len(batch))
+    if clusters is not None and batch:
+        with metrics.timer("ingest_stage_seconds", stage="cluster"):
+            clusters.assign_all(batch)
+
+    with metrics.timer("ingest_stage_seconds", stage="insert"):
+        result = insert_articles(batch)
+    if dedup is not None:
+        dedup.remember(batch, result)
+    metrics.inc("ingest_batches_total")
+    return result
+
+
+class MicroBatchWriter:
+    """
+    들어오는 기사를 모아두다가 batch_size 건이 차거나 첫 기사가 들어온 지
+    max_latency 초가 지나면 store_batch 로 저장한다.
+    배치마다 커밋하므로 중간에 죽어도 그때까지 저장한 배치는 남는다.
+    """
+
+    def __init__(
+        self,
+        dedup: Optional[ArticleDeduplicator] = None,
+        clusters: Optional[ClusterIndex] = None,
+        batch_size: Optional[int] = None,
+        max_latency: Optional[float] = None,
+    ):
+        self.dedup = dedup
+        self.clusters = clusters
+        self.batch_size = max(1, batch_size or settings.INGEST_BATCH_SIZE)
+        self.max_latency = (
+            max_latency if max_latency is not None else settings.INGEST_BATCH_SECONDS
+        )
+        self._buffer: List[NewsArticle] = []
+        self._first_at: Optional[float] = None
+        # 전체 누적 결과
+        self.received = 0
+        self.batches = 0
+        self.attempted = 0
+        self.inserted = 0
+        self.inserted_by_ticker: Counter = Counter()
+
+    def write(self, articles: Iterable[NewsArticle]) -> None:
+        """기사를 버퍼에 넣고, 조건이 되면 flush. 빈 리스트로 부르면 시간 조건만 확인."""
+        for a in articles:
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+            self._buffer.append(a)
+            self.received += 1
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+
+        if (
+            self._first_at is not None
+            and time.monotonic() - self._first_at >= self.max_latency
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer, self._first_at = self._buffer, [], None
+        result = store_batch(batch, self.dedup, self.clusters)
+        self.batches += 1
+        self.attempted += result.attempted
+        self.inserted += result.inserted
+        self.inserted_by_ticker.update(result.inserted_by_ticker)
+
+    def result(self) -> InsertResult:
+        return InsertResult(
+            attempted=self.attempted,
+            inserted=self.inserted,
+            inserted_by_ticker=dict(self.inserted_by_ticker),
+        )
+
+
+_SOURCE_DONE = object()
+# heartbeat 가 0 이하이면 큐 대기 없이 빈 리스트만 계속 yield 하므로 최소값으로 올린다.
+MIN_HEARTBEAT_SECONDS = 0.05
+
+
+def iter_all_sources(
+    sources: List[BaseSource],
+    heartbeat: Optional[float] = None,
+    queue_size: int = 64,
+) -> Iterator[List[NewsArticle]]:
+    """
+    여러 소스를 각자 스레드에서 동시에 돌리고, 나오는 기사 리스트를 하나로 합쳐 yield.
+    전체 소요 시간은 가장 느린 소스 정도이고, 동시 요청 수는 소스별 max_workers 로 따로 제한된다.
+    큐가 가득 차면 소스 쪽이 기다리므로 소비(DB 저장)가 느리면 수집도 늦춰진다.
+    heartbeat 초 동안 기사가 없으면 빈 리스트를 yield 한다 (None 이면 보내지 않음).
+    """
+    if heartbeat is not None:
+        heartbeat = max(MIN_HEARTBEAT_SECONDS, heartbeat)
+    q: "queue.Queue" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def pump(source: BaseSource) -> None:
+        try:
+            for articles in source.iter_articles():
+                if articles and not put(articles):
+                    return
+        except Exception as e:
+            logger.exception("source %s failed: %s", source.name, e)
+        finally:
+            put(_SOURCE_DONE)
+
+    threads = [
+        threading.Thread(target=pump, args=(s,), name=f"ingest-{s.name}", daemon=True)
+        for s in sources
+    ]
+    for t in threads:
+        t.start()
+
+    remaining = len(threads)
+    try:
+        while remaining:
+            try:
+                item = q.get(timeout=heartbeat)
+            except queue.Empty:
+                yield []
+                continue
+            if item is _SOURCE_DONE:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        # 소비하는 쪽이 중간에 멈추면 소스 스레드들도 정리한다.
+        stop.set()
+        for t in threads:
+            t.join()
+
+
 def run_ingest() -> None:
     """
-    1) Yahoo RSS 에서 기사 수집
-    2) DB(news_history)에 저장
+    ENABLED_SOURCES 의 소스들 -> 정리 -> 중복 필터 -> 유사 기사 묶음 -> DB(news_history) 를
+    스트리밍으로 처리. 소스들은 iter_all_sources 로 동시에 수집한다.
+
+    결과가 나오는 대로 MicroBatchWriter 에 흘려보내고,
+    INGEST_BATCH_SIZE 건 / INGEST_BATCH_SECONDS 초 단위로 나눠서 커밋한다.
+    전체 기사를 한 번에 메모리에 올리지 않고, 첫 기사는 수집이 끝나기 전에 저장된다.
     """
     setup_logging()
 
     logger.info("Starting ingest pipeline...")
 
-    source = YahooRssSource()
-    articles: List[NewsArticle] = source.fetch_articles()
+    # 이번 달 파티션이 없어도 default 파티션이 받아주므로 실패해도 수집은 계속한다.
+    try:
+        ensure_partitions()
+    except Exception as e:
+        logger.warning("ensure_partitions failed: %s", e)
+
+    dedup = load_deduplicator()
+    clusters = load_cluster_index()
+    writer = MicroBatchWriter(dedup, clusters)
 
-    logger.info("Fetched %d articles from Yahoo RSS", len(articles))
+    sources = load_sources()
+    try:
+        for articles in iter_all_sources(sources, heartbeat=writer.max_latency):
+            writer.write(articles)
+        writer.flush()
 
-    inserted = insert_articles(articles)
-    logger.info("Insert done. attempted=%d", inserted)
+        # 모든 배치가 저장된 뒤에만 조건부 GET 캐시를 저장한다.
+        # (중간에 죽으면 다음 실행에서 다시 받고, 이미 저장된 기사는 중복 필터 / ON CONFLICT 가 거른다.)
+        for source in sources:
+            source.save_cache()
+    finally:
+        for source in sources:
+            source.close()
+        # 커밋된 배치까지의 중복 필터 상태는 실패해도 저장한다.
+        if dedup is not None:
+            dedup.log_stats()
+            dedup.save()
+        result = writer.result()
+        logger.info(
+            "Insert done. received=%d batches=%d attempted=%d inserted=%d duplicates=%d",
+            writer.received,
+            writer.batches,
+            result.attempted,
+            result.inserted,
+            result.duplicates,
+        )
 
     logger.info("Ingest pipeline finished.")
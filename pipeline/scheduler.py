@@ -0,0 +1,172 @@
+# pipeline/scheduler.py
+"""
+daemon 모드용 티커별 적응형 폴링 스케줄러.
+
+티커마다 "초당 신규 기사 수" 를 지수이동평균(EWMA)으로 추적하고,
+폴링 한 번에 평균 target_per_poll 건 정도가 잡히도록 주기를 정한다.
+    interval = target_per_poll / rate   (min_interval ~ max_interval 로 제한)
+기사가 자주 나오는 지수/대형주는 짧게, 거의 안 나오는 소형주는 길게 폴링한다.
+한 번에 주기가 급변하지 않도록 폴링마다 최대 2배까지만 늘리거나 줄인다.
+"""
+import heapq
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.state import load_json, save_json
+from rss_config.loader import RssFeedConfig
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE_NAME = "poll_schedule.json"
+
+# 폴링 한 번에 주기가 바뀔 수 있는 최대 배수
+MAX_STEP_FACTOR = 2.0
+
+
+@dataclass
+class TickerSchedule:
+    feed: RssFeedConfig
+    interval: float                # 현재 폴링 주기(초)
+    rate: float = 0.0              # 초당 신규 기사 수 EWMA
+    last_poll: Optional[float] = None
+    next_due: float = 0.0
+
+
+class AdaptivePoller:
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        target_per_poll: float = 1.0,
+        alpha: float = 0.3,
+        jitter: float = 0.1,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.target_per_poll = target_per_poll
+        self.alpha = alpha
+        self.jitter = jitter
+        self._schedules: Dict[str, TickerSchedule] = {}
+        # (next_due, ticker) 힙. 주기가 바뀌면 새 항목을 넣고 오래된 항목은 꺼낼 때 무시.
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _jittered(self, interval: float) -> float:
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _push(self, s: TickerSchedule) -> None:
+        heapq.heappush(self._heap, (s.next_due, s.feed.ticker))
+
+    def sync_feeds(self, feeds: List[RssFeedConfig], now: Optional[float] = None) -> None:
+        """
+        rss_list 변경을 반영. 새 티커는 min_interval 안에 흩어서 곧 폴링하고,
+        빠진 티커는 스케줄에서 제거한다.
+        """
+        now = time.monotonic() if now is None else now
+        wanted = {f.ticker: f for f in feeds}
+
+        for ticker in list(self._schedules):
+            if ticker not in wanted:
+                del self._schedules[ticker]
+
+        for ticker, feed in wanted.items():
+            s = self._schedules.get(ticker)
+            if s is not None:
+                s.feed = feed
+                continue
+            s = TickerSchedule(
+                feed=feed,
+                interval=self.min_interval,
+                next_due=now + random.uniform(0, self.min_interval),
+            )
+            self._schedules[ticker] = s
+            self._push(s)
+
+    def pop_due(self, now: Optional[float] = None) -> List[RssFeedConfig]:
+        """지금 폴링해야 하는 티커들을 꺼낸다. record() 로 결과를 알려줘야 다시 예약된다."""
+        now = time.monotonic() if now is None else now
+        due: List[RssFeedConfig] = []
+        while self._heap and self._heap[0][0] <= now:
+            next_due, ticker = heapq.heappop(self._heap)
+            s = self._schedules.get(ticker)
+            if s is None or s.next_due != next_due:
+                continue  # 삭제됐거나 다시 예약된 오래된 항목
+            due.append(s.feed)
+        return due
+
+    def record(self, ticker: str, new_articles: int, now: Optional[float] = None) -> None:
+        """한 번 폴링한 결과(신규 기사 수)로 rate/주기를 갱신하고 다음 폴링을 예약."""
+        now = time.monotonic() if now is None else now
+        s = self._schedules.get(ticker)
+        if s is None:
+            return
+
+        elapsed = now - s.last_poll if s.last_poll is not None else s.interval
+        if elapsed > 0:
+            observed = new_articles / elapsed
+            s.rate = self.alpha * observed + (1 - self.alpha) * s.rate
+        s.last_poll = now
+
+        if s.rate > 0:
+            ideal = self.target_per_poll / s.rate
+        else:
+            ideal = self.max_interval
+        ideal = min(max(ideal, s.interval / MAX_STEP_FACTOR), s.interval * MAX_STEP_FACTOR)
+        s.interval = self._clamp(ideal)
+
+        s.next_due = now + self._jittered(s.interval)
+        self._push(s)
+
+    def retry_later(self, feeds: List[RssFeedConfig], now: Optional[float] = None) -> None:
+        """폴링 자체가 실패한 경우: rate 는 그대로 두고 현재 주기대로 다시 예약."""
+        now = time.monotonic() if now is None else now
+        for feed in feeds:
+            s = self._schedules.get(feed.ticker)
+            if s is None:
+                continue
+            s.next_due = now + self._jittered(s.interval)
+            self._push(s)
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        now = time.monotonic() if now is None else now
+        while self._heap:
+            next_due, ticker = self._heap[0]
+            s = self._schedules.get(ticker)
+            if s is None or s.next_due != next_due:
+                heapq.heappop(self._heap)
+                continue
+            return max(0.0, next_due - now)
+        return None
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {
+            t: {"interval": round(s.interval, 1), "rate_per_hour": round(s.rate * 3600, 3)}
+            for t, s in self._schedules.items()
+        }
+
+    def load_state(self, now: Optional[float] = None) -> None:
+        """
+        이전 실행에서 학습한 rate/주기를 복원 (sync_feeds 이후 호출).
+        다음 폴링은 복원한 주기 안에 흩어서 예약한다. 그러지 않으면 재시작 직후
+        모든 티커가 min_interval 안에 한꺼번에 몰린다.
+        """
+        now = time.monotonic() if now is None else now
+        for ticker, v in load_json(STATE_FILE_NAME, {}).items():
+            s = self._schedules.get(ticker)
+            if s is None:
+                continue
+            s.interval = self._clamp(float(v.get("interval", s.interval)))
+            s.rate = float(v.get("rate_per_hour", 0.0)) / 3600
+            s.next_due = now + random.uniform(0, s.interval)
+            self._push(s)
+
+    def save_state(self) -> None:
+        save_json(STATE_FILE_NAME, self.snapshot())
@@ -1,9 +1,15 @@
 # app/rss_config/loader.py
+import csv
+import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
-import pandas as pd
+from app.config import settings
+from app.state import load_json, save_json
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -18,40 +24,150 @@ class RssFeedConfig:
 _BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_RSS_LIST_PATH = _BASE_DIR / "rss_list.xlsx"
 
+# 파싱 결과 캐시. (경로, mtime, 크기) 가 같으면 파일을 다시 읽지 않는다.
+CACHE_FILE_NAME = "rss_list_cache.json"
+_CacheKey = Tuple[str, int, int]
+_memo: Dict[_CacheKey, List[RssFeedConfig]] = {}
+_memo_lock = threading.Lock()
+
+_REQUIRED_COLUMNS = {"category", "name", "ticker"}
+
+
+def _cell_str(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _rows_to_feeds(rows: Iterable[Mapping[str, Any]], path: Path) -> List[RssFeedConfig]:
+    """컬럼 이름을 정리하고 ticker 가 비어 있는 행은 제거해서 RssFeedConfig 로 변환."""
+    feeds: List[RssFeedConfig] = []
+    checked = False
+    for row in rows:
+        # 컬럼 이름 정리 (혹시 공백/대소문자 섞여 있는 경우 대비)
+        row = {_cell_str(k).lower(): v for k, v in row.items() if k is not None}
+        if not checked:
+            missing = _REQUIRED_COLUMNS - set(row)
+            if missing:
+                raise ValueError(f"{path.name}에 필요한 컬럼이 없습니다: {missing}")
+            checked = True
+
+        ticker = _cell_str(row.get("ticker"))
+        if not ticker:
+            continue
+        feeds.append(
+            RssFeedConfig(
+                category=_cell_str(row.get("category")),
+                name=_cell_str(row.get("name")),
+                ticker=ticker,
+            )
+        )
+    return feeds
+
+
+def _read_xlsx(path: Path) -> List[RssFeedConfig]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError(f"{path.name}이 비어 있습니다.")
+        return _rows_to_feeds((dict(zip(header, r)) for r in rows), path)
+    finally:
+        wb.close()
+
+
+def _read_csv(path: Path) -> List[RssFeedConfig]:
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None:
+            raise ValueError(f"{path.name}이 비어 있습니다.")
+        return _rows_to_feeds(reader, path)
+
+
+def _read_yaml(path: Path) -> List[RssFeedConfig]:
+    """
+    YAML 은 feed 목록 리스트 또는 {"feeds": [...]} 형태를 받는다.
+        - {category: "3.종목", name: Apple, ticker: AAPL}
+    """
+    try:
+        import yaml
+    except ImportError as e:
+        raise RuntimeError(
+            "YAML 티커 목록을 읽으려면 PyYAML 이 필요합니다: pip install pyyaml"
+        ) from e
+
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or []
+    if isinstance(data, dict):
+        data = data.get("feeds") or []
+    return _rows_to_feeds(data, path)
+
+
+_READERS = {
+    ".xlsx": _read_xlsx,
+    ".xlsm": _read_xlsx,
+    ".csv": _read_csv,
+    ".yaml": _read_yaml,
+    ".yml": _read_yaml,
+}
+
+
+def _load_from_disk_cache(key: _CacheKey):
+    entry = load_json(CACHE_FILE_NAME, {}).get(key[0])
+    if not entry or entry.get("mtime_ns") != key[1] or entry.get("size") != key[2]:
+        return None
+    return [RssFeedConfig(*row) for row in entry["feeds"]]
+
+
+def _save_disk_cache(key: _CacheKey, feeds: List[RssFeedConfig]) -> None:
+    data = load_json(CACHE_FILE_NAME, {})
+    data[key[0]] = {
+        "mtime_ns": key[1],
+        "size": key[2],
+        "feeds": [[f.category, f.name, f.ticker] for f in feeds],
+    }
+    try:
+        save_json(CACHE_FILE_NAME, data)
+    except OSError as e:
+        # 캐시 저장 실패는 치명적이지 않다 (다음 실행에서 다시 파싱할 뿐)
+        logger.warning("rss list cache save failed: %s", e)
+
 
 def load_rss_list(path: str | Path | None = None) -> List[RssFeedConfig]:
     """
-    rss_list.xlsx를 읽어서 RssFeedConfig 리스트로 반환한다.
-    path를 지정하지 않으면 app/rss_config/rss_list.xlsx를 사용.
+    rss_list.xlsx(또는 .csv / .yaml)를 읽어서 RssFeedConfig 리스트로 반환한다.
+    path를 지정하지 않으면 RSS_LIST_PATH 설정, 없으면 rss_config/rss_list.xlsx를 사용.
+
+    파일의 (경로, mtime, 크기) 가 바뀌지 않았으면
+    프로세스 내 메모 -> STATE_DIR 의 JSON 캐시 순서로 찾고,
+    엑셀 파일은 다시 열지 않는다.
     """
     if path is None:
-        path = DEFAULT_RSS_LIST_PATH
+        path = settings.RSS_LIST_PATH or DEFAULT_RSS_LIST_PATH
 
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"RSS 리스트 파일을 찾을 수 없습니다: {path}")
 
-    df = pd.read_excel(path)
-
-    # 컬럼 이름 정리 (혹시 공백/대소문자 섞여 있는 경우 대비)
-    df = df.rename(columns={c: c.strip().lower() for c in df.columns})
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(f"지원하지 않는 RSS 리스트 형식입니다: {path.suffix}")
 
-    required = {"category", "name", "ticker"}
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"rss_list.xlsx에 필요한 컬럼이 없습니다: {missing}")
+    st = path.stat()
+    key: _CacheKey = (str(path.resolve()), st.st_mtime_ns, st.st_size)
 
-    # ticker가 비어 있는 행은 제거
-    df = df.dropna(subset=["ticker"])
+    with _memo_lock:
+        feeds = _memo.get(key)
+        if feeds is None:
+            feeds = _load_from_disk_cache(key)
+            if feeds is None:
+                feeds = reader(path)
+                _save_disk_cache(key, feeds)
+                logger.info("load_rss_list: parsed %d feeds from %s", len(feeds), path)
+            # 같은 파일의 예전 버전 메모는 버린다.
+            for old_key in [k for k in _memo if k[0] == key[0]]:
+                del _memo[old_key]
+            _memo[key] = feeds
 
-    feeds: List[RssFeedConfig] = []
-    for _, row in df.iterrows():
-        feeds.append(
-            RssFeedConfig(
-                category=str(row["category"]).strip(),
-                name=str(row["name"]).strip(),
-                ticker=str(row["ticker"]).strip(),
-            )
-        )
-
-    return feeds
+    return list(feeds)
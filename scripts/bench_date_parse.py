@@ -0,0 +1,107 @@
+# scripts/bench_date_parse.py
+"""
+pubDate 파싱 마이크로 벤치마크.
+
+기존 방식(dateparser.parse + tz 제거)과 app.dates.parse_published 를
+Yahoo RSS 에서 실제로 보이는 pubDate 문자열 묶음으로 비교한다.
+
+    python -m scripts.bench_date_parse [--repeat 20]
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+import dateparser
+
+from app import dates
+from app.dates import parse_published
+
+# Yahoo Finance RSS 의 pubDate 는 거의 항상 첫 번째 형식이다.
+# 다른 feed 에서 섞여 들어오는 변형도 일부 포함.
+PUBDATE_CORPUS: List[str] = [
+    "Tue, 18 Nov 2025 14:30:00 +0000",
+    "Tue, 18 Nov 2025 13:05:12 +0000",
+    "Tue, 18 Nov 2025 09:41:37 +0000",
+    "Mon, 17 Nov 2025 22:15:00 +0000",
+    "Mon, 17 Nov 2025 21:00:44 +0000",
+    "Mon, 17 Nov 2025 18:32:09 +0000",
+    "Sun, 16 Nov 2025 11:00:00 +0000",
+    "Sat, 15 Nov 2025 03:27:51 +0000",
+    "Fri, 14 Nov 2025 20:10:00 +0000",
+    "Fri, 14 Nov 2025 16:45:18 +0000",
+    "Thu, 13 Nov 2025 12:00:00 +0000",
+    "Wed, 12 Nov 2025 08:30:00 +0000",
+    "Thu, 27 Nov 2025 15:02:33 +0000",
+    "Thu, 27 Nov 2025 14:59:59 +0000",
+    "Wed, 26 Nov 2025 23:48:00 +0000",
+    "Wed, 26 Nov 2025 19:20:41 +0000",
+    "Tue, 25 Nov 2025 10:11:12 +0000",
+    "Mon, 01 Dec 2025 00:00:00 +0000",
+    "Wed, 31 Dec 2025 23:59:59 +0000",
+    "Thu, 01 Jan 2026 00:00:01 +0000",
+    "Tue, 18 Nov 2025 14:30:00 GMT",
+    "Tue, 18 Nov 2025 09:30:00 -0500",
+    "Tue, 18 Nov 2025 06:30:00 -0800",
+    "Tue, 18 Nov 2025 23:30:00 +0900",
+    "Tue, 18 Nov 2025 09:30:00 EST",
+    "2025-11-18T14:30:00Z",
+    "2025-11-18T14:30:00+00:00",
+    "2025-11-18T23:30:00+09:00",
+    "November 18, 2025 2:30 PM",
+]
+
+
+def legacy_parse(raw: str) -> Optional[datetime]:
+    """변경 전 yahoo_rss 의 동작: tz 를 변환 없이 제거."""
+    dt = dateparser.parse(raw)
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt
+
+
+def legacy_parse_utc(raw: str) -> Optional[datetime]:
+    """결과 비교용: dateparser 결과를 UTC 로 제대로 변환한 값."""
+    dt = dateparser.parse(raw)
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _bench(fn: Callable[[str], Optional[datetime]], corpus: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for s in corpus:
+            fn(s)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(corpus)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # 결과 일치 여부 확인 (UTC 변환 기준)
+    mismatches = 0
+    for s in PUBDATE_CORPUS:
+        expected = legacy_parse_utc(s)
+        got = parse_published(s)
+        if expected != got:
+            mismatches += 1
+            print(f"MISMATCH {s!r}: dateparser={expected} fast={got}")
+
+    legacy_us = _bench(legacy_parse, PUBDATE_CORPUS, args.repeat)
+    # LRU 캐시 효과를 빼고 fast path 자체를 보기 위해 캐시 비우고 측정
+    dates._parse_absolute_cached.cache_clear()
+    new_us = _bench(parse_published, PUBDATE_CORPUS, args.repeat)
+
+    print(f"corpus: {len(PUBDATE_CORPUS)} strings x {args.repeat}")
+    print(f"dateparser.parse : {legacy_us:10.2f} us/op")
+    print(f"parse_published  : {new_us:10.2f} us/op")
+    print(f"speedup          : {legacy_us / new_us:10.1f}x")
+    print(f"mismatches       : {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+# scripts/bench_e2e.py
+"""
+오프라인 end-to-end 처리량 벤치마크.
+
+로컬 가짜 Yahoo RSS 서버(source/fake_rss_server.py)와 가짜 Telegram Bot API
+(telegram/fake_bot_api.py)를 띄우고, 로컬 Postgres 에 대해
+    YahooRssSource -> MicroBatchWriter(insert_articles) -> run_export_and_send
+전체를 티커 수별로 실행해서 다음을 JSON 으로 남긴다.
+    - ingest 처리량(articles/s), 티커별 RSS 요청 지연 p50/p99
+    - export + 텔레그램 전송 시간, 전송 메시지 수
+    - 최대 RSS 메모리(peak RSS, MB)
+티커 수마다 별도 프로세스로 돌려서 peak RSS 가 서로 섞이지 않게 한다.
+벤치 티커(BENCH0000...)로 넣은 행은 끝나면 지운다.
+
+운영 DB 에 쓰고 지우지 않도록, 이름에 "bench" 가 들어간 DB(DB_NAME 또는 --db)에서만 돈다.
+DB 는 미리 만들어 두어야 하고, 마이그레이션은 시작할 때 적용한다.
+
+    python -m scripts.bench_e2e --db FinancialNews_bench         # 10, 100, 1000 티커
+    python -m scripts.bench_e2e --db FinancialNews_bench --tickers 10,100 --error-rate 0.02
+    python -m scripts.bench_e2e --db FinancialNews_bench --json bench_e2e.json   # 커밋 간 비교용 저장
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+TICKER_PREFIX = "BENCH"
+# 이 문자열이 이름에 들어간 DB 에서만 실행한다 (대소문자 무시)
+BENCH_DB_MARKER = "bench"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _delete_bench_rows() -> int:
+    from db.connection import connection
+
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DELETE FROM public.news_history WHERE ticker LIKE %s;",
+                (f"{TICKER_PREFIX}%",),
+            )
+            deleted = cur.rowcount
+            # 키가 남아 있으면 다음 실행에서 같은 기사가 중복으로 취급된다.
+            cur.execute(
+                "DELETE FROM public.news_keys WHERE ticker LIKE %s;",
+                (f"{TICKER_PREFIX}%",),
+            )
+            cur.execute(
+                "DELETE FROM public.ticker_latest WHERE ticker LIKE %s;",
+                (f"{TICKER_PREFIX}%",),
+            )
+            return deleted
+
+
+def run_single(
+    n_tickers: int,
+    latency: float,
+    error_rate: float,
+    items_per_feed: int,
+    chats: int,
+) -> Dict[str, Any]:
+    """티커 n_tickers 개로 한 번 실행하고 결과 dict 를 반환 (현재 프로세스의 설정을 바꾼다)."""
+    from app.config import settings
+    from pipeline.cluster import load_cluster_index
+    from pipeline.deduplicate import load_deduplicator
+    from pipeline.ingest import MicroBatchWriter
+    from scripts import run_export_and_send
+    from source.fake_rss_server import FakeRssServer
+    from source.yahoo_rss import YahooRssSource
+    from telegram.fake_bot_api import FakeBotApi
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_e2e_"))
+    rss_list = work_dir / "rss_list.csv"
+    tickers = [f"{TICKER_PREFIX}{i:04d}" for i in range(n_tickers)]
+    rss_list.write_text(
+        "category,name,ticker\n"
+        + "".join(f"3.종목,Bench Corp {i},{t}\n" for i, t in enumerate(tickers)),
+        encoding="utf-8",
+    )
+
+    rss = FakeRssServer(
+        items_per_feed=items_per_feed, latency=latency, error_rate=error_rate
+    ).start()
+    bot = FakeBotApi().start()
+
+    settings._rss_list_path_env = str(rss_list)
+    settings._state_dir_env = str(work_dir / "state")
+    settings._export_dir_env = str(work_dir / "output")
+    settings.YAHOO_RSS_URL_TEMPLATE = rss.url_template
+    settings.TG_API_BASE = bot.base_url
+    settings.TG_BOT_TOKEN = "BENCH"
+    settings.TG_CHAT_ID = ",".join(str(1000 + i) for i in range(chats))
+    # 실제 서버 한도 대신 처리량 자체를 재기 위해 전송 속도 제한은 사실상 없앤다.
+    settings.TG_RATE_PER_SECOND = 10_000
+    settings.TG_CHAT_RATE_PER_SECOND = 10_000
+
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    class TimedYahooRssSource(YahooRssSource):
+        def fetch_job(self, job):
+            start = time.perf_counter()
+            try:
+                return super().fetch_job(job)
+            finally:
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+
+    try:
+        _delete_bench_rows()
+        source = TimedYahooRssSource()
+        writer = MicroBatchWriter(load_deduplicator(), load_cluster_index())
+
+        start = time.perf_counter()
+        first_write = None
+        for articles in source.iter_articles(heartbeat=writer.max_latency):
+            writer.write(articles)
+            if first_write is None and writer.batches:
+                first_write = time.perf_counter() - start
+        writer.flush()
+        ingest_seconds = time.perf_counter() - start
+        source.save_cache()
+        source.close()
+
+        start = time.perf_counter()
+        run_export_and_send.main()
+        export_send_seconds = time.perf_counter() - start
+    finally:
+        rss.stop()
+        bot.stop()
+        try:
+            _delete_bench_rows()
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    # Linux 에서 ru_maxrss 단위는 KB
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result = writer.result()
+    return {
+        "tickers": n_tickers,
+        "articles_received": writer.received,
+        "articles_inserted": result.inserted,
+        "batches": writer.batches,
+        "rss_requests": rss.requests,
+        "rss_errors": rss.errors,
+        "ingest_seconds": round(ingest_seconds, 4),
+        "first_write_seconds": round(first_write, 4) if first_write is not None else None,
+        "articles_per_sec": round(writer.received / ingest_seconds, 1) if ingest_seconds else 0.0,
+        "ticker_latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 2),
+            "p99": round(_percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies, default=0.0) * 1000, 2),
+        },
+        "export_send_seconds": round(export_send_seconds, 4),
+        "telegram_messages": len(bot.messages()),
+        "telegram_documents": sum(1 for r in bot.requests if r.method == "sendDocument"),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="offline end-to-end benchmark")
+    parser.add_argument("--tickers", default="10,100,1000", help="쉼표로 구분한 티커 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="RSS 응답 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="RSS 500 응답 비율")
+    parser.add_argument("--items", type=int, default=3, help="feed 당 기사 수")
+    parser.add_argument("--chats", type=int, default=2, help="텔레그램 chat 수")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 저장할 JSON 경로")
+    parser.add_argument(
+        "--db",
+        default=None,
+        help=f'벤치 전용 DB 이름 (DB_NAME 대신, 이름에 "{BENCH_DB_MARKER}" 가 들어가야 함)',
+    )
+    parser.add_argument("--single", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # 결과 JSON 은 stdout, 로그는 stderr 로 (WARNING 이상만)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    # settings 는 import 할 때 환경 변수를 읽으므로 그 전에 바꾼다 (--single 하위 프로세스에도 전달).
+    if args.db:
+        os.environ["DB_NAME"] = args.db
+    from app.config import settings
+
+    if BENCH_DB_MARKER not in settings.DB_NAME.lower():
+        parser.error(
+            f"DB_NAME={settings.DB_NAME!r} 은 벤치 전용 DB 가 아닙니다. 이 벤치는 DB 에 행을 넣고 지우므로 "
+            f'이름에 "{BENCH_DB_MARKER}" 가 들어간 DB 를 --db 로 지정하세요.'
+        )
+
+    if args.single is not None:
+        result = run_single(args.single, args.latency, args.error_rate, args.items, args.chats)
+        print(json.dumps(result))
+        return
+
+    from db.migrate import apply_migrations
+
+    apply_migrations()
+
+    results = []
+    for n in [int(x) for x in args.tickers.split(",") if x.strip()]:
+        cmd = [
+            sys.executable, "-m", "scripts.bench_e2e",
+            "--single", str(n),
+            "--latency", str(args.latency),
+            "--error-rate", str(args.error_rate),
+            "--items", str(args.items),
+            "--chats", str(args.chats),
+        ]
+        proc = subprocess.run(
+            cmd, cwd=BASE_DIR, capture_output=True, text=True, env=dict(os.environ)
+        )
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            raise SystemExit(f"bench run with {n} tickers failed")
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print(
+            f"{n:>6} tickers  {result['articles_per_sec']:>9.1f} articles/s  "
+            f"p50 {result['ticker_latency_ms']['p50']:>7.1f} ms  "
+            f"p99 {result['ticker_latency_ms']['p99']:>7.1f} ms  "
+            f"export+send {result['export_send_seconds']:>6.2f} s  "
+            f"peak RSS {result['peak_rss_mb']:>6.1f} MB"
+        )
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "params": {
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "items_per_feed": args.items,
+            "chats": args.chats,
+        },
+        "results": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"saved -> {args.json}")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+# scripts/bench_export_marks.py
+"""
+증분 export high-water mark 오프라인 점검.
+
+DB 없이 메모리 안의 가짜 news_history 로 pipeline.export_daily 의 조회 함수
+(iter_article_chunks_between / fetch_id_stats_between / fetch_cluster_ids_between)를 바꿔 끼우고,
+export_for_date(incremental) / export_delta + advance_mark 를 시나리오대로 돌려서
+매 단계마다 파일의 id 들이 그날 DB 의 id 들과 같은지(= 빠진 행도, 중복된 행도 없는지) 확인한다.
+    - 처음 export / 새 행 없음 / 새 행 덧붙이기
+    - mark 아래 MARK_REREAD_IDS 안쪽에 늦게 커밋된 행 / 그보다 아래에 늦게 커밋된 행
+    - 행 삭제 / DB 복원(최대 id 가 mark 보다 작아짐)
+    - delta 대상(telegram) 과 advance_mark
+    - collapse(유사 기사 묶음)
+    - xlsx: 새 행이 없으면 건너뛰고, 있으면 다시 쓴다
+
+STATE_DIR / EXPORT_DIR 은 임시 디렉터리를 쓴다. 하나라도 어긋나면 exit 1.
+
+    python -m scripts.bench_export_marks [--rows 5000]
+"""
+import argparse
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# settings 는 import 할 때 환경변수를 읽으므로 먼저 임시 디렉터리를 지정한다.
+_TMP = tempfile.TemporaryDirectory(prefix="bench_export_marks_")
+os.environ["STATE_DIR"] = str(Path(_TMP.name) / "state")
+os.environ["EXPORT_DIR"] = str(Path(_TMP.name) / "output")
+os.environ["EXPORT_COLLAPSE_CLUSTERS"] = "0"
+
+from app.metrics import metrics  # noqa: E402
+from pipeline import export_daily  # noqa: E402
+from pipeline.export_daily import (  # noqa: E402
+    FILE_MARK_TARGET,
+    MARK_REREAD_IDS,
+    advance_mark,
+    export_delta,
+    export_for_date,
+    get_mark,
+)
+
+DAY = date(2026, 1, 15)
+TICKERS = ["AAPL", "MSFT", "NVDA", "TSLA", "005930.KS"]
+
+
+class FakeHistory:
+    """news_history 흉내. id 는 호출하는 쪽이 정한다 (늦은 커밋 / 빠진 id 를 만들기 위해)."""
+
+    def __init__(self) -> None:
+        self.rows: Dict[int, Dict[str, Any]] = {}
+
+    def insert(
+        self,
+        ids: Sequence[int],
+        day: date = DAY,
+        cluster: Optional[Callable[[int], Optional[int]]] = None,
+    ) -> None:
+        for i in ids:
+            published_dt = datetime.combine(day, datetime.min.time()) + timedelta(
+                seconds=(i * 37) % 86400
+            )
+            self.rows[i] = {
+                "id": i,
+                "published": published_dt.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+                "published_dt": published_dt,
+                "category": "stock",
+                "ticker": TICKERS[i % len(TICKERS)],
+                "source_name": "bench",
+                "title": f"title {i}",
+                "link": f"https://example.com/{i}",
+                "cluster_id": cluster(i) if cluster else None,
+            }
+
+    def delete(self, ids: Sequence[int]) -> None:
+        for i in ids:
+            del self.rows[i]
+
+    def _between(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        return [r for r in self.rows.values() if start <= r["published_dt"] < end]
+
+    def day_ids(self, day: date = DAY) -> List[int]:
+        start = datetime.combine(day, datetime.min.time())
+        return sorted(r["id"] for r in self._between(start, start + timedelta(days=1)))
+
+    # --- db.repository 대체 ---
+
+    def iter_article_chunks_between(
+        self,
+        start: datetime,
+        end: datetime,
+        chunk_size: int = 2000,
+        after_id: Optional[int] = None,
+        extra_ids: Sequence[int] = (),
+    ) -> Iterator[List[Dict[str, Any]]]:
+        after_id = after_id if after_id is not None else 0
+        extra = set(extra_ids)
+        rows = sorted(
+            (r for r in self._between(start, end) if r["id"] > after_id or r["id"] in extra),
+            key=lambda r: (r["ticker"], r["published_dt"], r["id"]),
+        )
+        for k in range(0, len(rows), chunk_size):
+            yield [dict(r) for r in rows[k:k + chunk_size]]
+
+    def fetch_id_stats_between(
+        self, start: datetime, end: datetime, last_id: int, window: int
+    ) -> Dict[str, Any]:
+        ids = sorted(r["id"] for r in self._between(start, end))
+        return {
+            "seen": sum(1 for i in ids if i <= last_id),
+            "max_id": ids[-1] if ids else 0,
+            "window_ids": [i for i in ids if last_id - window < i <= last_id],
+        }
+
+    def fetch_cluster_ids_between(
+        self, start: datetime, end: datetime, max_id: int, exclude_ids: Sequence[int] = ()
+    ) -> List[int]:
+        exclude = set(exclude_ids)
+        return list(
+            {
+                r["cluster_id"]
+                for r in self._between(start, end)
+                if r["id"] <= max_id and r["cluster_id"] is not None and r["id"] not in exclude
+            }
+        )
+
+
+def _csv_ids(path: Optional[Path]) -> List[int]:
+    if path is None:
+        return []
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [int(row[0]) for row in reader]
+
+
+def _counter(name: str) -> Dict[str, float]:
+    """metrics 카운터 name 의 값을 mode 라벨별로 (라벨이 없으면 "")."""
+    series = metrics.snapshot()["counters"].get(name, [])
+    return {s["labels"].get("mode", ""): s["value"] for s in series}
+
+
+def _expect_mode(c: "Checker", name: str, mode: str) -> None:
+    """방금 단계에서 export_rows_total 이 mode(full / append) 로만 늘었는지."""
+    modes = _counter("export_rows_total")
+    c.expect(name, set(modes) == {mode}, f"modes={modes}")
+
+
+class Checker:
+    def __init__(self) -> None:
+        self.failures: List[str] = []
+
+    def step(self, name: str, fn: Callable[[], Any]) -> Any:
+        metrics.reset()
+        t0 = time.perf_counter()
+        result = fn()
+        print(f"{name:<44} {(time.perf_counter() - t0) * 1000:8.2f} ms")
+        return result
+
+    def expect(self, name: str, ok: bool, detail: str = "") -> None:
+        if not ok:
+            self.failures.append(f"{name}: {detail}")
+            print(f"    FAIL {detail}")
+
+    def same_ids(self, name: str, got: List[int], want: List[int]) -> None:
+        dup = len(got) - len(set(got))
+        missing = sorted(set(want) - set(got))
+        extra = sorted(set(got) - set(want))
+        self.expect(
+            name,
+            not dup and not missing and not extra,
+            f"duplicates={dup} missing={missing[:10]} extra={extra[:10]}",
+        )
+
+
+def _install(db: FakeHistory) -> None:
+    """조회 함수를 db 로 바꾸고, 앞 시나리오의 mark 와 파일을 지운다."""
+    for d in (os.environ["STATE_DIR"], os.environ["EXPORT_DIR"]):
+        shutil.rmtree(d, ignore_errors=True)
+    export_daily.iter_article_chunks_between = db.iter_article_chunks_between
+    export_daily.fetch_id_stats_between = db.fetch_id_stats_between
+    export_daily.fetch_cluster_ids_between = db.fetch_cluster_ids_between
+
+
+def check_file_marks(c: Checker, n: int) -> None:
+    db = FakeHistory()
+    _install(db)
+
+    def export() -> Optional[Path]:
+        path, rows = export_for_date(DAY, fmt="csv", collapse_clusters=False, incremental=True)
+        c.expect("rows", rows == len(db.day_ids()), f"rows={rows} db={len(db.day_ids())}")
+        c.same_ids("csv ids", _csv_ids(path), db.day_ids())
+        return path
+
+    # 100 과 n-10 은 비워 두었다가 나중에 늦은 커밋으로 넣는다. 다른 날짜 행도 섞는다.
+    db.insert([i for i in range(1, n + 1) if i not in (100, n - 10)])
+    db.insert(range(n + 1, n + 51), day=DAY - timedelta(days=1))
+    path = c.step("first export (rebuild)", export)
+    _expect_mode(c, "first", "full")
+
+    mtime = path.stat().st_mtime_ns
+    c.step("no new rows (skip)", export)
+    c.expect("skip", _counter("export_skipped_total") != {}, "not skipped")
+    c.expect("skip", path.stat().st_mtime_ns == mtime, "file rewritten")
+
+    db.insert(range(n + 51, n + 151))
+    c.step("new rows (append)", export)
+    _expect_mode(c, "append", "append")
+
+    # mark 바로 아래(MARK_REREAD_IDS 안쪽)에 늦게 커밋된 행은 다시 읽어서 덧붙인다.
+    db.insert([n - 10])
+    c.step("late commit inside reread window", export)
+    _expect_mode(c, "late", "append")
+
+    # 그보다 아래로 늦게 커밋된 행은 행 수가 맞지 않으므로 처음부터 다시 쓴다.
+    last_id = get_mark(FILE_MARK_TARGET, path.name)["last_id"]
+    c.expect("window", last_id - MARK_REREAD_IDS > 100, f"last_id={last_id} too small")
+    db.insert([100])
+    c.step("late commit below reread window", export)
+    c.expect("late-old", _counter("export_mark_mismatch_total") != {}, "no mismatch")
+
+    db.delete([200, n + 60])
+    c.step("deleted rows (rebuild)", export)
+    c.expect("delete", _counter("export_mark_mismatch_total") != {}, "no mismatch")
+
+    # 백업에서 복원: mark 보다 작은 id 까지만 남는다.
+    db.delete([i for i in db.day_ids() if i > n // 2])
+    c.step("DB restored to older backup (rebuild)", export)
+    c.expect("restore", _counter("export_mark_mismatch_total") != {}, "no mismatch")
+
+    # 복원 뒤 시퀀스가 같은 id 를 다시 내줘도 그대로 따라간다.
+    db.insert(range(n // 2 + 1, n // 2 + 21))
+    c.step("new rows after restore (append)", export)
+    _expect_mode(c, "after-restore", "append")
+
+
+def check_delta(c: Checker, n: int) -> None:
+    db = FakeHistory()
+    _install(db)
+    sent: List[int] = []
+
+    def send() -> None:
+        delta = export_delta(DAY, "telegram", fmt="csv", collapse_clusters=False)
+        sent.extend(_csv_ids(delta.path))
+        advance_mark(delta)
+        c.expect(
+            "total", delta.total_rows == len(sent), f"total={delta.total_rows} sent={len(sent)}"
+        )
+
+    db.insert([i for i in range(1, n + 1) if i != n - 5])
+    c.step("delta: first (whole day)", send)
+    c.same_ids("delta first", sent, db.day_ids())
+
+    c.step("delta: no new rows", send)
+    c.same_ids("delta noop", sent, db.day_ids())
+
+    db.insert([n - 5, *range(n + 1, n + 31)])
+    c.step("delta: new + late rows", send)
+    c.same_ids("delta late", sent, db.day_ids())
+
+    # advance_mark 를 부르지 않으면 (전송 실패) 다음 delta 가 같은 행을 다시 담는다.
+    db.insert(range(n + 31, n + 41))
+    failed = export_delta(DAY, "telegram", fmt="csv", collapse_clusters=False)
+    c.same_ids("delta retry", _csv_ids(failed.path), list(range(n + 31, n + 41)))
+    c.step("delta: retry after failed send", send)
+    c.same_ids("delta retry", sent, db.day_ids())
+
+
+def check_collapse(c: Checker, n: int) -> None:
+    db = FakeHistory()
+    _install(db)
+
+    def cluster(i: int) -> Optional[int]:
+        return i % 97 if i % 3 == 0 else None
+
+    def export() -> None:
+        path, _ = export_for_date(DAY, fmt="csv", collapse_clusters=True, incremental=True)
+        got = _csv_ids(path)
+        rows = {i: db.rows[i] for i in db.day_ids()}
+        plain = [i for i, r in rows.items() if r["cluster_id"] is None]
+        clusters = [rows[i]["cluster_id"] for i in got if rows[i]["cluster_id"] is not None]
+        c.same_ids("collapse plain", [i for i in got if rows[i]["cluster_id"] is None], plain)
+        c.expect(
+            "collapse clusters",
+            sorted(clusters) == sorted({r["cluster_id"] for r in rows.values()} - {None}),
+            f"clusters in file={len(clusters)} distinct={len(set(clusters))}",
+        )
+
+    db.insert([i for i in range(1, n + 1) if i != n - 3], cluster=cluster)
+    c.step("collapse: first export", export)
+    db.insert([n - 3, *range(n + 1, n + 301)], cluster=cluster)
+    c.step("collapse: append + late row", export)
+    _expect_mode(c, "collapse append", "append")
+
+
+def check_xlsx(c: Checker, n: int) -> None:
+    db = FakeHistory()
+    _install(db)
+
+    def export() -> None:
+        _, rows = export_for_date(DAY, fmt="xlsx", collapse_clusters=False, incremental=True)
+        c.expect("xlsx rows", rows == len(db.day_ids()), f"rows={rows} db={len(db.day_ids())}")
+
+    db.insert(range(1, n + 1))
+    c.step("xlsx: first export", export)
+    c.step("xlsx: no new rows (skip)", export)
+    c.expect("xlsx skip", _counter("export_skipped_total") != {}, "not skipped")
+    db.insert([n + 1])
+    # xlsx 는 덧붙이는 경로가 없어서 새 행이 하나라도 있으면 전체를 다시 쓴다.
+    c.step("xlsx: one new row (full rewrite)", export)
+    _expect_mode(c, "xlsx rewrite", "full")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rows", type=int, default=5000,
+        help=f"처음 넣을 행 수 (MARK_REREAD_IDS={MARK_REREAD_IDS} 보다 커야 한다)",
+    )
+    args = parser.parse_args()
+    if args.rows <= MARK_REREAD_IDS + 200:
+        parser.error(f"--rows 는 {MARK_REREAD_IDS + 200} 보다 커야 합니다.")
+
+    c = Checker()
+    try:
+        check_file_marks(c, args.rows)
+        check_delta(c, args.rows)
+        check_collapse(c, args.rows)
+        check_xlsx(c, args.rows)
+    finally:
+        _TMP.cleanup()
+
+    if c.failures:
+        for f in c.failures:
+            print(f"MISMATCH: {f}")
+        sys.exit(1)
+    print("export marks: OK")
+
+
+if __name__ == "__main__":
+    main()
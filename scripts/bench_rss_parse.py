@@ -0,0 +1,133 @@
+# scripts/bench_rss_parse.py
+"""
+Yahoo RSS 파싱 마이크로 벤치마크.
+
+source.yahoo_rss.parse_feed_entries 를 feedparser 만 쓸 때(RSS_FAST_PARSER=0)와
+앞의 item 만 읽는 source.fast_rss 를 먼저 쓸 때(RSS_FAST_PARSER=1)로 비교한다.
+먼저 feed 묶음 전체에서 두 방식의 결과가 완전히 같은지 확인하고, 그 다음 시간을 잰다.
+
+feed 묶음: 가짜 RSS 서버와 같은 형식의 Yahoo 헤드라인 feed + 아래 EDGE_FEEDS
+(엔티티, CDATA, 공백, 날짜 없음, Atom, 깨진 XML 등 feedparser 로 넘겨야 하는 경우 포함)
+
+    python -m scripts.bench_rss_parse [--feeds 200] [--items 20] [--max-items 3] [--repeat 5]
+"""
+import argparse
+import logging
+import time
+from typing import Callable, List
+
+from app.config import settings
+from source.fake_rss_server import FakeRssServer
+from source.fast_rss import read_rss_items
+from source.yahoo_rss import parse_feed_entries
+
+_HEAD = '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>t</title>'
+_TAIL = "</channel></rss>"
+_DATE = "Tue, 18 Nov 2025 14:30:00 +0000"
+
+
+def _item(title: str, link: str = "https://e.com/a.html", date: str = _DATE) -> str:
+    return f"<item><title>{title}</title><link>{link}</link><pubDate>{date}</pubDate></item>"
+
+
+def _rss(*items: str) -> bytes:
+    return (_HEAD + "".join(items) + _TAIL).encode("utf-8")
+
+
+EDGE_FEEDS: List[bytes] = [
+    _rss(_item("AT&amp;T beats"), _item("Q&amp;A: what&#39;s next"), _item("a &gt; b")),
+    _rss(_item("<![CDATA[Apple & Google]]>"), _item("<![CDATA[<b>bold</b> title]]>")),
+    _rss(_item("  spaced\n  title  "), _item("x", link="  https://e.com/sp  ")),
+    _rss(_item("x", date="  Tue, 18 Nov 2025 14:30:00 GMT ")),
+    _rss(_item("no date", date="")),
+    _rss(_item("bad date", date="not a date"), _item("ok")),
+    _rss(_item("")),
+    _rss(_item("emoji 🚀 é 한글")),
+    _rss(_item("escaped &lt;b&gt;tag&lt;/b&gt;")),
+    _rss(_item("link query", link="https://e.com/a?x=1&amp;utm_source=y")),
+    _rss("<item><title>guid only</title><guid>https://e.com/g</guid>"
+         f"<pubDate>{_DATE}</pubDate></item>"),
+    _rss("<item><title>two links</title><link>https://e.com/1</link>"
+         f"<link>https://e.com/2</link><pubDate>{_DATE}</pubDate></item>"),
+    _rss('<item xmlns:media="http://search.yahoo.com/mrss/"><title>media</title>'
+         '<link>https://e.com/m</link><media:title>other</media:title>'
+         f"<pubDate>{_DATE}</pubDate></item>"),
+    _rss(*[_item(f"item {i}", link=f"https://e.com/{i}") for i in range(10)]),
+    _rss(),
+    # RSS 가 아닌 형식 / 깨진 XML
+    b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><entry><title>atom</title>'
+    b'<link href="https://e.com/atom"/><updated>2025-11-18T14:30:00Z</updated></entry></feed>',
+    _rss(_item("ok"))[:-30],
+    _rss(_item("unclosed <b>tag")),
+    b"",
+    "<?xml version='1.0' encoding='ISO-8859-1'?><rss version='2.0'><channel><item>"
+    "<title>caf\xe9</title><link>https://e.com/l1</link>"
+    f"<pubDate>{_DATE}</pubDate></item></channel></rss>".encode("latin-1"),
+]
+
+
+def build_corpus(n_feeds: int, items_per_feed: int) -> List[bytes]:
+    server = FakeRssServer(items_per_feed=items_per_feed).start()
+    try:
+        feeds = [server.feed_xml(f"T{i:04d}") for i in range(n_feeds)]
+    finally:
+        server.stop()
+    return feeds + EDGE_FEEDS
+
+
+def _parse_with(fast: bool, content: bytes, max_items: int):
+    settings.RSS_FAST_PARSER = fast
+    return parse_feed_entries(content, max_items)
+
+
+def _bench(fn: Callable[[bytes], object], corpus: List[bytes], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in corpus:
+            fn(content)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(corpus)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=200, help="Yahoo 형식 feed 수")
+    parser.add_argument("--items", type=int, default=20, help="feed 당 item 수")
+    parser.add_argument("--max-items", type=int, default=3, help="feed 당 사용할 item 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # 일부 EDGE_FEEDS 는 일부러 skip / parse error 경고를 낸다.
+    logging.basicConfig(level=logging.ERROR)
+
+    corpus = build_corpus(args.feeds, args.items)
+
+    mismatches = 0
+    fallbacks = 0
+    for content in corpus:
+        if read_rss_items(content, args.max_items) is None:
+            fallbacks += 1
+        expected = _parse_with(False, content, args.max_items)
+        got = _parse_with(True, content, args.max_items)
+        if expected != got:
+            mismatches += 1
+            print(f"MISMATCH {content[:80]!r}...\n  feedparser={expected}\n  fast={got}")
+
+    settings.RSS_FAST_PARSER = False
+    slow_us = _bench(lambda c: parse_feed_entries(c, args.max_items), corpus, args.repeat)
+    settings.RSS_FAST_PARSER = True
+    fast_us = _bench(lambda c: parse_feed_entries(c, args.max_items), corpus, args.repeat)
+
+    print(f"corpus: {len(corpus)} feeds ({args.feeds} x {args.items} items + "
+          f"{len(EDGE_FEEDS)} edge cases), max_items={args.max_items}, repeat={args.repeat}")
+    print(f"feedparser       : {slow_us:10.1f} us/feed")
+    print(f"fast_rss         : {fast_us:10.1f} us/feed")
+    print(f"speedup          : {slow_us / fast_us:10.1f}x")
+    print(f"feedparser used  : {fallbacks} feed(s) (fast_rss returned None)")
+    print(f"mismatches       : {mismatches}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
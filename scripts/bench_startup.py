@@ -0,0 +1,147 @@
+# scripts/bench_startup.py
+"""
+엔트리 포인트 import 시간 측정 / 예산 검사.
+
+`python -X importtime -c "import <module>"` 를 여러 번 실행해서
+엔트리 포인트 모듈의 누적 import 시간(중앙값)을 재고,
+scripts/startup_budget.json 의 예산과 비교한다.
+무거운 의존성(pandas, psycopg2 등)이 import 시점에 끌려오는지도 확인한다.
+
+    python -m scripts.bench_startup                  # 측정 + 예산 검사 (초과 시 exit 1)
+    python -m scripts.bench_startup --json out.json  # 결과를 JSON 으로 저장
+    python -m scripts.bench_startup --record         # 현재 측정값으로 예산 갱신
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+BUDGET_PATH = Path(__file__).resolve().parent / "startup_budget.json"
+
+ENTRY_POINTS = [
+    "scripts.run_all",
+    "scripts.run_ingest",
+    "scripts.run_export_and_send",
+]
+
+# --record 시 측정값에 곱하는 여유 배수 (머신/캐시 상태 편차 흡수)
+RECORD_HEADROOM = 2.5
+
+
+def _import_profile(module: str) -> Tuple[int, Dict[str, int]]:
+    """
+    모듈 하나를 새 프로세스에서 import 하고
+    (모듈 누적 import 시간 us, {import 된 모듈: 누적 us}) 를 반환.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # 헤더 줄
+        imported[parts[2].strip()] = int(parts[1].strip())
+
+    return imported.get(module, 0), imported
+
+
+def measure(module: str, runs: int) -> Dict:
+    samples: List[int] = []
+    imported: Dict[str, int] = {}
+    for _ in range(runs):
+        total_us, imported = _import_profile(module)
+        samples.append(total_us)
+
+    heaviest = sorted(
+        ((name, us) for name, us in imported.items() if name != module),
+        key=lambda x: x[1],
+        reverse=True,
+    )[:10]
+    return {
+        "module": module,
+        "median_ms": round(statistics.median(samples) / 1000, 2),
+        "min_ms": round(min(samples) / 1000, 2),
+        "max_ms": round(max(samples) / 1000, 2),
+        "imported_modules": sorted(imported),
+        "heaviest": [{"module": n, "cumulative_ms": round(us / 1000, 2)} for n, us in heaviest],
+    }
+
+
+def load_budget() -> Dict:
+    with BUDGET_PATH.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check(results: List[Dict], budget: Dict) -> List[str]:
+    problems: List[str] = []
+    forbidden = set(budget.get("forbidden_modules", []))
+    for r in results:
+        limit = budget.get("budget_ms", {}).get(r["module"])
+        if limit is not None and r["median_ms"] > limit:
+            problems.append(
+                f"{r['module']}: import {r['median_ms']:.1f}ms > budget {limit:.1f}ms"
+            )
+        top_level = sorted(
+            {m.split(".")[0] for m in r["imported_modules"]} & forbidden
+        )
+        if top_level:
+            problems.append(
+                f"{r['module']}: heavy modules imported at startup: {', '.join(top_level)}"
+            )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="entry point import-time budget")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--record", action="store_true", help="측정값으로 예산 갱신")
+    args = parser.parse_args()
+
+    results = [measure(m, args.runs) for m in ENTRY_POINTS]
+
+    for r in results:
+        print(f"{r['module']:<32} median {r['median_ms']:8.2f} ms  (min {r['min_ms']:.2f}, max {r['max_ms']:.2f})")
+        for h in r["heaviest"][:5]:
+            print(f"    {h['module']:<40} {h['cumulative_ms']:8.2f} ms")
+
+    if args.json is not None:
+        payload = [{k: v for k, v in r.items() if k != "imported_modules"} for r in results]
+        args.json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    budget = load_budget()
+    if args.record:
+        budget["budget_ms"] = {
+            r["module"]: round(r["median_ms"] * RECORD_HEADROOM, 1) for r in results
+        }
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+        print(f"budget updated -> {BUDGET_PATH}")
+        return
+
+    problems = check(results, budget)
+    if problems:
+        for p in problems:
+            print(f"OVER BUDGET: {p}")
+        sys.exit(1)
+    print("startup budget: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# scripts/health_report.py
+"""
+feed 작업(티커)별 건강 상태 리포트 (STATE_DIR 의 feed_health*.json, source/health.py).
+
+    python -m scripts.health_report                      # 지금 건너뛰고 있는(circuit open) 작업
+    python -m scripts.health_report --all                # 실패 / 빈 feed 기록이 있는 작업 전부
+    python -m scripts.health_report --json               # 위 내용을 JSON 으로
+    python -m scripts.health_report --reset yahoo:AAPL   # 상태를 지워서 다음 실행에 바로 다시 요청
+"""
+import argparse
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from source.health import FeedHealth, JobHealth
+from source.registry import SOURCE_CLASSES
+
+
+def _fmt_time(ts: Optional[float]) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M") if ts else "-"
+
+
+def collect(show_all: bool, now: float) -> List[Tuple[str, str, JobHealth]]:
+    """(소스 이름, 작업 키, 상태) 목록. show_all 이 아니면 circuit 이 열린 작업만."""
+    rows: List[Tuple[str, str, JobHealth]] = []
+    for name, cls in SOURCE_CLASSES.items():
+        health = FeedHealth(cls.health_file_name)
+        if show_all:
+            items = [
+                (k, h) for k, h in health.items()
+                if h.is_open(now) or h.failures or h.empty_runs
+            ]
+        else:
+            items = health.open_circuits(now)
+        rows.extend((name, key, h) for key, h in items)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="feed health report")
+    parser.add_argument("--all", action="store_true", help="실패 / 빈 feed 기록이 있는 작업 전부")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    parser.add_argument(
+        "--reset",
+        action="append",
+        default=[],
+        metavar="SOURCE:KEY",
+        help="해당 작업의 상태를 지운다 (예: yahoo:AAPL, 여러 번 쓸 수 있음)",
+    )
+    args = parser.parse_args()
+
+    for target in args.reset:
+        name, _, key = target.partition(":")
+        cls = SOURCE_CLASSES.get(name)
+        if cls is None or not key:
+            parser.error(
+                f"--reset 은 SOURCE:KEY 형식이어야 합니다 (소스: {', '.join(SOURCE_CLASSES)})"
+            )
+        health = FeedHealth(cls.health_file_name)
+        found = health.reset(key)
+        health.save()
+        print(f"reset {target}: {'ok' if found else 'not found'}")
+    if args.reset:
+        return
+
+    now = time.time()
+    rows = collect(args.all, now)
+
+    if args.json:
+        data = [
+            dict(source=name, key=key, skipping=h.is_open(now), **asdict(h))
+            for name, key, h in rows
+        ]
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+        return
+
+    if not rows:
+        print("no unhealthy feeds" if args.all else "no feeds are being skipped")
+        return
+
+    print(
+        f"{'source':<11} {'key':<12} {'status':<8} {'fail':>4} {'empty':>5} "
+        f"{'latency':>8} {'skip until':<16} {'last ok':<16} last error"
+    )
+    for name, key, h in rows:
+        latency = f"{h.latency_ewma:.2f}s" if h.latency_ewma is not None else "-"
+        print(
+            f"{name:<11} {key:<12} {h.last_status:<8} {h.failures:>4} {h.empty_runs:>5} "
+            f"{latency:>8} {_fmt_time(h.skip_until if h.is_open(now) else None):<16} "
+            f"{_fmt_time(h.last_ok):<16} {h.last_error or ''}"
+        )
+    skipping = sum(1 for _, _, h in rows if h.is_open(now))
+    print(f"\n{skipping} feed(s) skipped until their cool-down expires")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 # scripts/run_all.py
 import logging
+import resource
+import sys
+import time
 
 from app.logging_config import setup_logging
+from app.metrics import metrics, profiling, write_report
+from db.migrate import ensure_schema
 from pipeline.ingest import run_ingest
 from scripts import run_export_and_send as export_and_send
 
@@ -9,30 +14,56 @@ from scripts import run_export_and_send as export_and_send
 logger = logging.getLogger(__name__)
 
 
+def _run_stage(name: str, func) -> bool:
+    """단계 하나를 실행하고 소요 시간과 성공 여부를 metrics 에 남긴다."""
+    start = time.perf_counter()
+    try:
+        func()
+        return True
+    except Exception as e:
+        logger.exception("%s 실행 중 예외 발생: %s", name, e)
+        metrics.inc("run_stage_failures_total", stage=name)
+        return False
+    finally:
+        metrics.observe("run_stage_seconds", time.perf_counter() - start, stage=name)
+
+
 def main():
     setup_logging()
     logger.info("===== FinancialNewsCrawler: run_all start =====")
+    metrics.reset()
 
-    # 1) RSS → DB 저장
-    try:
-        logger.info("Step 1/2: ingest (RSS -> DB) 시작")
-        run_ingest()
-        logger.info("Step 1/2: ingest 완료")
-    except Exception as e:
-        logger.exception("ingest 실행 중 예외 발생: %s", e)
-        # 여기서 바로 return 하면 export/send는 생략
-        return
+    with profiling("run_all") as profile:
+        # 0) 스키마 확인 (DB 에 접속할 수 없어도 metrics report 는 남기고 exit 1)
+        schema_ok = ensure_schema()
+        if not schema_ok:
+            metrics.inc("run_stage_failures_total", stage="schema")
+
+        # 1) RSS → DB 저장
+        ok = schema_ok
+        if ok:
+            logger.info("Step 1/2: ingest (RSS -> DB) 시작")
+            ok = _run_stage("ingest", run_ingest)
+        if ok:
+            logger.info("Step 1/2: ingest 완료")
+
+            # 2) DB → 텍스트 요약 + 엑셀 → 텔레그램
+            # (ingest 가 실패하면 export/send 는 생략)
+            logger.info("Step 2/2: export_and_send (DB -> Telegram) 시작")
+            if _run_stage("export_and_send", export_and_send.main):
+                logger.info("Step 2/2: export_and_send 완료")
 
-    # 2) DB → 텍스트 요약 + 엑셀 → 텔레그램
+    # Linux 에서 ru_maxrss 단위는 KB
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
     try:
-        logger.info("Step 2/2: export_and_send (DB -> Telegram) 시작")
-        export_and_send.main()
-        logger.info("Step 2/2: export_and_send 완료")
+        write_report("run_all", extra={"peak_rss_mb": round(peak_rss_mb, 1), **profile})
     except Exception as e:
-        logger.exception("export_and_send 실행 중 예외 발생: %s", e)
+        logger.exception("metrics report 저장 실패: %s", e)
 
     logger.info("===== FinancialNewsCrawler: run_all finished =====")
+    if not schema_ok:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,10 @@
+# scripts/run_daemon.py
+from pipeline.daemon import run_daemon
+
+
+def main():
+    run_daemon()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# scripts/run_export.py
+"""
+DB -> 파일 내보내기만 따로 실행 (텔레그램 전송 없음).
+
+    python -m scripts.run_export                                   # 오늘, EXPORT_FORMAT
+    python -m scripts.run_export --start 2025-11-01 --end 2025-11-30 --format parquet
+    python -m scripts.run_export --collapse-clusters                # 유사 기사 묶음당 1건
+"""
+import argparse
+from datetime import date
+
+from app.logging_config import setup_logging
+from pipeline.export_daily import SUPPORTED_FORMATS, export_range
+
+
+def main():
+    parser = argparse.ArgumentParser(description="news_history export")
+    parser.add_argument("--start", type=date.fromisoformat, default=None)
+    parser.add_argument("--end", type=date.fromisoformat, default=None)
+    parser.add_argument("--format", choices=SUPPORTED_FORMATS, default=None)
+    parser.add_argument(
+        "--collapse-clusters",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="유사 기사 묶음당 1건만 내보내기 (기본: EXPORT_COLLAPSE_CLUSTERS)",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+
+    start = args.start or date.today()
+    end = args.end or start
+    file_path, row_count = export_range(
+        start, end, fmt=args.format, collapse_clusters=args.collapse_clusters
+    )
+    print(f"{row_count} rows -> {file_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,77 @@
 # scripts/run_export_and_send.py
 from datetime import date
+import html
 import logging
-from typing import List, Dict, Any, Dict as TypingDict
+from typing import List, Dict, Any, Optional, Set
 
+from app.config import settings
 from app.logging_config import setup_logging
-from db.repository import (
-    fetch_articles_for_date,
-    fetch_latest_articles_for_ticker,
+from db.repository import day_range, fetch_ticker_latest
+from pipeline.cluster import collapse_rows
+from pipeline.export_daily import (
+    FILE_MARK_TARGET,
+    advance_mark,
+    export_delta,
+    export_for_date,
+    get_mark,
 )
-from pipeline.export_daily import export_for_date
-from telegram.sender import send_file, send_message
+from telegram.sender import send_file, send_message, send_messages
 from rss_config.loader import load_rss_list
 
 logger = logging.getLogger(__name__)
 
+# export_delta 의 high-water mark 이름 (마지막으로 텔레그램에 보낸 행)
+TELEGRAM_EXPORT_TARGET = "telegram"
+# 티커별 요약에 보여줄 기사 수 (ticker_latest 에는 TICKER_LATEST_SIZE 개까지 있다)
+SUMMARY_MAX_ITEMS = 3
+
 
 def format_ticker_summary(
     ticker: str,
     display_name: str,
     rows: List[Dict[str, Any]],
     max_items: int = 3,
+    seen_clusters: Optional[Set[int]] = None,
 ) -> str:
     """
     한 종목에 대한 뉴스 요약 메시지 포맷팅.
+    seen_clusters 를 넘기면 같은 묶음(cluster_id)의 기사는 한 번만 보여주고,
+    이미 앞 종목 요약에 나온 묶음도 건너뛴다 (보여준 묶음은 seen_clusters 에 추가).
     예전 스타일:
     📢 [Fermi America LLC 뉴스 요약]
 
     🔹 [YYYY-MM-DD HH:MM] 제목
     URL
+    메시지는 parse_mode=HTML 로 보내므로 이름 / 제목 / 링크는 HTML escape 한다
+    (여러 종목이 한 메시지로 묶이므로 제목 하나가 깨지면 묶인 종목 전체가 거부된다).
     """
     if not rows:
         return ""
 
-    header_name = display_name or ticker
+    header_name = html.escape(display_name or ticker)
     lines: List[str] = [f"📢 [{header_name} 뉴스 요약]"]
 
-    # 최신 뉴스가 위로 오도록 정렬
+    # 최신 뉴스가 위로 오도록 정렬 (ticker_latest 에서 온 행은 이미 이 순서라 거의 비용이 없다)
     rows_sorted = sorted(
         rows,
         key=lambda r: r.get("published_dt"),
         reverse=True,
     )
 
-    for r in rows_sorted[:max_items]:
+    if seen_clusters is not None:
+        rows_sorted = collapse_rows(rows_sorted, set(seen_clusters))
+    rows_shown = rows_sorted[:max_items]
+    if not rows_shown:
+        return ""
+    if seen_clusters is not None:
+        seen_clusters.update(
+            r["cluster_id"] for r in rows_shown if r.get("cluster_id") is not None
+        )
+
+    for r in rows_shown:
         dt = r.get("published_dt")
-        title = (r.get("title") or "").strip()
-        link = (r.get("link") or "").strip()
+        title = html.escape((r.get("title") or "").strip())
+        link = html.escape((r.get("link") or "").strip())
 
         dt_str = dt.strftime("%Y-%m-%d %H:%M") if dt else "알 수 없음"
 
@@ -59,32 +85,33 @@ def main():
     target_date = date.today()
     logger.info("run_export_and_send: target_date=%s", target_date)
 
-    # 1) 오늘자 기사 전체 조회 (엑셀 + "오늘 뉴스 있는 티커" 용)
-    todays_rows = fetch_articles_for_date(target_date)
-    logger.info("fetch_articles_for_date(%s): %d rows", target_date, len(todays_rows))
-
-    # 오늘자 전체가 하나도 없어도 => fallback 로직 때문에 바로 리턴하지 않는다.
-
-    # 2) 오늘자 기사들을 티커별로 그룹핑
-    today_groups: TypingDict[str, List[Dict[str, Any]]] = {}
-    for r in todays_rows:
-        t = (r.get("ticker") or "").upper()
-        today_groups.setdefault(t, []).append(r)
-
-    # 3) rss_list.xlsx 기준으로 관심 티커들 순서대로 처리
+    # 1) rss_list.xlsx 기준 관심 티커들의 최신 기사
+    # ticker_latest 요약 테이블에서 인덱스 조회 한 번으로 가져온다 (news_history 크기와 무관).
     feeds = load_rss_list()  # ticker, name, category 등 포함
-    summary_sent = 0
+    if settings.TICKER_LATEST_SIZE < SUMMARY_MAX_ITEMS:
+        logger.warning(
+            "TICKER_LATEST_SIZE=%d 이 요약 기사 수(%d)보다 작아 티커별 요약이 %d건까지만 나옵니다.",
+            settings.TICKER_LATEST_SIZE,
+            SUMMARY_MAX_ITEMS,
+            settings.TICKER_LATEST_SIZE,
+        )
+    latest_groups = fetch_ticker_latest([feed.ticker.upper() for feed in feeds])
+    day_start, day_end = day_range(target_date)
+
+    summaries: List[str] = []
+    # SUMMARY_COLLAPSE_CLUSTERS: 여러 티커에 걸친 같은 기사는 처음 나온 티커에서만 보여준다.
+    seen_clusters: Optional[Set[int]] = set() if settings.SUMMARY_COLLAPSE_CLUSTERS else None
 
+    # 2) 관심 티커들 순서대로 처리
     for feed in feeds:
         ticker = feed.ticker.upper()
         display_name = feed.name
+        latest_rows = latest_groups.get(ticker, [])
 
         # (1) 우선 오늘 뉴스가 있는지 확인
-        rows_for_ticker = today_groups.get(ticker, [])
-
-        # (2) 오늘 뉴스가 0개면 => DB 전체에서 가장 최근 N개 가져오기
-        if not rows_for_ticker:
-            rows_for_ticker = fetch_latest_articles_for_ticker(ticker, limit=3)
+        # (2) 오늘 뉴스가 0개면 => 날짜와 관계없이 가장 최근 기사들 사용
+        todays_rows = [r for r in latest_rows if day_start <= r["published_dt"] < day_end]
+        rows_for_ticker = todays_rows or latest_rows
 
         # (3) DB 전체에도 하나도 없으면 => 아직 해당 티커는 기사 없음, 스킵
         if not rows_for_ticker:
@@ -94,10 +121,20 @@ def main():
             )
             continue
 
-        summary = format_ticker_summary(ticker, display_name, rows_for_ticker, max_items=3)
+        summary = format_ticker_summary(
+            ticker,
+            display_name,
+            rows_for_ticker,
+            max_items=SUMMARY_MAX_ITEMS,
+            seen_clusters=seen_clusters,
+        )
         if summary:
-            send_message(summary)
-            summary_sent += 1
+            summaries.append(summary)
+
+    # 티커별 요약을 4096자 한도 안에서 묶어서 한 번에 전송
+    summary_sent = len(summaries)
+    if summaries:
+        send_messages(summaries)
 
     if summary_sent == 0:
         # 정말로 아무 티커에도 뉴스가 없을 때만 안내 메시지
@@ -121,8 +158,28 @@ def main():
     )
 
     # 5) 엑셀 파일 텔레그램 전송
+    if settings.EXPORT_SEND_DELTA:
+        # 하루 전체 대신 마지막 전송 이후 새로 저장된 기사만 보낸다.
+        delta = export_delta(target_date, TELEGRAM_EXPORT_TARGET)
+        if delta.path is None:
+            logger.info(
+                "run_export_and_send: 마지막 전송 이후 새 뉴스가 없어 파일 전송을 생략합니다."
+            )
+            return
+        caption = (
+            f"[FinancialNewsCrawler] {target_date.isoformat()} 새 뉴스 {delta.row_count}건"
+            f"(오늘 누적 {delta.total_rows}건)을 첨부합니다."
+        )
+        cache_key = f"{TELEGRAM_EXPORT_TARGET}:{delta.path.name}:{delta.last_id}:{delta.row_count}"
+        if send_file(delta.path, caption=caption, cache_key=cache_key):
+            advance_mark(delta)
+        return
+
     caption = f"[FinancialNewsCrawler] {target_date.isoformat()} 뉴스 {row_count}건(오늘 기준)을 첨부합니다."
-    send_file(file_path, caption=caption)
+    # 증분 export 면 파일 mark(마지막 id, 행 수)가 같을 때 파일 내용도 같다.
+    mark = get_mark(FILE_MARK_TARGET, file_path.name) if settings.EXPORT_INCREMENTAL else None
+    cache_key = f"{file_path.name}:{mark['last_id']}:{mark['rows']}" if mark else None
+    send_file(file_path, caption=caption, cache_key=cache_key)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+# scripts/run_maintenance.py
+"""
+news_history 파티션 관리 작업 (cron 등으로 하루 한 번 정도 실행).
+
+    python -m scripts.run_maintenance                           # 파티션 생성 + 보존 기간 정리
+    python -m scripts.run_maintenance --retention-months 24     # PARTITION_RETENTION_MONTHS 대신
+    python -m scripts.run_maintenance --no-archive              # gzip CSV 없이 바로 DROP
+    python -m scripts.run_maintenance --dry-run                 # 지울 파티션만 출력
+    python -m scripts.run_maintenance --rebuild-ticker-latest   # TICKER_LATEST_SIZE 변경 후
+"""
+import argparse
+import logging
+
+from app.logging_config import setup_logging
+from db.partitions import apply_retention, ensure_partitions, list_partitions
+from db.repository import rebuild_ticker_latest
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="news_history partition maintenance")
+    parser.add_argument("--months-ahead", type=int, default=None, help="미리 만들 달 수")
+    parser.add_argument(
+        "--retention-months", type=int, default=None, help="보존 기간(개월), 0 이면 정리 안 함"
+    )
+    parser.add_argument(
+        "--archive",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="지우기 전에 ARCHIVE_DIR 에 gzip CSV 로 저장 (기본: PARTITION_ARCHIVE)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="지울 파티션만 출력")
+    parser.add_argument(
+        "--rebuild-ticker-latest",
+        action="store_true",
+        help="ticker_latest 요약 테이블을 TICKER_LATEST_SIZE 기준으로 다시 채우기",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+
+    if args.rebuild_ticker_latest and not args.dry_run:
+        rows = rebuild_ticker_latest()
+        logger.info("maintenance: ticker_latest rebuilt (%d rows)", rows)
+
+    if not args.dry_run:
+        created = ensure_partitions(months_ahead=args.months_ahead)
+        logger.info("maintenance: %d partition(s) created", len(created))
+
+    dropped = apply_retention(
+        retention_months=args.retention_months,
+        archive=args.archive,
+        dry_run=args.dry_run,
+    )
+    logger.info(
+        "maintenance: %d partition(s) %s",
+        len(dropped),
+        "to drop" if args.dry_run else "dropped",
+    )
+
+    for p in list_partitions():
+        print(
+            f"{p.name:<28} {p.start:%Y-%m-%d} ~ {p.end:%Y-%m-%d}"
+            + ("" if p.attached else "  (detached)")
+        )
+
+
+if __name__ == "__main__":
+    main()
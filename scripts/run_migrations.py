@@ -0,0 +1,40 @@
+# scripts/run_migrations.py
+"""
+DB 스키마 마이그레이션 적용 / 확인.
+
+    python -m scripts.run_migrations            # 미적용 마이그레이션 모두 적용
+    python -m scripts.run_migrations --target 1 # 0001 까지만 적용
+    python -m scripts.run_migrations --verify   # 적용 없이 스키마만 확인
+"""
+import argparse
+import logging
+import sys
+
+from app.logging_config import setup_logging
+from db.migrate import apply_migrations, verify_schema
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="news_history schema migrations")
+    parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    parser.add_argument("--verify", action="store_true", help="적용하지 않고 확인만")
+    args = parser.parse_args()
+
+    setup_logging()
+
+    if not args.verify:
+        apply_migrations(target=args.target)
+
+    problems = verify_schema(target=args.target)
+    if problems:
+        for p in problems:
+            logger.error("schema check: %s", p)
+        sys.exit(1)
+
+    logger.info("schema check: OK")
+
+
+if __name__ == "__main__":
+    main()
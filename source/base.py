@@ -0,0 +1,560 @@
+# source/base.py
+"""
+뉴스 소스 공통 틀.
+
+소스 하나는 "작업(job)" 목록을 가지고 있고 (Yahoo: 티커별 feed, PR Newswire: feed URL),
+작업마다 fetch(job) 로 원본을 받아 parse(job, content) 로 NewsArticle 리스트를 만든다.
+세션 / 조건부 GET 캐시 / 동시 요청 수 제한 / 작업별 예외 격리 / 소요 시간 집계 /
+일시적 오류 재시도 / 작업별 건강 상태와 circuit breaker(source/health.py)는
+여기서 공통으로 처리하므로, 새 소스는 jobs / job_url / parse 만 구현하면 된다.
+
+parse 대신 parse_raw(모듈 수준 함수: 본문 -> 작은 튜플 리스트) + build_articles 로 나눠 두면
+작업이 PARSE_POOL_MIN_JOBS 개 이상일 때 parse_raw 를 process pool 에서 돌린다 (GIL 회피).
+pool 워커의 metrics 는 부모 프로세스와 따로라서 parse_raw 안에서 metrics 를 남기면 사라진다.
+parse 시간은 워커에서 재서 결과와 함께 돌려받아 부모가 기록한다.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.config import settings
+from app.metrics import metrics
+from app.models import NewsArticle
+from source.feed_cache import FeedCache, content_hash
+from source.health import FeedHealth
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# 재시도 사이에 쉬는 시간 상한(초)
+RETRY_MAX_SECONDS = 10.0
+
+
+def _retry_after_seconds(resp: "requests.Response") -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 기다릴 초로. 없거나 읽을 수 없으면 None."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def parse_pool_size() -> int:
+    """PARSE_PROCESSES (0 이면 이 프로세스가 쓸 수 있는 코어 수). 1 이하면 pool 을 쓰지 않는다."""
+    if settings.PARSE_PROCESSES > 0:
+        return settings.PARSE_PROCESSES
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_parse_worker(level: int) -> None:
+    """parse pool 워커 초기화: 부모와 같은 형식 / 레벨로 로그를 남긴다 (feed 파싱 경고 등)."""
+    from app.logging_config import setup_logging
+
+    setup_logging(level)
+
+
+def _timed_parse(parse_raw: Callable[..., List[Tuple]], *args: Any) -> Tuple[List[Tuple], float]:
+    """pool 워커에서 parse_raw 를 실행하고 (결과, 걸린 시간) 을 반환."""
+    start = time.perf_counter()
+    rows = parse_raw(*args)
+    return rows, time.perf_counter() - start
+
+
+def create_parse_pool(workers: int) -> Executor:
+    """
+    parse 용 process pool. 수집 스레드와 DB 풀이 이미 떠 있는 프로세스를 fork 하면
+    다른 스레드가 잡고 있던 lock 까지 복사되므로 forkserver 로 깨끗한 프로세스에서 띄운다.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    if ctx.get_start_method() == "forkserver":
+        # 워커마다 feedparser 를 다시 import 하지 않도록 forkserver 에서 미리 불러둔다.
+        ctx.set_forkserver_preload(["feedparser", "source.yahoo_rss"])
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_parse_worker,
+        initargs=(logging.getLogger().getEffectiveLevel(),),
+    )
+
+
+@dataclass
+class SourceStats:
+    """소스 하나의 실행 통계. busy_seconds 는 작업별 소요 시간의 합, wall_seconds 는 실제 경과 시간."""
+    jobs: int = 0
+    articles: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    # circuit breaker 로 요청하지 않고 건너뛴 작업 수
+    skipped: int = 0
+    busy_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+
+class BaseSource:
+    # ENABLED_SOURCES 에 쓰는 이름과 news_history.source_name 에 들어갈 이름
+    name = "base"
+    source_name = ""
+    # 티커별로 따로 요청하는 소스인지 (daemon 의 티커별 적응형 폴링 대상)
+    per_ticker = False
+    # 조건부 GET 캐시 파일 (소스마다 따로 둬야 서로 덮어쓰지 않는다)
+    cache_file_name = "rss_http_cache.json"
+    # 작업별 건강 상태 파일 (cache_file_name 과 같은 이유로 소스마다 따로)
+    health_file_name = "feed_health.json"
+    # 기사가 하나도 없는 feed 를 이상 신호로 볼지 (Yahoo: 티커가 잘못됐거나 상장 폐지)
+    health_track_empty = False
+    # 본문 bytes (+ raw_args) -> 작은 튜플 리스트로 바꾸는 모듈 수준 함수 (pickle 가능해야 함).
+    # None 이면 이 소스는 항상 자기 프로세스에서 parse 한다.
+    parse_raw: Optional[Callable[..., List[Tuple]]] = None
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        use_cache: Optional[bool] = None,
+    ):
+        # 이 소스 안에서 동시에 진행할 요청 수 (1 이하면 순차 처리)
+        self.max_workers = max(1, max_workers or self.default_concurrency())
+        self.timeout = timeout or settings.RSS_FETCH_TIMEOUT
+        self._session: Optional["requests.Session"] = None
+        if use_cache is None:
+            use_cache = settings.RSS_HTTP_CACHE
+        # 조건부 GET 캐시 (304 / 본문 해시 동일이면 파싱과 DB 작업을 건너뜀)
+        self.cache: Optional[FeedCache] = (
+            FeedCache(self.cache_file_name) if use_cache else None
+        )
+        self.health: Optional[FeedHealth] = (
+            FeedHealth(self.health_file_name) if settings.HEALTH_ENABLED else None
+        )
+        self.stats = SourceStats()
+        self._stats_lock = threading.Lock()
+        self._parse_pool: Optional[Executor] = None
+
+    # ---- 소스별로 구현하는 부분 ----
+
+    def default_concurrency(self) -> int:
+        return settings.RSS_FETCH_CONCURRENCY
+
+    def jobs(self) -> List[Any]:
+        """이번 실행에서 처리할 작업 목록."""
+        raise NotImplementedError
+
+    def job_label(self, job: Any) -> str:
+        return str(job)
+
+    def job_url(self, job: Any) -> str:
+        raise NotImplementedError
+
+    def job_key(self, job: Any) -> str:
+        """metrics label 에 쓸 짧은 작업 이름 (Yahoo: 티커)."""
+        return str(job)
+
+    def parse(self, job: Any, content: bytes) -> List[NewsArticle]:
+        if self.parse_raw is None:
+            raise NotImplementedError
+        return self.build_articles(job, self.parse_raw(content, *self.raw_args(job)))
+
+    def raw_args(self, job: Any) -> Tuple:
+        """parse_raw 에 본문 다음으로 넘길 인자 (pickle 가능한 값만)."""
+        return ()
+
+    def build_articles(self, job: Any, rows: List[Tuple]) -> List[NewsArticle]:
+        """parse_raw 결과를 NewsArticle 리스트로."""
+        raise NotImplementedError
+
+    # ---- 공통 ----
+
+    def _get_session(self) -> "requests.Session":
+        """
+        keep-alive 커넥션을 재사용하는 세션.
+        이 소스의 모든 워커 스레드가 하나의 커넥션 풀(max_workers 크기)을 공유한다.
+        """
+        if self._session is None:
+            # requests 는 import 비용이 커서 실제로 요청할 때 불러온다.
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.max_workers,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"User-Agent": "Mozilla/5.0"})
+            self._session = session
+        return self._session
+
+    def _start_parse_pool(self, jobs: Iterable[Any]) -> None:
+        """
+        작업이 PARSE_POOL_MIN_JOBS 개 이상이고 코어가 2개 이상일 때만 parse pool 을 띄운다.
+        작업이 적으면 프로세스를 띄우는 비용이 parse 시간보다 커서 그냥 이 프로세스에서 한다.
+        """
+        if self.parse_raw is None or self._parse_pool is not None:
+            return
+        n_jobs = len(jobs) if hasattr(jobs, "__len__") else 0
+        workers = parse_pool_size()
+        if workers <= 1 or n_jobs < settings.PARSE_POOL_MIN_JOBS:
+            return
+        self._parse_pool = create_parse_pool(workers)
+        logger.info("%s: parse pool started (%d processes)", type(self).__name__, workers)
+
+    def _stop_parse_pool(self, wait: bool = True) -> None:
+        pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def save_cache(self) -> None:
+        """DB 저장이 끝난 뒤 호출해서 feed 검증 값(ETag 등)을 파일에 반영."""
+        if self.cache is not None:
+            self.cache.save()
+
+    def save_health(self) -> None:
+        if self.health is not None:
+            self.health.save()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def reset_stats(self) -> None:
+        """stats / 캐시 hit 수를 0 으로. daemon 처럼 한 인스턴스로 여러 번 폴링할 때 폴링마다 부른다."""
+        with self._stats_lock:
+            self.stats = SourceStats()
+        if self.cache is not None:
+            self.cache.reset_counts()
+
+    def _add_stats(self, **deltas: float) -> None:
+        with self._stats_lock:
+            for k, v in deltas.items():
+                setattr(self.stats, k, getattr(self.stats, k) + v)
+
+    def _metric_labels(self, job: Any) -> Dict[str, str]:
+        if settings.METRICS_PER_JOB:
+            return {"source": self.name, "job": self.job_key(job)}
+        return {"source": self.name}
+
+    def _get_with_retries(
+        self, url: str, headers: Dict[str, str], labels: Dict[str, str]
+    ) -> "requests.Response":
+        """
+        GET 요청. 연결 실패 / 429 / 5xx 는 RSS_FETCH_RETRIES 번까지
+        RSS_RETRY_BACKOFF * 2^n 초에 지터(0.5~1배)를 곱한 만큼 쉬고 다시 요청한다.
+        응답에 Retry-After 가 있으면 그만큼 쉰다 (둘 다 RETRY_MAX_SECONDS 까지).
+        timeout 은 이미 timeout 초를 기다린 뒤라 재시도하지 않는다
+        (계속 그러면 circuit breaker 가 그 작업을 건너뛴다).
+        마지막 응답을 상태 코드 확인 없이 반환하고, 요청 자체가 실패하면 예외를 올린다.
+        """
+        import requests
+
+        retries = max(0, settings.RSS_FETCH_RETRIES)
+        attempt = 0
+        while True:
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                resp = self._get_session().get(url, timeout=self.timeout, headers=headers)
+            except Exception as e:
+                # 연결 실패 / timeout 은 응답 코드가 없다.
+                metrics.observe("rss_http_seconds", time.perf_counter() - start, **labels)
+                metrics.inc("rss_http_requests_total", source=self.name, status="error")
+                retryable = isinstance(e, requests.ConnectionError) and not isinstance(
+                    e, requests.Timeout
+                )
+                if not retryable or attempt >= retries:
+                    raise
+                logger.info("  -> %s: %s, retrying", url, e)
+            else:
+                metrics.observe("rss_http_seconds", time.perf_counter() - start, **labels)
+                metrics.inc("rss_http_bytes_total", len(resp.content), **labels)
+                metrics.inc("rss_http_requests_total", source=self.name, status=resp.status_code)
+                if not (resp.status_code == 429 or resp.status_code >= 500) or attempt >= retries:
+                    return resp
+                retry_after = _retry_after_seconds(resp)
+                logger.info(
+                    "  -> %s: HTTP %d, retrying%s",
+                    url,
+                    resp.status_code,
+                    f" after {retry_after:.1f}s (Retry-After)" if retry_after is not None else "",
+                )
+
+            metrics.inc("rss_http_retries_total", source=self.name)
+            if retry_after is not None:
+                time.sleep(min(RETRY_MAX_SECONDS, retry_after))
+            else:
+                delay = min(RETRY_MAX_SECONDS, settings.RSS_RETRY_BACKOFF * 2 ** attempt)
+                time.sleep(delay * (0.5 + random.random() / 2))
+            attempt += 1
+
+    def http_get(
+        self,
+        url: str,
+        label: str,
+        labels: Optional[Dict[str, str]] = None,
+        health_key: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """
+        url 을 (캐시가 있으면 조건부로) 받아서 본문을 반환.
+        304 이거나 본문이 지난번과 같거나 요청이 실패하면 None.
+        labels 를 주면 요청 시간 / 받은 바이트 / 결과를 metrics 에 남긴다.
+        health_key 를 주면 실패 / 304 / 본문 그대로를 그 작업의 건강 상태에 기록한다
+        (본문을 받은 경우는 parse 결과를 보고 fetch_job 이 기록한다).
+        """
+        labels = labels if labels is not None else {"source": self.name}
+        health = self.health if health_key is not None else None
+        headers = self.cache.request_headers(url) if self.cache else {}
+        start = time.perf_counter()
+        try:
+            resp = self._get_with_retries(url, headers, labels)
+            if resp.status_code == 304:
+                if self.cache is not None:
+                    self.cache.record(hit=True)
+                    logger.info("  -> %s: not modified (304), skip", label)
+                else:
+                    # 조건부 헤더를 보내지 않았는데 304 가 왔다. 재사용할 본문이 없으므로 건너뛴다.
+                    logger.warning(
+                        "  -> %s: 304 without a conditional request (no feed cache), skip", label
+                    )
+                self._add_stats(not_modified=1)
+                if health is not None:
+                    self._record_unchanged(url, health_key, time.perf_counter() - start)
+                return None
+            resp.raise_for_status()
+        except Exception as e:
+            self._add_stats(errors=1)
+            if health is not None:
+                health.record_failure(health_key, str(e), time.perf_counter() - start)
+            logger.warning("  -> HTTP request failed for %s: %s", url, e)
+            return None
+
+        # 서버가 검증 헤더를 주지 않아도 본문이 같으면 파싱하지 않는다.
+        if self.cache is not None:
+            digest = content_hash(resp.content)
+            unchanged = self.cache.is_unchanged(url, digest)
+            self.cache.record(hit=unchanged)
+            self.cache.update(url, resp.headers, digest)
+            if unchanged:
+                metrics.inc("rss_body_unchanged_total", source=self.name)
+                self._add_stats(not_modified=1)
+                if health is not None:
+                    self._record_unchanged(url, health_key, time.perf_counter() - start)
+                logger.info("  -> %s: body unchanged, skip", label)
+                return None
+
+        return resp.content
+
+    def _record_unchanged(self, url: str, health_key: str, latency: float) -> None:
+        """
+        304 / 본문 그대로를 건강 상태에 기록. 조건부 요청이 켜져 있으면 죽은 feed 는
+        매번 "변경 없음" 이 되므로, 지난번 본문의 기사 수로 빈 feed 여부를 판단한다.
+        """
+        count = self.cache.article_count(url) if self.cache is not None else None
+        if count is None:
+            self.health.record_not_modified(health_key, latency)
+        else:
+            self.health.record_success(
+                health_key, latency, empty=self.health_track_empty and count == 0
+            )
+
+    def fetch_job(self, job: Any) -> List[NewsArticle]:
+        """작업 하나를 받아서 NewsArticle 리스트로 변환."""
+        url = self.job_url(job)
+        label = self.job_label(job)
+        labels = self._metric_labels(job)
+        health_key = self.job_key(job) if self.health is not None else None
+        logger.info("Fetching %s for %s: %s", self.name, label, url)
+        start = time.perf_counter()
+        content = self.http_get(url, label, labels, health_key)
+        if content is None:
+            return []
+        http_seconds = time.perf_counter() - start
+        articles = None
+        pool = self._parse_pool
+        if pool is not None:
+            from concurrent.futures.process import BrokenProcessPool
+
+            try:
+                # 이 워커 스레드는 결과를 기다리기만 하고 CPU 작업은 다른 프로세스에서 한다.
+                # rss_parse_seconds 는 pool 대기 시간을 빼고 워커에서 잰 parse 시간만 남긴다.
+                rows, parse_seconds = pool.submit(
+                    _timed_parse, self.parse_raw, content, *self.raw_args(job)
+                ).result()
+                metrics.observe("rss_parse_seconds", parse_seconds, **labels)
+                articles = self.build_articles(job, rows)
+            except BrokenProcessPool as e:
+                logger.warning("%s: parse pool broken, parsing in-process: %s", self.name, e)
+                self._stop_parse_pool(wait=False)
+        if articles is None:
+            with metrics.timer("rss_parse_seconds", **labels):
+                articles = self.parse(job, content)
+        metrics.inc("rss_articles_total", len(articles), **labels)
+        if self.cache is not None:
+            self.cache.set_article_count(url, len(articles))
+        if health_key is not None:
+            self.health.record_success(
+                health_key, http_seconds, empty=self.health_track_empty and not articles
+            )
+        return articles
+
+    def _fetch_job_safe(self, job: Any) -> List[NewsArticle]:
+        """
+        작업 하나에서 예외가 나도 전체 수집은 계속되도록 격리하고 소요 시간을 잰다.
+        circuit 이 열린 작업은 요청하지 않고 빈 리스트를 돌려준다.
+        """
+        if self.health is not None and not self.health.allow(self.job_key(job)):
+            self._add_stats(jobs=1, skipped=1)
+            metrics.inc("source_jobs_skipped_total", source=self.name)
+            logger.info("  -> %s: circuit open, skip", self.job_label(job))
+            return []
+
+        start = time.perf_counter()
+        try:
+            articles = self.fetch_job(job)
+        except Exception as e:
+            self._add_stats(errors=1)
+            metrics.inc("source_job_errors_total", source=self.name)
+            if self.health is not None:
+                self.health.record_failure(self.job_key(job), f"{type(e).__name__}: {e}")
+            logger.exception(
+                "  -> unexpected error while fetching %s: %s", self.job_label(job), e
+            )
+            articles = []
+        self._add_stats(
+            jobs=1,
+            articles=len(articles),
+            busy_seconds=time.perf_counter() - start,
+        )
+        return articles
+
+    def iter_articles(
+        self,
+        jobs: Optional[Iterable[Any]] = None,
+        max_in_flight: Optional[int] = None,
+        heartbeat: Optional[float] = None,
+    ) -> Iterator[List[NewsArticle]]:
+        """
+        작업별 기사 리스트를 끝나는 순서대로 하나씩 yield 하는 스트리밍 수집.
+
+        동시에 진행 중인 요청은 max_in_flight(기본: 워커 수의 2배) 개로 제한하고,
+        소비하는 쪽이 다음 값을 가져가야 다음 작업을 요청하므로
+        DB 저장이 느리면 수집도 그만큼 천천히 진행된다 (backpressure).
+        heartbeat(초)를 주면 그 시간 동안 끝난 작업이 없을 때 빈 리스트를 yield 해서
+        소비하는 쪽이 시간 기준 flush 를 할 수 있게 한다.
+        """
+        if jobs is None:
+            jobs = self.jobs()
+        max_in_flight = max(1, max_in_flight or self.max_workers * 2)
+        self._start_parse_pool(jobs)
+        job_iter = iter(jobs)
+        started = time.perf_counter()
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"{self.name}-src",
+            ) as executor:
+                pending = set()
+
+                def fill() -> None:
+                    while len(pending) < max_in_flight:
+                        job = next(job_iter, None)
+                        if job is None:
+                            return
+                        pending.add(executor.submit(self._fetch_job_safe, job))
+
+                fill()
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=heartbeat, return_when=FIRST_COMPLETED
+                    )
+                    if not done:
+                        yield []
+                        continue
+                    for future in done:
+                        yield future.result()
+                    fill()
+        finally:
+            self._stop_parse_pool()
+            self.save_health()
+
+        self._add_stats(wall_seconds=time.perf_counter() - started)
+        self.log_stats()
+
+    def fetch_articles(self, jobs: Optional[Iterable[Any]] = None) -> List[NewsArticle]:
+        """
+        jobs(기본: self.jobs()) 를 모두 처리해서 기사 리스트로 반환.
+        executor.map 은 입력 순서대로 결과를 돌려주므로 결과는 작업 순서를 유지한다.
+        """
+        if jobs is None:
+            jobs = self.jobs()
+        jobs = list(jobs)
+        logger.info(
+            "%s: %d job(s) (workers=%d)", type(self).__name__, len(jobs), self.max_workers
+        )
+
+        started = time.perf_counter()
+        self._start_parse_pool(jobs)
+        try:
+            if self.max_workers <= 1 or len(jobs) <= 1:
+                results = [self._fetch_job_safe(j) for j in jobs]
+            else:
+                workers = min(self.max_workers, len(jobs))
+                with ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"{self.name}-src",
+                ) as executor:
+                    results = list(executor.map(self._fetch_job_safe, jobs))
+        finally:
+            self._stop_parse_pool()
+            self.save_health()
+        self._add_stats(wall_seconds=time.perf_counter() - started)
+
+        articles: List[NewsArticle] = [a for chunk in results for a in chunk]
+        self.log_stats()
+        return articles
+
+    def log_stats(self) -> None:
+        s = self.stats
+        if self.cache is not None:
+            logger.info(
+                "%s: conditional GET cache hit=%d miss=%d",
+                type(self).__name__,
+                self.cache.hits,
+                self.cache.misses,
+            )
+        logger.info(
+            "%s: jobs=%d articles=%d not_modified=%d errors=%d skipped=%d wall=%.2fs busy=%.2fs",
+            type(self).__name__,
+            s.jobs,
+            s.articles,
+            s.not_modified,
+            s.errors,
+            s.skipped,
+            s.wall_seconds,
+            s.busy_seconds,
+        )
@@ -0,0 +1,142 @@
+# source/fake_rss_server.py
+"""
+로컬 테스트/벤치마크용 가짜 Yahoo Finance RSS 서버.
+
+/rss/2.0/headline?s=<ticker> 로 요청하면 티커마다 고정된 합성 기사 items_per_feed 개를
+Yahoo 와 같은 RSS 2.0 형식으로 돌려준다. pubDate 는 서버를 띄운 시각 기준이라
+"오늘 기사" 로 export / 요약 단계까지 그대로 흘러간다.
+latency(초)만큼 늦게 응답하고, error_rate 비율로 500 을 돌려준다.
+
+    server = FakeRssServer(latency=0.05, error_rate=0.01).start()
+    settings.YAHOO_RSS_URL_TEMPLATE = server.url_template
+    ...
+    server.stop()
+"""
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+_WORDS = (
+    "shares stock rally slump earnings revenue guidance outlook analysts upgrade "
+    "downgrade dividend buyback merger acquisition deal lawsuit recall launch chip "
+    "cloud ai software energy oil bank rate fed inflation jobs report quarter record "
+    "investors market futures bond yield china europe tariff supply demand forecast"
+).split()
+
+
+class FakeRssServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        items_per_feed: int = 3,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.items_per_feed = items_per_feed
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.requests = 0
+        self.errors = 0
+        self._feeds: Dict[str, bytes] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url_template(self) -> str:
+        """settings.YAHOO_RSS_URL_TEMPLATE 에 넣을 값."""
+        return f"{self.base_url}/rss/2.0/headline?s={{ticker}}&region=US&lang=en-US"
+
+    def start(self) -> "FakeRssServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def feed_xml(self, ticker: str) -> bytes:
+        """티커별 RSS 본문. 같은 티커는 항상 같은 내용 (ETag/해시 캐시 테스트용)."""
+        with self._lock:
+            body = self._feeds.get(ticker)
+        if body is not None:
+            return body
+
+        rng = random.Random(f"{self.seed}:{ticker}")
+        items = []
+        for i in range(self.items_per_feed):
+            title = f"{ticker} " + " ".join(rng.sample(_WORDS, 8))
+            published = self.now - timedelta(minutes=5 * i + rng.randrange(5))
+            items.append(
+                "<item>"
+                f"<title>{escape(title)}</title>"
+                f"<link>https://finance.example.com/news/{escape(ticker.lower())}-{i}.html</link>"
+                f"<pubDate>{format_datetime(published)}</pubDate>"
+                f"<guid isPermaLink=\"false\">{escape(ticker)}-{i}</guid>"
+                "</item>"
+            )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            f"<title>Yahoo! Finance: {escape(ticker)} News</title>"
+            "<link>https://finance.yahoo.com</link>"
+            f"{''.join(items)}"
+            "</channel></rss>"
+        ).encode("utf-8")
+        with self._lock:
+            self._feeds[ticker] = body
+        return body
+
+    def _handle(self, path: str):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            fail = self.error_rate and self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if fail:
+            return 500, b"internal error"
+
+        parts = urlsplit(path)
+        ticker = (parse_qs(parts.query).get("s") or [""])[0]
+        if parts.path != "/rss/2.0/headline" or not ticker:
+            return 404, b"not found"
+        return 200, self.feed_xml(ticker)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status, body = server._handle(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,75 @@
+# source/fast_rss.py
+"""
+RSS 2.0 item 앞부분만 읽는 가벼운 파서.
+
+Yahoo 헤드라인 feed 는 기사 20개 정도를 주는데 우리는 앞의 max_per_ticker(기본 3)개만 쓴다.
+feedparser 는 항상 feed 전체를 읽어 entry 트리를 다 만들기 때문에,
+XMLPullParser 로 본문을 조금씩 넣으면서 <item> 이 max_items 개 끝나는 즉시 멈춘다.
+
+feedparser 와 결과가 달라질 수 있는 feed 는 처리하지 않고 None 을 돌려준다
+(호출한 쪽이 feedparser 로 다시 파싱한다).
+    - XML 오류 (feedparser 의 bozo 에 해당)
+    - 최상위 요소가 <rss> 가 아닌 feed (Atom, RSS 1.0/RDF)
+    - title/link/pubDate 가 없거나 같은 item 에 두 번 나오는 item
+    - title/link 에 태그('<')가 남은 item (feedparser 가 HTML 로 보고 정리할 수 있는 값)
+"""
+from typing import List, Optional, Tuple
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+# 한 번에 parser 에 넣을 바이트 수. 작을수록 일찍 멈추지만 호출 횟수가 늘어난다.
+CHUNK_SIZE = 4096
+
+_FIELDS = ("title", "link", "pubDate")
+
+# (title, link, pubDate) 원문. feedparser 처럼 앞뒤 공백만 정리한 값.
+RssItem = Tuple[str, str, str]
+
+
+def read_rss_items(content: bytes, max_items: int) -> Optional[List[RssItem]]:
+    """
+    content 의 앞쪽 item 최대 max_items 개를 (title, link, pubDate) 로 반환.
+    feedparser 로 넘겨야 하는 feed 면 None.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    items: List[RssItem] = []
+    depth = 0
+    in_item = False
+    fields = {}
+
+    try:
+        for offset in range(0, len(content), CHUNK_SIZE):
+            parser.feed(content[offset:offset + CHUNK_SIZE])
+            for event, elem in parser.read_events():
+                tag = elem.tag
+                if event == "start":
+                    depth += 1
+                    if depth == 1 and tag != "rss":
+                        return None
+                    if depth == 3 and tag == "item":
+                        in_item = True
+                        fields = {}
+                    continue
+
+                # event == "end"
+                depth -= 1
+                if in_item and depth == 3 and tag in _FIELDS:
+                    if tag in fields or len(elem):
+                        return None
+                    fields[tag] = (elem.text or "").strip()
+                elif in_item and depth == 2 and tag == "item":
+                    in_item = False
+                    if len(fields) != len(_FIELDS):
+                        return None
+                    title, link = fields["title"], fields["link"]
+                    if "<" in title or "<" in link:
+                        return None
+                    items.append((title, link, fields["pubDate"]))
+                    if len(items) >= max_items:
+                        return items
+                    # 다 읽은 item 은 메모리에서 치운다.
+                    elem.clear()
+        parser.close()
+    except ParseError:
+        return None
+
+    return items
@@ -0,0 +1,110 @@
+# source/feed_cache.py
+import hashlib
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, Mapping, Optional
+
+from app.state import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "rss_http_cache.json"
+
+
+@dataclass
+class FeedValidators:
+    """feed URL 하나에 대해 마지막으로 받은 응답의 검증 값."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    # 그 본문에서 나온 기사 수 (304 / 본문 그대로일 때 빈 feed 인지 판단용, 모르면 None)
+    articles: Optional[int] = None
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class FeedCache:
+    """
+    RSS feed 조건부 요청(If-None-Match / If-Modified-Since) 캐시.
+
+    update() 로 바뀐 값은 메모리에만 쌓아두고, save() 를 호출해야 파일에 반영된다.
+    DB 저장이 끝난 뒤에 save() 해야 "변경 없음" 으로 판단해 건너뛴 기사가
+    DB 에 빠지는 일이 없다.
+    """
+
+    def __init__(self, file_name: str = CACHE_FILE_NAME):
+        self.file_name = file_name
+        raw = load_json(file_name, {})
+        self._entries: Dict[str, FeedValidators] = {
+            url: FeedValidators(**v) for url, v in raw.items()
+        }
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            v = self._entries.get(url)
+        headers: Dict[str, str] = {}
+        if v is None:
+            return headers
+        if v.etag:
+            headers["If-None-Match"] = v.etag
+        if v.last_modified:
+            headers["If-Modified-Since"] = v.last_modified
+        return headers
+
+    def is_unchanged(self, url: str, digest: str) -> bool:
+        with self._lock:
+            v = self._entries.get(url)
+        return v is not None and v.content_hash == digest
+
+    def update(self, url: str, headers: Mapping[str, str], digest: str) -> None:
+        with self._lock:
+            old = self._entries.get(url)
+            self._entries[url] = FeedValidators(
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+                content_hash=digest,
+                # 본문이 같으면 기사 수도 같다.
+                articles=old.articles if old is not None and old.content_hash == digest else None,
+            )
+            self._dirty = True
+
+    def article_count(self, url: str) -> Optional[int]:
+        """지난번에 받은 본문의 기사 수 (모르면 None)."""
+        with self._lock:
+            v = self._entries.get(url)
+        return v.articles if v is not None else None
+
+    def set_article_count(self, url: str, count: int) -> None:
+        with self._lock:
+            v = self._entries.get(url)
+            if v is not None and v.articles != count:
+                v.articles = count
+                self._dirty = True
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {url: asdict(v) for url, v in self._entries.items()}
+            self._dirty = False
+        path = save_json(self.file_name, data)
+        logger.info("FeedCache: saved %d feed validators -> %s", len(data), path)
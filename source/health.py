@@ -0,0 +1,215 @@
+# source/health.py
+"""
+작업(티커 / feed)별 건강 상태와 circuit breaker.
+
+- 작업마다 연속 실패 수, 연속 빈 feed 수, 응답 시간(EWMA), 마지막 오류를 기록한다.
+- 연속 실패가 HEALTH_FAILURE_THRESHOLD 번(빈 feed 는 HEALTH_EMPTY_THRESHOLD 번)이 되면
+  circuit 을 열고 cooldown 동안 그 작업은 요청하지 않고 건너뛴다.
+  cooldown 은 HEALTH_COOLDOWN_SECONDS 에서 시작해서 다시 열릴 때마다 두 배
+  (최대 HEALTH_MAX_COOLDOWN_SECONDS).
+- cooldown 이 지나면 한 번 시도해 본다 (half-open). 성공하면 circuit 을 닫고,
+  실패하면 바로 더 긴 cooldown 으로 다시 연다.
+
+FeedCache 처럼 기록은 메모리에만 쌓고 save() 를 호출해야 STATE_DIR 에 반영된다.
+"""
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.metrics import metrics
+from app.state import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+HEALTH_FILE_NAME = "feed_health.json"
+# 이 기간(초) 동안 한 번도 시도하지 않은 작업(rss_list 에서 빠진 티커 등)은 저장할 때 버린다.
+FORGET_SECONDS = 30 * 24 * 3600
+# 응답 시간 EWMA 가중치
+LATENCY_ALPHA = 0.3
+# 저장할 오류 메시지 최대 길이
+MAX_ERROR_LENGTH = 200
+
+
+@dataclass
+class JobHealth:
+    """작업 하나의 상태. 시각은 모두 epoch 초."""
+    # 연속 실패 / 연속 빈 feed 횟수 (성공하면 0)
+    failures: int = 0
+    empty_runs: int = 0
+    total_failures: int = 0
+    # ok / empty / error / skipped
+    last_status: str = ""
+    last_error: Optional[str] = None
+    last_attempt: Optional[float] = None
+    last_ok: Optional[float] = None
+    latency_ewma: Optional[float] = None
+    # circuit 이 열려 있으면 이 시각까지 건너뛴다 (0 이면 닫힘)
+    skip_until: float = 0.0
+    # 닫힌 뒤로 연속해서 열린 횟수 (cooldown 지수 증가용)
+    opened: int = 0
+
+    def is_open(self, now: float) -> bool:
+        return self.skip_until > now
+
+
+class FeedHealth:
+    """소스 하나의 작업별 JobHealth 모음 (thread-safe)."""
+
+    def __init__(self, file_name: str = HEALTH_FILE_NAME):
+        self.file_name = file_name
+        raw = load_json(file_name, {})
+        known = {f.name for f in fields(JobHealth)}
+        self._entries: Dict[str, JobHealth] = {
+            key: JobHealth(**{k: v for k, v in value.items() if k in known})
+            for key, value in raw.items()
+        }
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[JobHealth]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        """key 작업을 이번에 요청해도 되는지. circuit 이 열려 있으면 False."""
+        now = time.time() if now is None else now
+        with self._lock:
+            h = self._entries.get(key)
+            if h is None or not h.is_open(now):
+                return True
+            h.last_status = "skipped"
+            self._dirty = True
+        return False
+
+    def _entry(self, key: str, now: float, latency: Optional[float]) -> JobHealth:
+        h = self._entries.get(key)
+        if h is None:
+            h = self._entries[key] = JobHealth()
+        h.last_attempt = now
+        if latency is not None:
+            h.latency_ewma = (
+                latency
+                if h.latency_ewma is None
+                else LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * h.latency_ewma
+            )
+        self._dirty = True
+        return h
+
+    def _open(self, key: str, h: JobHealth, now: float, reason: str) -> None:
+        cooldown = min(
+            settings.HEALTH_MAX_COOLDOWN_SECONDS,
+            settings.HEALTH_COOLDOWN_SECONDS * 2 ** h.opened,
+        )
+        h.opened += 1
+        h.skip_until = now + cooldown
+        metrics.inc("source_circuit_opened_total", reason=reason)
+        logger.warning(
+            "health: circuit open for %s (%s, failures=%d, empty=%d), skip for %.0fs",
+            key,
+            reason,
+            h.failures,
+            h.empty_runs,
+            cooldown,
+        )
+
+    def record_success(
+        self,
+        key: str,
+        latency: Optional[float] = None,
+        empty: bool = False,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        요청 성공. empty 면 feed 에 기사가 하나도 없었던 것으로,
+        HEALTH_EMPTY_THRESHOLD 번 연속이면 circuit 을 연다 (상장 폐지 / 잘못된 티커).
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            h = self._entry(key, now, latency)
+            h.failures = 0
+            h.last_error = None
+            if empty:
+                h.empty_runs += 1
+                h.last_status = "empty"
+                if h.empty_runs >= settings.HEALTH_EMPTY_THRESHOLD:
+                    self._open(key, h, now, "empty")
+                return
+            if h.opened:
+                logger.info("health: circuit closed for %s", key)
+            h.empty_runs = 0
+            h.last_status = "ok"
+            h.last_ok = now
+            h.skip_until = 0.0
+            h.opened = 0
+
+    def record_not_modified(self, key: str, latency: Optional[float] = None) -> None:
+        """
+        304 / 본문 그대로인데 그 본문의 기사 수를 모를 때 (기사 수를 알면 record_success 를 쓴다).
+        서버는 정상이므로 circuit 은 닫지만, 빈 feed 인지는 모르므로 빈 feed 횟수는 그대로 둔다.
+        """
+        now = time.time()
+        with self._lock:
+            h = self._entry(key, now, latency)
+            if h.opened:
+                logger.info("health: circuit closed for %s (not modified)", key)
+            h.failures = 0
+            h.last_error = None
+            h.last_status = "ok"
+            h.last_ok = now
+            h.skip_until = 0.0
+            h.opened = 0
+
+    def record_failure(
+        self,
+        key: str,
+        error: str,
+        latency: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """요청 실패 (재시도까지 모두 실패). 연속 HEALTH_FAILURE_THRESHOLD 번이면 circuit 을 연다."""
+        now = time.time() if now is None else now
+        with self._lock:
+            h = self._entry(key, now, latency)
+            h.failures += 1
+            h.total_failures += 1
+            h.last_status = "error"
+            h.last_error = error[:MAX_ERROR_LENGTH]
+            if h.failures >= settings.HEALTH_FAILURE_THRESHOLD:
+                self._open(key, h, now, "error")
+
+    def reset(self, key: str) -> bool:
+        """key 의 상태를 지운다 (circuit 을 바로 닫을 때). 있었으면 True."""
+        with self._lock:
+            found = self._entries.pop(key, None) is not None
+            self._dirty = self._dirty or found
+        return found
+
+    def open_circuits(self, now: Optional[float] = None) -> List[Tuple[str, JobHealth]]:
+        """지금 건너뛰고 있는 작업들 (skip_until 이 늦은 순)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            items = [(k, h) for k, h in self._entries.items() if h.is_open(now)]
+        return sorted(items, key=lambda kv: kv[1].skip_until, reverse=True)
+
+    def items(self) -> List[Tuple[str, JobHealth]]:
+        with self._lock:
+            return sorted(self._entries.items())
+
+    def save(self) -> None:
+        now = time.time()
+        with self._lock:
+            if not self._dirty:
+                return
+            for key in [
+                k
+                for k, h in self._entries.items()
+                if h.last_attempt is not None and now - h.last_attempt > FORGET_SECONDS
+            ]:
+                del self._entries[key]
+            data = {key: asdict(h) for key, h in self._entries.items()}
+            self._dirty = False
+        path = save_json(self.file_name, data)
+        logger.info("FeedHealth: saved %d job state(s) -> %s", len(data), path)
@@ -0,0 +1,117 @@
+# source/prnewswire_rss.py
+"""
+PR Newswire 보도자료 RSS 소스.
+
+PR Newswire 는 티커별 feed 가 없어서 전체/분야별 feed(PRNEWSWIRE_FEEDS)를 받아
+제목과 요약에 나오는 "(NASDAQ: AAPL)", "NYSE: F" 같은 거래소 표기에서 티커를 찾고,
+rss_list 에 있는 티커에 해당하는 보도자료만 기사로 만든다.
+보도자료 하나가 여러 티커를 언급하면 티커마다 한 건씩 만든다.
+"""
+import logging
+import re
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.dates import parse_published
+from app.models import NewsArticle
+from rss_config.loader import RssFeedConfig, load_rss_list
+from source.base import BaseSource
+
+logger = logging.getLogger(__name__)
+
+# 거래소: 티커 표기. 거래소 이름은 대소문자 무시, 티커는 대문자만.
+_TICKER_RE = re.compile(
+    r"\b(?i:NASDAQ(?:GS|GM|CM)?|NYSE(?:\s+American|\s+Arca|\s+MKT)?|AMEX|"
+    r"OTC(?:QX|QB|\s+Pink)?|CBOE|TSXV?)\s*:\s*([A-Z][A-Z0-9]{0,5}(?:[.\-][A-Z]{1,2})?)\b"
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def find_tickers(text: str) -> List[str]:
+    """본문에서 거래소 표기로 나온 티커들을 (순서 유지, 중복 제거) 반환."""
+    seen: Dict[str, None] = {}
+    for m in _TICKER_RE.finditer(text or ""):
+        seen.setdefault(m.group(1).upper(), None)
+    return list(seen)
+
+
+class PrNewswireRssSource(BaseSource):
+    name = "prnewswire"
+    source_name = "PR Newswire"
+    cache_file_name = "rss_http_cache_prnewswire.json"
+    health_file_name = "feed_health_prnewswire.json"
+
+    def __init__(
+        self,
+        feed_urls: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        use_cache: Optional[bool] = None,
+    ):
+        super().__init__(max_workers=max_workers, timeout=timeout, use_cache=use_cache)
+        if feed_urls is None:
+            feed_urls = [u.strip() for u in settings.PRNEWSWIRE_FEEDS.split(",") if u.strip()]
+        self.feed_urls = feed_urls
+
+    def default_concurrency(self) -> int:
+        return settings.PRNEWSWIRE_FETCH_CONCURRENCY
+
+    def jobs(self) -> List[str]:
+        return list(self.feed_urls)
+
+    def job_url(self, url: str) -> str:
+        return url
+
+    def parse(self, url: str, content: bytes) -> List[NewsArticle]:
+        import feedparser
+
+        parsed = feedparser.parse(content)
+        if getattr(parsed, "bozo", False):
+            logger.warning(
+                "  -> feed parse error for %s: %s",
+                url,
+                getattr(parsed, "bozo_exception", None),
+            )
+
+        # rss_list 는 (경로, mtime, 크기) 캐시라 매번 불러도 파일을 다시 읽지 않는다.
+        watched: Dict[str, RssFeedConfig] = {f.ticker.upper(): f for f in load_rss_list()}
+
+        articles: List[NewsArticle] = []
+        for entry in parsed.entries:
+            title = (entry.get("title") or "").strip()
+            summary = _TAG_RE.sub(" ", entry.get("summary") or "")
+            tickers = [t for t in find_tickers(f"{title} {summary}") if t in watched]
+            if not tickers:
+                continue
+
+            published_raw = entry.get("published", "") or entry.get("pubDate", "")
+            published_dt = parse_published(published_raw) if published_raw else None
+            if published_dt is None:
+                logger.warning(
+                    "  -> skip entry with missing/unparseable date '%s': %s",
+                    published_raw,
+                    title,
+                )
+                continue
+
+            for ticker in tickers:
+                feed_cfg = watched[ticker]
+                articles.append(
+                    NewsArticle(
+                        published_raw=published_raw,
+                        published_dt=published_dt,
+                        category=feed_cfg.category,
+                        ticker=feed_cfg.ticker,
+                        source_name=self.source_name,
+                        title=title,
+                        link=(entry.get("link") or "").strip(),
+                    )
+                )
+
+        logger.info(
+            "  -> %s: %d entries, %d matched watched tickers",
+            url,
+            len(parsed.entries),
+            len(articles),
+        )
+        return articles
@@ -0,0 +1,33 @@
+# source/registry.py
+import logging
+from typing import Dict, List, Optional, Type
+
+from app.config import settings
+from source.base import BaseSource
+from source.prnewswire_rss import PrNewswireRssSource
+from source.yahoo_rss import YahooRssSource
+
+logger = logging.getLogger(__name__)
+
+# ENABLED_SOURCES 에 쓸 수 있는 이름 -> 소스 클래스
+SOURCE_CLASSES: Dict[str, Type[BaseSource]] = {
+    cls.name: cls for cls in (YahooRssSource, PrNewswireRssSource)
+}
+
+
+def enabled_source_names() -> List[str]:
+    return [n.strip().lower() for n in settings.ENABLED_SOURCES.split(",") if n.strip()]
+
+
+def load_sources(names: Optional[List[str]] = None) -> List[BaseSource]:
+    """names(기본: ENABLED_SOURCES)에 해당하는 소스 인스턴스들. 모르는 이름이면 ValueError."""
+    names = enabled_source_names() if names is None else names
+    unknown = [n for n in names if n not in SOURCE_CLASSES]
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 소스입니다: {', '.join(unknown)} "
+            f"(가능: {', '.join(SOURCE_CLASSES)})"
+        )
+    sources = [SOURCE_CLASSES[n]() for n in dict.fromkeys(names)]
+    logger.info("enabled sources: %s", ", ".join(s.name for s in sources))
+    return sources
@@ -1,112 +1,132 @@
 # source/yahoo_rss.py
 import logging
-from typing import List
-
-import dateparser
-import feedparser
-import requests
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from app.config import settings
+from app.dates import parse_published
 from app.models import NewsArticle
-from rss_config.loader import load_rss_list
+from rss_config.loader import RssFeedConfig, load_rss_list
+from source.base import BaseSource
+from source.fast_rss import RssItem, read_rss_items
 
 logger = logging.getLogger(__name__)
 
-# 야후가 실제로 사용하는 feed 서버 주소
-YAHOO_RSS_TEMPLATE = (
-    "https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
-)
-
+# (published_raw, published_dt, title, link): process pool 에서 돌려받기 좋은 작은 형태
+RawEntry = Tuple[str, datetime, str, str]
+
+
+def _feedparser_items(content: bytes, max_items: int, label: str) -> List[RssItem]:
+    """feedparser 로 feed 전체를 파싱해서 앞의 max_items 개를 (title, link, pubDate) 로."""
+    import feedparser
+
+    parsed = feedparser.parse(content)
+
+    if getattr(parsed, "bozo", False):
+        logger.warning(
+            "  -> feed parse error for %s: %s",
+            label,
+            getattr(parsed, "bozo_exception", None),
+        )
+
+    return [
+        (
+            entry.get("title") or "",
+            entry.get("link") or "",
+            # pubDate 또는 published 필드에서 날짜 문자열 추출
+            entry.get("published", "") or entry.get("pubDate", ""),
+        )
+        for entry in parsed.entries[:max_items]
+    ]
+
+
+def parse_feed_entries(content: bytes, max_items: int, label: str = "") -> List[RawEntry]:
+    """
+    Yahoo RSS 본문에서 최신 max_items 개 기사를 RawEntry 로 뽑는다.
+    티커 정보 없이 본문만으로 동작하는 모듈 수준 함수라 parse process pool 에 그대로 보낼 수 있다.
+    RSS_FAST_PARSER 이면 앞의 item 만 읽는 fast_rss 를 먼저 쓰고,
+    그걸로 처리할 수 없는 feed 만 feedparser 로 파싱한다.
+    """
+    items = read_rss_items(content, max_items) if settings.RSS_FAST_PARSER else None
+    if items is None:
+        items = _feedparser_items(content, max_items, label)
+
+    rows: List[RawEntry] = []
+    for title, link, published_raw in items:
+        if not published_raw:
+            logger.warning("  -> skip entry without published/pubDate: %s", title)
+            continue
+
+        # timestamp without time zone 컬럼에 맞추기 위해 UTC 로 변환 후 tz 제거
+        published_dt = parse_published(published_raw)
+        if published_dt is None:
+            logger.warning(
+                "  -> skip entry with unparseable date '%s': %s",
+                published_raw,
+                title,
+            )
+            continue
 
-class YahooRssSource:
-    source_name = "Yahoo Finance"
+        rows.append((published_raw, published_dt, title.strip(), link.strip()))
 
-    def __init__(self, max_per_ticker: int = 3):
-        # 각 티커별로 가져올 최대 기사 개수
-        self.max_per_ticker = max_per_ticker
+    return rows
 
-    def fetch_articles(self) -> List[NewsArticle]:
-        feeds = load_rss_list()
-        logger.info("YahooRssSource: loaded %d tickers from rss_list.xlsx", len(feeds))
 
-        articles: List[NewsArticle] = []
+class YahooRssSource(BaseSource):
+    """rss_list 의 티커마다 Yahoo Finance 헤드라인 RSS 를 하나씩 요청하는 소스."""
 
-        for feed_cfg in feeds:
-            url = YAHOO_RSS_TEMPLATE.format(ticker=feed_cfg.ticker)
-            logger.info(
-                "Fetching RSS for %s (%s): %s",
-                feed_cfg.name,
-                feed_cfg.ticker,
-                url,
-            )
+    name = "yahoo"
+    source_name = "Yahoo Finance"
+    per_ticker = True
+    cache_file_name = "rss_http_cache.json"
+    health_file_name = "feed_health.json"
+    health_track_empty = True
+    parse_raw = staticmethod(parse_feed_entries)
+
+    def __init__(
+        self,
+        max_per_ticker: int = 3,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        use_cache: Optional[bool] = None,
+    ):
+        super().__init__(max_workers=max_workers, timeout=timeout, use_cache=use_cache)
+        # 각 티커별로 가져올 최대 기사 개수
+        self.max_per_ticker = max_per_ticker
 
-            # 1) HTTP로 RSS 내용을 가져온다.
-            try:
-                resp = requests.get(
-                    url,
-                    timeout=10,
-                    headers={"User-Agent": "Mozilla/5.0"},
-                )
-                resp.raise_for_status()
-            except Exception as e:
-                logger.warning("  -> HTTP request failed for %s: %s", url, e)
-                continue
-
-            # 2) feedparser 로 파싱
-            parsed = feedparser.parse(resp.content)
-
-            if getattr(parsed, "bozo", False):
-                logger.warning(
-                    "  -> feed parse error for %s: %s",
-                    url,
-                    getattr(parsed, "bozo_exception", None),
-                )
-
-            # 3) 최신 max_per_ticker 개만 사용
-            entries = parsed.entries[: self.max_per_ticker]
-            logger.info(
-                "  -> %d entries returned, taking %d",
-                len(parsed.entries),
-                len(entries),
+    def jobs(self) -> List[RssFeedConfig]:
+        return load_rss_list()
+
+    def job_label(self, feed_cfg: RssFeedConfig) -> str:
+        return f"{feed_cfg.name} ({feed_cfg.ticker})"
+
+    def job_key(self, feed_cfg: RssFeedConfig) -> str:
+        return feed_cfg.ticker
+
+    def job_url(self, feed_cfg: RssFeedConfig) -> str:
+        # 기본값은 야후가 실제로 사용하는 feed 서버 주소 (settings.YAHOO_RSS_URL_TEMPLATE)
+        return settings.YAHOO_RSS_URL_TEMPLATE.format(ticker=feed_cfg.ticker)
+
+    def fetch_feed(self, feed_cfg: RssFeedConfig) -> List[NewsArticle]:
+        """티커 하나의 RSS 를 가져와 NewsArticle 리스트로 변환."""
+        return self.fetch_job(feed_cfg)
+
+    def raw_args(self, feed_cfg: RssFeedConfig) -> Tuple:
+        return (self.max_per_ticker, feed_cfg.ticker)
+
+    def build_articles(
+        self, feed_cfg: RssFeedConfig, rows: List[RawEntry]
+    ) -> List[NewsArticle]:
+        logger.info("  -> %s: taking %d entries", feed_cfg.ticker, len(rows))
+        return [
+            NewsArticle(
+                published_raw=published_raw,
+                published_dt=published_dt,
+                category=feed_cfg.category,
+                ticker=feed_cfg.ticker,
+                source_name=self.source_name,
+                title=title,
+                link=link,
             )
-
-            for entry in entries:
-                # pubDate 또는 published 필드에서 날짜 문자열 추출
-                published_raw = (
-                    entry.get("published", "") or entry.get("pubDate", "")
-                )
-
-                if not published_raw:
-                    logger.warning(
-                        "  -> skip entry without published/pubDate: %s",
-                        entry.get("title"),
-                    )
-                    continue
-
-                # dateparser 로 datetime 파싱 (fuzzy 인자 없이)
-                published_dt = dateparser.parse(published_raw)
-                if published_dt is None:
-                    logger.warning(
-                        "  -> skip entry with unparseable date '%s': %s",
-                        published_raw,
-                        entry.get("title"),
-                    )
-                    continue
-
-                # timestamp without time zone 컬럼에 맞추기 위해 tz 제거
-                if published_dt.tzinfo is not None:
-                    published_dt = published_dt.replace(tzinfo=None)
-
-                articles.append(
-                    NewsArticle(
-                        published_raw=published_raw,
-                        published_dt=published_dt,
-                        category=feed_cfg.category,
-                        ticker=feed_cfg.ticker,
-                        source_name=self.source_name,
-                        title=(entry.get("title") or "").strip(),
-                        link=(entry.get("link") or "").strip(),
-                    )
-                )
-
-        logger.info("YahooRssSource: total %d articles collected", len(articles))
-        return articles
\ No newline at end of file
+            for published_raw, published_dt, title, link in rows
+        ]
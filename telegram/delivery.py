@@ -0,0 +1,300 @@
+# telegram/delivery.py
+"""
+텔레그램 일괄 전송 엔진.
+
+- 티커별 요약을 4096자 한도 안에서 최대한 적은 메시지로 묶는다.
+- chat_id 들에는 동시에 보내고, 하나의 keep-alive 세션을 공유한다.
+- 전체 / 채팅별 token bucket 으로 속도를 제한하고,
+  429 응답의 retry_after 만큼 해당 버킷을 멈춘다.
+"""
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.metrics import metrics
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Bot API sendMessage 의 text 최대 길이 (UTF-16 code unit 기준)
+MAX_MESSAGE_LENGTH = 4096
+MESSAGE_SEPARATOR = "\n\n"
+
+
+def _tg_len(text: str) -> int:
+    """텔레그램이 세는 길이. 이모지 등은 UTF-16 기준 2글자로 센다."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _split_long(text: str, limit: int) -> List[str]:
+    """한도를 넘는 메시지 하나를 줄 단위(안 되면 글자 단위)로 자른다."""
+    chunks: List[str] = []
+    current = ""
+    for line in text.split("\n"):
+        while _tg_len(line) > limit:
+            # 한 줄이 한도보다 긴 경우: 강제로 자른다.
+            cut = limit
+            while _tg_len(line[:cut]) > limit:
+                cut -= 1
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:cut])
+            line = line[cut:]
+        candidate = f"{current}\n{line}" if current else line
+        if _tg_len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def pack_messages(
+    parts: Iterable[str],
+    limit: int = MAX_MESSAGE_LENGTH,
+    separator: str = MESSAGE_SEPARATOR,
+) -> List[str]:
+    """
+    순서를 유지하면서 parts 를 limit 이하 메시지로 최대한 묶는다.
+    하나가 limit 보다 길면 줄 단위로 나눈다.
+    """
+    messages: List[str] = []
+    current = ""
+    for part in parts:
+        if not part:
+            continue
+        pieces = [part] if _tg_len(part) <= limit else _split_long(part, limit)
+        for piece in pieces:
+            candidate = f"{current}{separator}{piece}" if current else piece
+            if _tg_len(candidate) <= limit:
+                current = candidate
+            else:
+                messages.append(current)
+                current = piece
+    if current:
+        messages.append(current)
+    return messages
+
+
+class TokenBucket:
+    """
+    초당 rate 개, 최대 capacity 개까지 모이는 토큰 버킷 (thread-safe).
+    pause() 로 429 의 retry_after 동안 버킷 전체를 멈출 수 있다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = max(rate, 0.001)
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+            # 멈춘 뒤에는 빈 버킷에서 다시 시작
+            self._tokens = 0
+            self._updated = until
+
+
+class TelegramDelivery:
+    """여러 chat_id 로 메시지/문서를 보내는 전송기. 세션과 버킷은 인스턴스 단위로 공유."""
+
+    def __init__(
+        self,
+        chat_ids: Optional[List[str]] = None,
+        token: Optional[str] = None,
+        api_base: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        rate_per_second: Optional[float] = None,
+        chat_rate_per_second: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.chat_ids = chat_ids if chat_ids is not None else []
+        token = token if token is not None else settings.TG_BOT_TOKEN
+        base = (api_base or settings.TG_API_BASE).rstrip("/")
+        self.base_url = f"{base}/bot{token}"
+        self.max_workers = max(1, max_workers or settings.TG_SEND_CONCURRENCY)
+        self.max_retries = max_retries if max_retries is not None else settings.TG_MAX_RETRIES
+        self._global_bucket = TokenBucket(rate_per_second or settings.TG_RATE_PER_SECOND)
+        self._chat_rate = chat_rate_per_second or settings.TG_CHAT_RATE_PER_SECOND
+        self._chat_buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+        self._session: Optional["requests.Session"] = None
+        self.sent = 0
+        self.retries = 0
+
+    def _get_session(self) -> "requests.Session":
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        with self._buckets_lock:
+            bucket = self._chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(self._chat_rate, capacity=1)
+                self._chat_buckets[chat_id] = bucket
+            return bucket
+
+    def call(
+        self,
+        method: str,
+        chat_id: str,
+        data: Dict[str, Any],
+        files: Optional[Dict[str, Tuple]] = None,
+        timeout: float = 10,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Bot API 메서드 하나를 호출. 성공하면 응답 JSON 의 result, 실패하면 None.
+        429 는 retry_after 만큼, 5xx/네트워크 오류는 지수 백오프로 최대 max_retries 번 재시도.
+        files 의 파일 객체는 재시도 전에 처음 위치로 되감는다.
+        """
+        url = f"{self.base_url}/{method}"
+        chat_bucket = self._chat_bucket(chat_id)
+        payload = dict(data, chat_id=chat_id)
+
+        for attempt in range(self.max_retries + 1):
+            self._global_bucket.acquire()
+            chat_bucket.acquire()
+
+            if files:
+                for value in files.values():
+                    if hasattr(value[1], "seek"):
+                        value[1].seek(0)
+
+            retry_after: Optional[float] = None
+            start = time.perf_counter()
+            try:
+                if files:
+                    resp = self._get_session().post(
+                        url, data=payload, files=files, timeout=timeout
+                    )
+                else:
+                    resp = self._get_session().post(url, json=payload, timeout=timeout)
+                metrics.observe(
+                    "telegram_http_seconds", time.perf_counter() - start, method=method
+                )
+                metrics.inc("telegram_requests_total", method=method, status=resp.status_code)
+
+                if resp.status_code == 429:
+                    try:
+                        params = resp.json().get("parameters") or {}
+                        retry_after = float(params.get("retry_after", 1))
+                    except ValueError:
+                        retry_after = 1.0
+                    # 같은 채팅은 retry_after 동안 멈추고, 전체도 잠깐 숨을 고른다.
+                    chat_bucket.pause(retry_after)
+                    self._global_bucket.pause(min(retry_after, 1.0))
+                    logger.warning(
+                        "Telegram %s flood limit for chat_id=%s, retry after %.1fs",
+                        method,
+                        chat_id,
+                        retry_after,
+                    )
+                elif resp.status_code >= 500:
+                    logger.warning(
+                        "Telegram %s server error %d for chat_id=%s",
+                        method,
+                        resp.status_code,
+                        chat_id,
+                    )
+                else:
+                    resp.raise_for_status()
+                    self.sent += 1
+                    metrics.inc("telegram_sent_total", method=method)
+                    return resp.json().get("result") or {}
+            except Exception as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status is not None and 400 <= status < 500:
+                    # 잘못된 요청(400/403 등)은 재시도해도 소용없다.
+                    metrics.inc("telegram_failed_total", method=method)
+                    logger.error(
+                        "Telegram %s rejected for chat_id=%s: %s", method, chat_id, e
+                    )
+                    return None
+                logger.warning("Telegram %s failed for chat_id=%s: %s", method, chat_id, e)
+
+            if attempt < self.max_retries:
+                self.retries += 1
+                metrics.inc("telegram_retries_total", method=method)
+                if retry_after is None:
+                    time.sleep(min(30.0, 2 ** attempt) * (0.5 + random.random() / 2))
+
+        metrics.inc("telegram_failed_total", method=method)
+        logger.error("Telegram %s gave up for chat_id=%s", method, chat_id)
+        return None
+
+    def _send_to_chat(self, chat_id: str, messages: List[str]) -> bool:
+        ok = True
+        # 한 채팅 안에서는 순서를 지키기 위해 순차 전송
+        for text in messages:
+            result = self.call(
+                "sendMessage",
+                chat_id,
+                {"text": text, "parse_mode": "HTML"},
+            )
+            ok = ok and result is not None
+        if ok:
+            logger.info(
+                "Telegram %d message(s) sent successfully to chat_id=%s",
+                len(messages),
+                chat_id,
+            )
+        return ok
+
+    def send_messages(self, texts: Iterable[str]) -> bool:
+        """texts 를 4096자 단위로 묶어서 모든 chat_id 에 동시에 전송."""
+        messages = pack_messages(texts)
+        if not messages or not self.chat_ids:
+            return not messages
+
+        logger.info(
+            "TelegramDelivery: %d message(s) to %d chat(s)",
+            len(messages),
+            len(self.chat_ids),
+        )
+        workers = min(self.max_workers, len(self.chat_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tg-send") as ex:
+            results = list(ex.map(lambda cid: self._send_to_chat(cid, messages), self.chat_ids))
+        return all(results)
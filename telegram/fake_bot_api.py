@@ -0,0 +1,207 @@
+# telegram/fake_bot_api.py
+"""
+로컬 테스트/벤치마크용 가짜 Telegram Bot API 서버.
+
+sendMessage / sendDocument 만 흉내 내며, 받은 요청을 메모리에 기록한다.
+채팅별 초당 한도를 넘기면 실제 서버처럼 429 + retry_after 를 돌려준다.
+parse_mode=HTML 인데 지원하지 않는 태그나 escape 안 된 & 가 있으면 400 을 돌려준다.
+
+    server = FakeBotApi(chat_rate_per_second=1).start()
+    settings.TG_API_BASE = server.base_url
+    ...
+    server.stop()
+"""
+import json
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Bot API 가 parse_mode=HTML 에서 받아들이는 태그와 entity
+_HTML_TAG_RE = re.compile(
+    r"</?(b|strong|i|em|u|ins|s|strike|del|a|code|pre|span|tg-spoiler|blockquote)(\s[^<>]*)?>"
+)
+_HTML_ENTITY_RE = re.compile(r"&(lt|gt|amp|quot|#\d+|#x[0-9a-fA-F]+);")
+
+
+def _html_error(text: str) -> Optional[str]:
+    """parse_mode=HTML 로 해석할 수 없는 text 면 그 이유 (태그 짝은 보지 않는다)."""
+    for m in re.finditer(r"[<&]", text):
+        rest = text[m.start():]
+        if m.group() == "<" and not _HTML_TAG_RE.match(rest):
+            return f"unsupported start tag at byte offset {m.start()}"
+        if m.group() == "&" and not _HTML_ENTITY_RE.match(rest):
+            return f"unescaped & at byte offset {m.start()}"
+    return None
+
+
+@dataclass
+class FakeRequest:
+    method: str
+    chat_id: str
+    fields: Dict[str, str]
+    uploaded_bytes: int = 0
+    at: float = field(default_factory=time.monotonic)
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Tuple[Dict[str, str], Dict[str, bytes]]:
+    """multipart/form-data 본문을 (일반 필드, 파일 필드) 로 나눈다."""
+    msg = BytesParser(policy=default_policy).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    fields: Dict[str, str] = {}
+    files: Dict[str, bytes] = {}
+    for part in msg.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        payload = part.get_payload(decode=True) or b""
+        if part.get_filename():
+            files[name] = payload
+        else:
+            fields[name] = payload.decode("utf-8")
+    return fields, files
+
+
+class FakeBotApi:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        chat_rate_per_second: Optional[float] = None,
+        retry_after: int = 1,
+        latency: float = 0.0,
+    ):
+        self.chat_rate_per_second = chat_rate_per_second
+        self.retry_after = retry_after
+        self.latency = latency
+        self.requests: List[FakeRequest] = []
+        self.flood_responses = 0
+        self.file_ids: Dict[str, int] = {}
+        self._last_by_chat: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeBotApi":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def messages(self, chat_id: Optional[str] = None) -> List[str]:
+        return [
+            r.fields.get("text", "")
+            for r in self.requests
+            if r.method == "sendMessage" and (chat_id is None or r.chat_id == chat_id)
+        ]
+
+    def _check_flood(self, chat_id: str) -> bool:
+        """채팅별 초당 한도를 넘었으면 True."""
+        if not self.chat_rate_per_second:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_by_chat.get(chat_id)
+            # 약간의 타이머 오차는 허용
+            if last is not None and now - last < 0.9 / self.chat_rate_per_second:
+                self.flood_responses += 1
+                return True
+            self._last_by_chat[chat_id] = now
+        return False
+
+    def _handle(self, method: str, content_type: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if self.latency:
+            time.sleep(self.latency)
+
+        uploaded = 0
+        if content_type.startswith("multipart/form-data"):
+            fields, files = _parse_multipart(content_type, body)
+            uploaded = sum(len(v) for v in files.values())
+        elif content_type.startswith("application/json"):
+            fields = {k: str(v) for k, v in json.loads(body or b"{}").items()}
+        else:
+            fields = {}
+
+        chat_id = fields.get("chat_id", "")
+        if method not in ("sendMessage", "sendDocument"):
+            return 404, {"ok": False, "error_code": 404, "description": "Not Found"}
+        if not chat_id:
+            return 400, {"ok": False, "error_code": 400, "description": "chat_id is empty"}
+        if self._check_flood(chat_id):
+            return 429, {
+                "ok": False,
+                "error_code": 429,
+                "description": f"Too Many Requests: retry after {self.retry_after}",
+                "parameters": {"retry_after": self.retry_after},
+            }
+
+        if fields.get("parse_mode") == "HTML":
+            error = _html_error(fields.get("text") or fields.get("caption") or "")
+            if error:
+                return 400, {
+                    "ok": False,
+                    "error_code": 400,
+                    "description": f"Bad Request: can't parse entities: {error}",
+                }
+
+        result: Dict[str, Any] = {"chat": {"id": chat_id}}
+        if method == "sendDocument":
+            file_id = fields.get("document")
+            with self._lock:
+                if uploaded or file_id not in self.file_ids:
+                    if not uploaded:
+                        return 400, {
+                            "ok": False,
+                            "error_code": 400,
+                            "description": "Bad Request: wrong file identifier",
+                        }
+                    file_id = f"fake-{uuid.uuid4().hex}"
+                    self.file_ids[file_id] = uploaded
+            result["document"] = {"file_id": file_id, "file_size": self.file_ids[file_id]}
+        else:
+            result["text"] = fields.get("text", "")
+
+        with self._lock:
+            self.requests.append(FakeRequest(method, chat_id, fields, uploaded))
+            result["message_id"] = len(self.requests)
+        return 200, {"ok": True, "result": result}
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                # 경로: /bot<token>/<method>
+                method = self.path.rstrip("/").rsplit("/", 1)[-1]
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                status, payload = api._handle(
+                    method, self.headers.get("Content-Type", ""), body
+                )
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -1,14 +1,23 @@
 # telegram/sender.py
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union, List
-
-import requests
+from typing import Iterable, List, Optional, Union
 
 from app.config import settings
+from app.state import load_json, save_json
 
 logger = logging.getLogger(__name__)
 
+# 파일 키(호출한 쪽이 준 cache_key 또는 내용 해시) -> 텔레그램 file_id 캐시 (STATE_DIR 아래)
+FILE_ID_CACHE_NAME = "telegram_file_ids.json"
+FILE_ID_CACHE_SIZE = 100
+# 같은 행이면 같은 바이트가 나오는 형식. xlsx 는 만든 시각이 파일 안에 들어가서
+# 내용 해시로는 다시 쓸 수 없으므로 cache_key 를 줄 때만 file_id 를 다시 쓴다.
+BYTE_STABLE_SUFFIXES = {".csv"}
+
 
 def _get_chat_ids() -> List[str]:
     """
@@ -42,7 +51,7 @@ def _check_config() -> bool:
 
 
 def _api_base() -> str:
-    return f"https://api.telegram.org/bot{settings.TG_BOT_TOKEN}"
+    return f"{settings.TG_API_BASE.rstrip('/')}/bot{settings.TG_BOT_TOKEN}"
 
 
 def send_message(text: str) -> bool:
@@ -50,6 +59,8 @@ def send_message(text: str) -> bool:
     if not _check_config():
         return False
 
+    import requests
+
     chat_ids = _get_chat_ids()
     url = f"{_api_base()}/sendMessage"
 
@@ -71,8 +82,56 @@ def send_message(text: str) -> bool:
     return all_ok
 
 
-def send_file(file_path: Union[str, Path], caption: str = "") -> bool:
-    """여러 chat_id 에 동일한 파일(문서)을 전송."""
+def send_messages(texts: Iterable[str]) -> bool:
+    """
+    여러 메시지(티커별 요약 등)를 4096자 한도 안에서 최대한 묶어서
+    모든 chat_id 에 동시에 전송. 속도 제한과 429 재시도는 TelegramDelivery 가 처리.
+    """
+    if not _check_config():
+        return False
+
+    from telegram.delivery import TelegramDelivery
+
+    delivery = TelegramDelivery(chat_ids=_get_chat_ids())
+    try:
+        return delivery.send_messages(texts)
+    finally:
+        delivery.close()
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _remember_file_id(key: str, file_id: str, name: str) -> None:
+    cache = load_json(FILE_ID_CACHE_NAME, {})
+    cache.pop(key, None)
+    cache[key] = {"file_id": file_id, "name": name}
+    # 오래된 항목부터 버려서 파일이 계속 커지지 않도록 한다.
+    while len(cache) > FILE_ID_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    save_json(FILE_ID_CACHE_NAME, cache)
+
+
+def send_file(
+    file_path: Union[str, Path],
+    caption: str = "",
+    cache_key: Optional[str] = None,
+) -> bool:
+    """
+    여러 chat_id 에 동일한 파일(문서)을 전송.
+
+    처음 업로드에 성공하면 응답의 file_id 를 받아서 나머지 chat 에는 file_id 로만 보낸다.
+    file_id 는 cache_key 별로 STATE_DIR 에 저장해두므로 같은 키의 파일을 나중에 다시 보내면
+    업로드 자체를 하지 않는다. cache_key 는 내용이 같을 때만 같아야 한다
+    (예: 파일 이름 + 마지막 id + 행 수). 주지 않으면 BYTE_STABLE_SUFFIXES 형식만
+    내용 해시(sha256)를 키로 쓰고, 나머지는 저장하지 않는다.
+    file_id 전송이 실패하면 그 chat 에는 새로 업로드한다.
+    """
     if not _check_config():
         return False
 
@@ -81,30 +140,75 @@ def send_file(file_path: Union[str, Path], caption: str = "") -> bool:
         logger.error("send_file: file not found: %s", file_path)
         return False
 
+    from telegram.delivery import TelegramDelivery
+
     chat_ids = _get_chat_ids()
-    url = f"{_api_base()}/sendDocument"
+    if cache_key is None and file_path.suffix.lower() in BYTE_STABLE_SUFFIXES:
+        cache_key = _file_sha256(file_path)
+    cached = load_json(FILE_ID_CACHE_NAME, {}).get(cache_key) if cache_key else None
+    # verified: 이번 전송에서 file_id 로 (또는 업로드로) 한 번이라도 성공했는지
+    state = {"file_id": cached["file_id"] if cached else None, "verified": False}
+    state_lock = threading.Lock()
+
+    data = {"caption": caption, "parse_mode": "HTML"}
+    delivery = TelegramDelivery(chat_ids=chat_ids)
+
+    def send_one(cid: str) -> bool:
+        with state_lock:
+            file_id = state["file_id"]
+        if file_id:
+            result = delivery.call("sendDocument", cid, dict(data, document=file_id))
+            if result is not None:
+                with state_lock:
+                    state["verified"] = True
+                logger.info(
+                    "Telegram file sent (reused file_id) to chat_id=%s: %s",
+                    cid,
+                    file_path.name,
+                )
+                return True
+            logger.warning(
+                "send_file: file_id reuse failed for chat_id=%s, uploading again", cid
+            )
 
-    all_ok = True
-    for cid in chat_ids:
-        data = {
-            "chat_id": cid,
-            "caption": caption,
-            "parse_mode": "HTML",
-        }
-        try:
-            with file_path.open("rb") as f:
-                files = {"document": (file_path.name, f)}
-                resp = requests.post(url, data=data, files=files, timeout=30)
-                resp.raise_for_status()
-            logger.info(
-                "Telegram file sent successfully to chat_id=%s: %s",
+        with file_path.open("rb") as f:
+            result = delivery.call(
+                "sendDocument",
                 cid,
-                file_path.name,
+                data,
+                files={"document": (file_path.name, f)},
+                timeout=30,
             )
-        except Exception as e:
-            all_ok = False
-            logger.exception(
-                "Failed to send Telegram file to %s: %s", cid, e
-            )
-
-    return all_ok
\ No newline at end of file
+        if result is None:
+            logger.error("Failed to send Telegram file to %s: %s", cid, file_path.name)
+            return False
+
+        new_id = (result.get("document") or {}).get("file_id")
+        if new_id:
+            with state_lock:
+                state["file_id"] = new_id
+                state["verified"] = True
+                if cache_key:
+                    _remember_file_id(cache_key, new_id, file_path.name)
+        logger.info(
+            "Telegram file sent successfully to chat_id=%s: %s",
+            cid,
+            file_path.name,
+        )
+        return True
+
+    try:
+        results: List[bool] = []
+        remaining = list(chat_ids)
+        # 쓸 수 있는 file_id 를 확인할 때까지는 한 chat 씩 보낸다.
+        while remaining and not state["verified"]:
+            results.append(send_one(remaining.pop(0)))
+        # 나머지는 file_id 로 동시에 전송
+        if remaining:
+            workers = min(delivery.max_workers, len(remaining))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tg-file") as ex:
+                results.extend(ex.map(send_one, remaining))
+    finally:
+        delivery.close()
+
+    return all(results)
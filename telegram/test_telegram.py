@@ -1,12 +1,73 @@
 # scripts/test_telegram.py
+import argparse
+import time
+
 from app.logging_config import setup_logging  # 네가 만든 로깅 함수 이름에 맞게
 from telegram.sender import send_message
 
 
+def run_fake(tickers: int, chats: int) -> None:
+    """
+    로컬 fake Bot API 서버로 일괄 전송 엔진을 확인.
+    채팅별 초당 1건 한도를 걸어두고 429 없이 모두 도착하는지 본다.
+    제목 / 링크에 <, & 가 든 종목을 섞어서 여러 종목이 묶인 메시지도 HTML 로 거부되지 않는지 본다.
+    """
+    from datetime import datetime
+
+    from scripts.run_export_and_send import format_ticker_summary
+    from telegram.delivery import TelegramDelivery
+    from telegram.fake_bot_api import FakeBotApi
+
+    server = FakeBotApi(chat_rate_per_second=1).start()
+    chat_ids = [str(1000 + i) for i in range(chats)]
+    summaries = [
+        format_ticker_summary(
+            f"TICKER{i}",
+            f"TICKER{i}" if i % 7 else f"AT&T <Class {i}>",
+            [
+                {
+                    "published_dt": datetime(2025, 11, 18, 14, 30 + j),
+                    "title": f"Headline {i}-{j}" if i % 5 else f"Q{j} <beats> & misses {i}",
+                    "link": f"https://finance.yahoo.com/news/{i}-{j}?a=1&b=2",
+                }
+                for j in range(3)
+            ],
+        )
+        for i in range(tickers)
+    ]
+
+    delivery = TelegramDelivery(chat_ids=chat_ids, token="TEST", api_base=server.base_url)
+    start = time.perf_counter()
+    ok = delivery.send_messages(summaries)
+    elapsed = time.perf_counter() - start
+    delivery.close()
+    server.stop()
+
+    for cid in chat_ids:
+        joined = "\n\n".join(server.messages(cid))
+        assert joined == "\n\n".join(summaries), f"chat {cid}: 내용 불일치"
+    assert ok, "전송 실패 (HTML 로 거부된 메시지가 있음)"
+    print(
+        f"ok={ok} summaries={tickers} chats={chats} "
+        f"messages/chat={len(server.messages(chat_ids[0]))} "
+        f"429={server.flood_responses} retries={delivery.retries} "
+        f"elapsed={elapsed:.2f}s"
+    )
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fake", action="store_true", help="로컬 fake Bot API 로 전송 엔진 점검")
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--chats", type=int, default=3)
+    args = parser.parse_args()
+
     setup_logging()
+    if args.fake:
+        run_fake(args.tickers, args.chats)
+        return
     send_message("[FinancialNewsCrawler] 텔레그램 전송 테스트 메시지입니다.")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()